@@ -0,0 +1,80 @@
+"""
+Validator Code Generator - AOT compile tool schemas
+Mục đích: Generate Python validators từ tool configs vào src/generated/validators.py
+để runtime không phải compile schemas lúc import
+
+Usage: python -m src.config.generate_validators
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, List, Mapping, Any
+
+import fastjsonschema
+
+from .memory_tool_configs import MEMORY_TOOL_CONFIGS, ADVANCED_TOOL_CONFIGS
+from ..utils.schema_cache import schema_hash, thaw_schema
+
+
+OUTPUT_PATH = Path(__file__).resolve().parent.parent / "generated" / "validators.py"
+
+MODULE_DOCSTRING = '''"""
+Generated Tool Validators - DO NOT EDIT
+Regenerate: python -m src.config.generate_validators
+"""'''
+
+
+def _generate_tool_code(tool_name: str, schema: Mapping[str, Any]) -> tuple[List[str], str]:
+    """
+    Generate code cho một tool
+    Returns (prelude lines, function source với tên validate_<tool_name>)
+    """
+    code = fastjsonschema.compile_to_code(thaw_schema(schema), use_default=False)
+    prelude, body = code.split("\ndef ", 1)
+
+    # Chỉ support schemas không có $ref - một function duy nhất mỗi tool
+    if "\ndef " in body:
+        raise ValueError(f"Schema of tool '{tool_name}' compiles to multiple functions")
+
+    body = body.replace("validate(", f"validate_{tool_name}(", 1)
+    return [line for line in prelude.splitlines() if line.strip()], f"def {body.rstrip()}"
+
+
+def generate_validators_module() -> str:
+    """Build source của generated validators module"""
+    configs: Dict[str, Dict[str, Any]] = {**MEMORY_TOOL_CONFIGS, **ADVANCED_TOOL_CONFIGS}
+
+    prelude: List[str] = []
+    functions: List[str] = []
+    hashes: Dict[str, str] = {}
+
+    for tool_name, config in configs.items():
+        try:
+            tool_prelude, function = _generate_tool_code(tool_name, config["schema"])
+        except ValueError as e:
+            # Tool này sẽ compile lúc runtime như cũ
+            print(f"⚠️ Skipped {tool_name}: {e}")
+            continue
+
+        prelude.extend(line for line in tool_prelude if line not in prelude)
+        functions.append(function)
+        hashes[tool_name] = schema_hash(config["schema"])
+
+    validators_map = "\n".join(f'    "{name}": validate_{name},' for name in hashes)
+    return "\n\n".join([
+        MODULE_DOCSTRING,
+        "\n".join(prelude),
+        f"SCHEMA_HASHES = {json.dumps(hashes, indent=4)}",
+        *functions,
+        f"VALIDATORS = {{\n{validators_map}\n}}",
+    ]) + "\n"
+
+
+def main() -> None:
+    """Write generated validators module"""
+    OUTPUT_PATH.write_text(generate_validators_module(), encoding="utf-8")
+    print(f"✅ Generated validators: {OUTPUT_PATH}")
+
+
+if __name__ == "__main__":
+    main()
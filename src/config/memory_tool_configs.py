@@ -3,7 +3,17 @@ Memory Tool Configurations - Centralized Configuration
 Mục đích: Configuration-driven tool creation với zero duplication
 """
 
-from typing import Dict, Any
+from collections import ChainMap
+from types import MappingProxyType
+from typing import Dict, Any, Callable, Mapping, Optional, Tuple
+
+from ..utils.schema_cache import freeze_schema, get_schema_validator, schema_hash
+
+# AOT-generated validators là optional - fallback compile lúc runtime
+try:
+    from ..generated import validators as _generated_validators
+except ImportError:
+    _generated_validators = None
 
 
 # =================== CORE MEMORY TOOL CONFIGURATIONS ===================
@@ -33,8 +43,7 @@ MEMORY_TOOL_CONFIGS: Dict[str, Dict[str, Any]] = {
                 }
             },
             "required": ["requirement", "project_name"]
-        },
-        "required": ["requirement", "project_name"]
+        }
     },
     
     "store_feature_dependency": {
@@ -66,8 +75,7 @@ MEMORY_TOOL_CONFIGS: Dict[str, Dict[str, Any]] = {
                 }
             },
             "required": ["feature_a", "feature_b", "relationship_type"]
-        },
-        "required": ["feature_a", "feature_b", "relationship_type"]
+        }
     },
     
     "get_tests_to_run": {
@@ -75,6 +83,7 @@ MEMORY_TOOL_CONFIGS: Dict[str, Dict[str, Any]] = {
         "description": "Lấy danh sách tests cần chạy dựa trên modified features",
         "service_method": "get_tests_to_run",
         "operation_name": "lấy test recommendations",
+        "concurrency_safe": True,
         "schema": {
             "type": "object",
             "properties": {
@@ -85,8 +94,7 @@ MEMORY_TOOL_CONFIGS: Dict[str, Dict[str, Any]] = {
                 }
             },
             "required": ["modified_features"]
-        },
-        "required": ["modified_features"]
+        }
     },
     
     "get_related_features": {
@@ -94,6 +102,7 @@ MEMORY_TOOL_CONFIGS: Dict[str, Dict[str, Any]] = {
         "description": "Tìm các features liên quan đến feature đã cho",
         "service_method": "get_related_features",
         "operation_name": "tìm related features",
+        "concurrency_safe": True,
         "schema": {
             "type": "object",
             "properties": {
@@ -110,8 +119,7 @@ MEMORY_TOOL_CONFIGS: Dict[str, Dict[str, Any]] = {
                 }
             },
             "required": ["feature"]
-        },
-        "required": ["feature"]
+        }
     },
     
     "search_memory": {
@@ -119,6 +127,7 @@ MEMORY_TOOL_CONFIGS: Dict[str, Dict[str, Any]] = {
         "description": "Tìm kiếm trong memory system bằng natural language",
         "service_method": "search_memory",
         "operation_name": "tìm kiếm memory",
+        "concurrency_safe": True,
         "schema": {
             "type": "object",
             "properties": {
@@ -135,8 +144,7 @@ MEMORY_TOOL_CONFIGS: Dict[str, Dict[str, Any]] = {
                 }
             },
             "required": ["query"]
-        },
-        "required": ["query"]
+        }
     },
     
     "store_bug_report": {
@@ -161,8 +169,7 @@ MEMORY_TOOL_CONFIGS: Dict[str, Dict[str, Any]] = {
                 }
             },
             "required": ["title", "description", "severity"]
-        },
-        "required": ["title", "description", "severity"]
+        }
     },
     
     "store_code_change": {
@@ -188,8 +195,7 @@ MEMORY_TOOL_CONFIGS: Dict[str, Dict[str, Any]] = {
                 "lines_removed": {"type": "integer", "description": "Số dòng xóa"}
             },
             "required": ["title", "change_type", "file_paths"]
-        },
-        "required": ["title", "change_type", "file_paths"]
+        }
     },
     
     "store_user_feedback": {
@@ -214,8 +220,7 @@ MEMORY_TOOL_CONFIGS: Dict[str, Dict[str, Any]] = {
                 }
             },
             "required": ["feedback_type", "title", "description"]
-        },
-        "required": ["feedback_type", "title", "description"]
+        }
     },
     
     "get_bug_impact_analysis": {
@@ -223,14 +228,14 @@ MEMORY_TOOL_CONFIGS: Dict[str, Dict[str, Any]] = {
         "description": "Phân tích comprehensive impact của bug",
         "service_method": "get_bug_impact_analysis",
         "operation_name": "analyze bug impact",
+        "concurrency_safe": True,
         "schema": {
             "type": "object",
             "properties": {
                 "bug_id": {"type": "string", "description": "Bug ID cần phân tích"}
             },
             "required": ["bug_id"]
-        },
-        "required": ["bug_id"]
+        }
     }
 }
 
@@ -243,6 +248,7 @@ ADVANCED_TOOL_CONFIGS: Dict[str, Dict[str, Any]] = {
         "description": "Phân tích impact của code changes và recommend testing strategy",
         "service_method": "analyze_change_impact",
         "operation_name": "analyze change impact",
+        "concurrency_safe": True,
         "schema": {
             "type": "object",
             "properties": {
@@ -258,8 +264,7 @@ ADVANCED_TOOL_CONFIGS: Dict[str, Dict[str, Any]] = {
                 }
             },
             "required": ["file_paths"]
-        },
-        "required": ["file_paths"]
+        }
     },
     
     "get_regression_risk": {
@@ -267,6 +272,7 @@ ADVANCED_TOOL_CONFIGS: Dict[str, Dict[str, Any]] = {
         "description": "Assess regression risk và recommend mitigation strategies",
         "service_method": "assess_regression_risk",
         "operation_name": "assess regression risk",
+        "concurrency_safe": True,
         "schema": {
             "type": "object",
             "properties": {
@@ -282,8 +288,7 @@ ADVANCED_TOOL_CONFIGS: Dict[str, Dict[str, Any]] = {
                 }
             },
             "required": ["changed_features"]
-        },
-        "required": ["changed_features"]
+        }
     },
     
     "get_documents_to_update": {
@@ -291,6 +296,7 @@ ADVANCED_TOOL_CONFIGS: Dict[str, Dict[str, Any]] = {
         "description": "Lấy danh sách documents cần update dựa trên code/feature changes",
         "service_method": "get_documents_to_update",
         "operation_name": "get documents to update",
+        "concurrency_safe": True,
         "schema": {
             "type": "object",
             "properties": {
@@ -306,8 +312,7 @@ ADVANCED_TOOL_CONFIGS: Dict[str, Dict[str, Any]] = {
                 }
             },
             "required": ["feature_changes", "code_changes"]
-        },
-        "required": ["feature_changes", "code_changes"]
+        }
     },
     
     "get_comprehensive_test_plan": {
@@ -315,6 +320,7 @@ ADVANCED_TOOL_CONFIGS: Dict[str, Dict[str, Any]] = {
         "description": "Tạo comprehensive test plan dựa trên code/feature/doc changes",
         "service_method": "get_comprehensive_test_plan",
         "operation_name": "create comprehensive test plan",
+        "concurrency_safe": True,
         "schema": {
             "type": "object",
             "properties": {
@@ -335,27 +341,160 @@ ADVANCED_TOOL_CONFIGS: Dict[str, Dict[str, Any]] = {
                 }
             },
             "required": ["code_changes", "feature_changes"]
-        },
-        "required": ["code_changes", "feature_changes"]
+        }
     }
 }
 
 
+# =================== FROZEN SCHEMAS ===================
+
+# Schemas là constants - freeze để consumers share reference thay vì copy.
+# Consumer cần mutable copy thì gọi thaw_schema() explicitly.
+for _config in (*MEMORY_TOOL_CONFIGS.values(), *ADVANCED_TOOL_CONFIGS.values()):
+    _config["schema"] = freeze_schema(_config["schema"])
+del _config
+
+
+# =================== MERGED VIEW ===================
+
+# Live view không copy - ADVANCED đứng trước để giữ precedence của {**MEMORY, **ADVANCED}
+_ALL_TOOL_CONFIGS: ChainMap[str, Dict[str, Any]] = ChainMap(ADVANCED_TOOL_CONFIGS, MEMORY_TOOL_CONFIGS)
+_ALL_TOOL_CONFIGS_VIEW: Mapping[str, Dict[str, Any]] = MappingProxyType(_ALL_TOOL_CONFIGS)
+_TOOL_NAMES: Tuple[str, ...] = tuple(_ALL_TOOL_CONFIGS)
+
+
 # =================== HELPER FUNCTIONS ===================
 
-def get_all_tool_configs() -> Dict[str, Dict[str, Any]]:
-    """Get all tool configurations"""
-    return {**MEMORY_TOOL_CONFIGS, **ADVANCED_TOOL_CONFIGS}
+def get_all_tool_configs() -> Mapping[str, Dict[str, Any]]:
+    """Get all tool configurations (read-only view)"""
+    return _ALL_TOOL_CONFIGS_VIEW
 
 
 def get_tool_config(tool_name: str) -> Dict[str, Any]:
     """Get specific tool configuration"""
-    all_configs = get_all_tool_configs()
-    if tool_name not in all_configs:
+    config = _ALL_TOOL_CONFIGS.get(tool_name)
+    if config is None:
         raise ValueError(f"Tool '{tool_name}' not found in configurations")
-    return all_configs[tool_name]
+    return config
+
+
+def get_required(tool_name: str) -> list[str]:
+    """Get required argument names - schema là single source of truth"""
+    return list(get_tool_config(tool_name)["schema"].get("required", ()))
 
 
 def get_tool_names() -> list[str]:
     """Get all available tool names"""
-    return list(get_all_tool_configs().keys())
+    return list(_TOOL_NAMES)
+
+
+def add_tool_config(tool_name: str, config: Dict[str, Any], is_advanced: bool = False) -> None:
+    """
+    Add tool configuration và refresh cached tool names
+    OCP: Extend configs without modification
+    """
+    global _TOOL_NAMES
+    
+    if "schema" in config:
+        config["schema"] = freeze_schema(config["schema"])
+    
+    if is_advanced:
+        ADVANCED_TOOL_CONFIGS[tool_name] = config
+    else:
+        MEMORY_TOOL_CONFIGS[tool_name] = config
+    
+    # ChainMap tự thấy entry mới, chỉ cần refresh tuple tên
+    _TOOL_NAMES = tuple(_ALL_TOOL_CONFIGS)
+    
+    if "schema" in config:
+        _COMPILED_VALIDATORS[tool_name] = _compile_validator(tool_name, config["schema"])
+
+
+# =================== COMPILED VALIDATORS ===================
+
+# Schemas có tối đa ngần này string/integer properties được coi là trivial
+_FAST_PATH_MAX_PROPERTIES = 2
+_FAST_PATH_TYPES = {"string": str, "integer": int}
+_FAST_PATH_KEYWORDS = frozenset({"type", "description", "default", "minimum", "maximum"})
+# Top-level keywords fast path hiểu được - keyword khác (additionalProperties, anyOf, ...) cần full validator
+_FAST_PATH_SCHEMA_KEYWORDS = frozenset({"type", "properties", "required", "description"})
+
+
+def _build_fast_path(schema: Mapping[str, Any]) -> Optional[Callable[[Dict[str, Any]], bool]]:
+    """
+    Build hand-rolled check cho trivial schemas, None nếu schema không trivial
+    Check chỉ trả True khi arguments chắc chắn valid - còn lại để full validator report lỗi
+    """
+    if not _FAST_PATH_SCHEMA_KEYWORDS.issuperset(schema) or schema.get("type", "object") != "object":
+        return None
+    
+    properties = schema.get("properties", {})
+    if len(properties) > _FAST_PATH_MAX_PROPERTIES:
+        return None
+    
+    checks = []
+    for field_name, prop in properties.items():
+        if not _FAST_PATH_KEYWORDS.issuperset(prop) or prop.get("type") not in _FAST_PATH_TYPES:
+            return None
+        checks.append((
+            field_name, _FAST_PATH_TYPES[prop["type"]], prop.get("minimum"), prop.get("maximum")
+        ))
+    required = frozenset(schema.get("required", ()))
+    # Check chỉ duyệt properties - required field không khai báo trong properties để full validator lo
+    if not required.issubset(properties):
+        return None
+    
+    def check(arguments: Dict[str, Any]) -> bool:
+        for field_name, field_type, minimum, maximum in checks:
+            if field_name not in arguments:
+                if field_name in required:
+                    return False
+                continue
+            value = arguments[field_name]
+            # type() thay vì isinstance để loại bool khỏi integer như JSON-Schema
+            if type(value) is not field_type:
+                return False
+            if minimum is not None and value < minimum:
+                return False
+            if maximum is not None and value > maximum:
+                return False
+        return True
+    
+    return check
+
+
+def _load_generated_validator(tool_name: str,
+                              schema: Mapping[str, Any]) -> Optional[Callable[[Dict[str, Any]], Any]]:
+    """Get AOT-generated validator, None nếu chưa generate hoặc schema đã đổi"""
+    if _generated_validators is None:
+        return None
+    if _generated_validators.SCHEMA_HASHES.get(tool_name) != schema_hash(schema):
+        return None
+    return _generated_validators.VALIDATORS[tool_name]
+
+
+def _compile_validator(tool_name: str, schema: Mapping[str, Any]) -> Callable[[Dict[str, Any]], Any]:
+    """Compile validator, thêm fast-path check phía trước nếu schema trivial"""
+    validator = _load_generated_validator(tool_name, schema) or get_schema_validator(schema)
+    fast_path = _build_fast_path(schema)
+    if fast_path is None:
+        return validator
+    
+    def validate(arguments: Dict[str, Any]) -> Any:
+        if type(arguments) is dict and fast_path(arguments):
+            return arguments
+        return validator(arguments)
+    
+    return validate
+
+
+# Compile một lần lúc import - tránh rebuild validator cho mỗi call_tool request
+_COMPILED_VALIDATORS: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    tool_name: _compile_validator(tool_name, config["schema"])
+    for tool_name, config in _ALL_TOOL_CONFIGS.items()
+}
+
+
+def get_validator(tool_name: str) -> Optional[Callable[[Dict[str, Any]], Any]]:
+    """Get pre-compiled argument validator, None nếu tool không có static config"""
+    return _COMPILED_VALIDATORS.get(tool_name)
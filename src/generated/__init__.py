@@ -0,0 +1 @@
+"""Generated code package - regenerate thay vì edit tay"""
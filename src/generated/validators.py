@@ -0,0 +1,443 @@
+"""
+Generated Tool Validators - DO NOT EDIT
+Regenerate: python -m src.config.generate_validators
+"""
+
+VERSION = "2.22.2"
+from decimal import Decimal
+from fastjsonschema import JsonSchemaValueException, JsonSchemaValuesException
+NoneType = type(None)
+
+SCHEMA_HASHES = {
+    "store_project_requirement": "a7919cbf611bb3314f33a1614299f8ef50afe3a252160be39a780fe1090bd919",
+    "store_feature_dependency": "d8b65a3ad32b90546454e0b64ab0d7c871fd61b5272fac065688dc2ca28d2af7",
+    "get_tests_to_run": "126119a23ef7063f31849bd314ef700f0755beebf24dd682dce40580069899e0",
+    "get_related_features": "ba3c9b2bee2d3e0a9b6b8dfe731bf2f31073217188189da971eba31dbe7ac459",
+    "search_memory": "14aeeb4c1032158ec3a64b90a8350d52fcf5744f3b66b51807a93966b8d867c6",
+    "store_bug_report": "6853cf39e6745a4df1bf3ab941555c52fc7bf9887822b804f2daa74276362d60",
+    "store_code_change": "02859c8093bf95a9f274c4cdc375b2099f452d6471db2c061d7ebcd5685223ce",
+    "store_user_feedback": "f60358ad151090f608f2da0d1afcc64a10cac2cc79402c1269ccdfbebfdcbe06",
+    "get_bug_impact_analysis": "c0c294df1796fd8fa1d5e7573b02f429ac3045438b29026ac3aa9891de507451",
+    "get_change_impact_analysis": "29a216459cccfddbf9188e37f353429eda36661ba2ff2f462beb7f4dc93933aa",
+    "get_regression_risk": "f63066c757065e22e62a25b441bc91c2e1dfa305d043ad28ff6a282623010ef8",
+    "get_documents_to_update": "c1321f5ebcdf73288a41cab1efbaf756b5e781458bbdd1e72d64138d83e0cbb2",
+    "get_comprehensive_test_plan": "9ffbd6c4f858901876c1b062182ac9f718985c4d7720c6fb15701cc76197f8e6"
+}
+
+def validate_store_project_requirement(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'properties': {'requirement': {'type': 'string', 'description': 'Chi tiết requirement cần lưu'}, 'project_name': {'type': 'string', 'description': 'Tên project'}, 'priority': {'type': 'string', 'enum': ['low', 'medium', 'high', 'critical'], 'description': 'Mức độ ưu tiên', 'default': 'medium'}}, 'required': ['requirement', 'project_name']}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['requirement', 'project_name']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'properties': {'requirement': {'type': 'string', 'description': 'Chi tiết requirement cần lưu'}, 'project_name': {'type': 'string', 'description': 'Tên project'}, 'priority': {'type': 'string', 'enum': ['low', 'medium', 'high', 'critical'], 'description': 'Mức độ ưu tiên', 'default': 'medium'}}, 'required': ['requirement', 'project_name']}, rule='required')
+        data_keys = set(data.keys())
+        if "requirement" in data_keys:
+            data_keys.remove("requirement")
+            data__requirement = data["requirement"]
+            if not isinstance(data__requirement, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".requirement must be string", value=data__requirement, name="" + (name_prefix or "data") + ".requirement", definition={'type': 'string', 'description': 'Chi tiết requirement cần lưu'}, rule='type')
+        if "project_name" in data_keys:
+            data_keys.remove("project_name")
+            data__projectname = data["project_name"]
+            if not isinstance(data__projectname, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".project_name must be string", value=data__projectname, name="" + (name_prefix or "data") + ".project_name", definition={'type': 'string', 'description': 'Tên project'}, rule='type')
+        if "priority" in data_keys:
+            data_keys.remove("priority")
+            data__priority = data["priority"]
+            if not isinstance(data__priority, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".priority must be string", value=data__priority, name="" + (name_prefix or "data") + ".priority", definition={'type': 'string', 'enum': ['low', 'medium', 'high', 'critical'], 'description': 'Mức độ ưu tiên', 'default': 'medium'}, rule='type')
+            if not (isinstance(data__priority, str) and data__priority == 'low' or isinstance(data__priority, str) and data__priority == 'medium' or isinstance(data__priority, str) and data__priority == 'high' or isinstance(data__priority, str) and data__priority == 'critical'):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".priority must be one of ['low', 'medium', 'high', 'critical']", value=data__priority, name="" + (name_prefix or "data") + ".priority", definition={'type': 'string', 'enum': ['low', 'medium', 'high', 'critical'], 'description': 'Mức độ ưu tiên', 'default': 'medium'}, rule='enum')
+    return data
+
+def validate_store_feature_dependency(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'properties': {'feature_a': {'type': 'string', 'description': 'Feature thứ nhất'}, 'feature_b': {'type': 'string', 'description': 'Feature thứ hai'}, 'relationship_type': {'type': 'string', 'enum': ['depends_on', 'conflicts_with', 'enhances', 'blocks', 'related_to'], 'description': 'Loại relationship'}, 'risk_level': {'type': 'string', 'enum': ['low', 'medium', 'high'], 'description': 'Mức độ rủi ro', 'default': 'medium'}}, 'required': ['feature_a', 'feature_b', 'relationship_type']}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['feature_a', 'feature_b', 'relationship_type']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'properties': {'feature_a': {'type': 'string', 'description': 'Feature thứ nhất'}, 'feature_b': {'type': 'string', 'description': 'Feature thứ hai'}, 'relationship_type': {'type': 'string', 'enum': ['depends_on', 'conflicts_with', 'enhances', 'blocks', 'related_to'], 'description': 'Loại relationship'}, 'risk_level': {'type': 'string', 'enum': ['low', 'medium', 'high'], 'description': 'Mức độ rủi ro', 'default': 'medium'}}, 'required': ['feature_a', 'feature_b', 'relationship_type']}, rule='required')
+        data_keys = set(data.keys())
+        if "feature_a" in data_keys:
+            data_keys.remove("feature_a")
+            data__featurea = data["feature_a"]
+            if not isinstance(data__featurea, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".feature_a must be string", value=data__featurea, name="" + (name_prefix or "data") + ".feature_a", definition={'type': 'string', 'description': 'Feature thứ nhất'}, rule='type')
+        if "feature_b" in data_keys:
+            data_keys.remove("feature_b")
+            data__featureb = data["feature_b"]
+            if not isinstance(data__featureb, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".feature_b must be string", value=data__featureb, name="" + (name_prefix or "data") + ".feature_b", definition={'type': 'string', 'description': 'Feature thứ hai'}, rule='type')
+        if "relationship_type" in data_keys:
+            data_keys.remove("relationship_type")
+            data__relationshiptype = data["relationship_type"]
+            if not isinstance(data__relationshiptype, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".relationship_type must be string", value=data__relationshiptype, name="" + (name_prefix or "data") + ".relationship_type", definition={'type': 'string', 'enum': ['depends_on', 'conflicts_with', 'enhances', 'blocks', 'related_to'], 'description': 'Loại relationship'}, rule='type')
+            if not (isinstance(data__relationshiptype, str) and data__relationshiptype == 'depends_on' or isinstance(data__relationshiptype, str) and data__relationshiptype == 'conflicts_with' or isinstance(data__relationshiptype, str) and data__relationshiptype == 'enhances' or isinstance(data__relationshiptype, str) and data__relationshiptype == 'blocks' or isinstance(data__relationshiptype, str) and data__relationshiptype == 'related_to'):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".relationship_type must be one of ['depends_on', 'conflicts_with', 'enhances', 'blocks', 'related_to']", value=data__relationshiptype, name="" + (name_prefix or "data") + ".relationship_type", definition={'type': 'string', 'enum': ['depends_on', 'conflicts_with', 'enhances', 'blocks', 'related_to'], 'description': 'Loại relationship'}, rule='enum')
+        if "risk_level" in data_keys:
+            data_keys.remove("risk_level")
+            data__risklevel = data["risk_level"]
+            if not isinstance(data__risklevel, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".risk_level must be string", value=data__risklevel, name="" + (name_prefix or "data") + ".risk_level", definition={'type': 'string', 'enum': ['low', 'medium', 'high'], 'description': 'Mức độ rủi ro', 'default': 'medium'}, rule='type')
+            if not (isinstance(data__risklevel, str) and data__risklevel == 'low' or isinstance(data__risklevel, str) and data__risklevel == 'medium' or isinstance(data__risklevel, str) and data__risklevel == 'high'):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".risk_level must be one of ['low', 'medium', 'high']", value=data__risklevel, name="" + (name_prefix or "data") + ".risk_level", definition={'type': 'string', 'enum': ['low', 'medium', 'high'], 'description': 'Mức độ rủi ro', 'default': 'medium'}, rule='enum')
+    return data
+
+def validate_get_tests_to_run(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'properties': {'modified_features': {'type': 'array', 'items': {'type': 'string'}, 'description': 'Danh sách features đã sửa đổi'}}, 'required': ['modified_features']}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['modified_features']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'properties': {'modified_features': {'type': 'array', 'items': {'type': 'string'}, 'description': 'Danh sách features đã sửa đổi'}}, 'required': ['modified_features']}, rule='required')
+        data_keys = set(data.keys())
+        if "modified_features" in data_keys:
+            data_keys.remove("modified_features")
+            data__modifiedfeatures = data["modified_features"]
+            if not isinstance(data__modifiedfeatures, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".modified_features must be array", value=data__modifiedfeatures, name="" + (name_prefix or "data") + ".modified_features", definition={'type': 'array', 'items': {'type': 'string'}, 'description': 'Danh sách features đã sửa đổi'}, rule='type')
+            data__modifiedfeatures_is_list = isinstance(data__modifiedfeatures, (list, tuple))
+            if data__modifiedfeatures_is_list:
+                data__modifiedfeatures_len = len(data__modifiedfeatures)
+                for data__modifiedfeatures_x, data__modifiedfeatures_item in enumerate(data__modifiedfeatures):
+                    if not isinstance(data__modifiedfeatures_item, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".modified_features[{data__modifiedfeatures_x}]".format(**locals()) + " must be string", value=data__modifiedfeatures_item, name="" + (name_prefix or "data") + ".modified_features[{data__modifiedfeatures_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+    return data
+
+def validate_get_related_features(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'properties': {'feature': {'type': 'string', 'description': 'Tên feature cần tìm related'}, 'max_depth': {'type': 'integer', 'description': 'Maximum depth cho graph traversal', 'default': 2, 'minimum': 1, 'maximum': 5}}, 'required': ['feature']}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['feature']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'properties': {'feature': {'type': 'string', 'description': 'Tên feature cần tìm related'}, 'max_depth': {'type': 'integer', 'description': 'Maximum depth cho graph traversal', 'default': 2, 'minimum': 1, 'maximum': 5}}, 'required': ['feature']}, rule='required')
+        data_keys = set(data.keys())
+        if "feature" in data_keys:
+            data_keys.remove("feature")
+            data__feature = data["feature"]
+            if not isinstance(data__feature, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".feature must be string", value=data__feature, name="" + (name_prefix or "data") + ".feature", definition={'type': 'string', 'description': 'Tên feature cần tìm related'}, rule='type')
+        if "max_depth" in data_keys:
+            data_keys.remove("max_depth")
+            data__maxdepth = data["max_depth"]
+            if not isinstance(data__maxdepth, (int)) and not (isinstance(data__maxdepth, float) and data__maxdepth.is_integer()) or isinstance(data__maxdepth, bool):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".max_depth must be integer", value=data__maxdepth, name="" + (name_prefix or "data") + ".max_depth", definition={'type': 'integer', 'description': 'Maximum depth cho graph traversal', 'default': 2, 'minimum': 1, 'maximum': 5}, rule='type')
+            if isinstance(data__maxdepth, (int, float, Decimal)):
+                if data__maxdepth < 1:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".max_depth must be bigger than or equal to 1", value=data__maxdepth, name="" + (name_prefix or "data") + ".max_depth", definition={'type': 'integer', 'description': 'Maximum depth cho graph traversal', 'default': 2, 'minimum': 1, 'maximum': 5}, rule='minimum')
+                if data__maxdepth > 5:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".max_depth must be smaller than or equal to 5", value=data__maxdepth, name="" + (name_prefix or "data") + ".max_depth", definition={'type': 'integer', 'description': 'Maximum depth cho graph traversal', 'default': 2, 'minimum': 1, 'maximum': 5}, rule='maximum')
+    return data
+
+def validate_search_memory(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'properties': {'query': {'type': 'string', 'description': 'Từ khóa tìm kiếm'}, 'limit': {'type': 'integer', 'description': 'Số kết quả tối đa', 'default': 10, 'minimum': 1, 'maximum': 50}}, 'required': ['query']}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['query']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'properties': {'query': {'type': 'string', 'description': 'Từ khóa tìm kiếm'}, 'limit': {'type': 'integer', 'description': 'Số kết quả tối đa', 'default': 10, 'minimum': 1, 'maximum': 50}}, 'required': ['query']}, rule='required')
+        data_keys = set(data.keys())
+        if "query" in data_keys:
+            data_keys.remove("query")
+            data__query = data["query"]
+            if not isinstance(data__query, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".query must be string", value=data__query, name="" + (name_prefix or "data") + ".query", definition={'type': 'string', 'description': 'Từ khóa tìm kiếm'}, rule='type')
+        if "limit" in data_keys:
+            data_keys.remove("limit")
+            data__limit = data["limit"]
+            if not isinstance(data__limit, (int)) and not (isinstance(data__limit, float) and data__limit.is_integer()) or isinstance(data__limit, bool):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".limit must be integer", value=data__limit, name="" + (name_prefix or "data") + ".limit", definition={'type': 'integer', 'description': 'Số kết quả tối đa', 'default': 10, 'minimum': 1, 'maximum': 50}, rule='type')
+            if isinstance(data__limit, (int, float, Decimal)):
+                if data__limit < 1:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".limit must be bigger than or equal to 1", value=data__limit, name="" + (name_prefix or "data") + ".limit", definition={'type': 'integer', 'description': 'Số kết quả tối đa', 'default': 10, 'minimum': 1, 'maximum': 50}, rule='minimum')
+                if data__limit > 50:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".limit must be smaller than or equal to 50", value=data__limit, name="" + (name_prefix or "data") + ".limit", definition={'type': 'integer', 'description': 'Số kết quả tối đa', 'default': 10, 'minimum': 1, 'maximum': 50}, rule='maximum')
+    return data
+
+def validate_store_bug_report(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'properties': {'title': {'type': 'string', 'description': 'Tiêu đề bug'}, 'description': {'type': 'string', 'description': 'Mô tả chi tiết bug'}, 'severity': {'type': 'string', 'enum': ['trivial', 'minor', 'major', 'critical', 'blocker'], 'description': 'Mức độ nghiêm trọng'}, 'affected_features': {'type': 'array', 'items': {'type': 'string'}, 'description': 'Các features bị ảnh hưởng'}}, 'required': ['title', 'description', 'severity']}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['title', 'description', 'severity']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'properties': {'title': {'type': 'string', 'description': 'Tiêu đề bug'}, 'description': {'type': 'string', 'description': 'Mô tả chi tiết bug'}, 'severity': {'type': 'string', 'enum': ['trivial', 'minor', 'major', 'critical', 'blocker'], 'description': 'Mức độ nghiêm trọng'}, 'affected_features': {'type': 'array', 'items': {'type': 'string'}, 'description': 'Các features bị ảnh hưởng'}}, 'required': ['title', 'description', 'severity']}, rule='required')
+        data_keys = set(data.keys())
+        if "title" in data_keys:
+            data_keys.remove("title")
+            data__title = data["title"]
+            if not isinstance(data__title, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".title must be string", value=data__title, name="" + (name_prefix or "data") + ".title", definition={'type': 'string', 'description': 'Tiêu đề bug'}, rule='type')
+        if "description" in data_keys:
+            data_keys.remove("description")
+            data__description = data["description"]
+            if not isinstance(data__description, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".description must be string", value=data__description, name="" + (name_prefix or "data") + ".description", definition={'type': 'string', 'description': 'Mô tả chi tiết bug'}, rule='type')
+        if "severity" in data_keys:
+            data_keys.remove("severity")
+            data__severity = data["severity"]
+            if not isinstance(data__severity, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".severity must be string", value=data__severity, name="" + (name_prefix or "data") + ".severity", definition={'type': 'string', 'enum': ['trivial', 'minor', 'major', 'critical', 'blocker'], 'description': 'Mức độ nghiêm trọng'}, rule='type')
+            if not (isinstance(data__severity, str) and data__severity == 'trivial' or isinstance(data__severity, str) and data__severity == 'minor' or isinstance(data__severity, str) and data__severity == 'major' or isinstance(data__severity, str) and data__severity == 'critical' or isinstance(data__severity, str) and data__severity == 'blocker'):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".severity must be one of ['trivial', 'minor', 'major', 'critical', 'blocker']", value=data__severity, name="" + (name_prefix or "data") + ".severity", definition={'type': 'string', 'enum': ['trivial', 'minor', 'major', 'critical', 'blocker'], 'description': 'Mức độ nghiêm trọng'}, rule='enum')
+        if "affected_features" in data_keys:
+            data_keys.remove("affected_features")
+            data__affectedfeatures = data["affected_features"]
+            if not isinstance(data__affectedfeatures, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".affected_features must be array", value=data__affectedfeatures, name="" + (name_prefix or "data") + ".affected_features", definition={'type': 'array', 'items': {'type': 'string'}, 'description': 'Các features bị ảnh hưởng'}, rule='type')
+            data__affectedfeatures_is_list = isinstance(data__affectedfeatures, (list, tuple))
+            if data__affectedfeatures_is_list:
+                data__affectedfeatures_len = len(data__affectedfeatures)
+                for data__affectedfeatures_x, data__affectedfeatures_item in enumerate(data__affectedfeatures):
+                    if not isinstance(data__affectedfeatures_item, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".affected_features[{data__affectedfeatures_x}]".format(**locals()) + " must be string", value=data__affectedfeatures_item, name="" + (name_prefix or "data") + ".affected_features[{data__affectedfeatures_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+    return data
+
+def validate_store_code_change(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'properties': {'title': {'type': 'string', 'description': 'Tiêu đề thay đổi'}, 'change_type': {'type': 'string', 'enum': ['new_feature', 'enhancement', 'bug_fix', 'refactor', 'performance', 'security'], 'description': 'Loại thay đổi'}, 'file_paths': {'type': 'array', 'items': {'type': 'string'}, 'description': 'Danh sách files đã thay đổi'}, 'lines_added': {'type': 'integer', 'description': 'Số dòng thêm'}, 'lines_removed': {'type': 'integer', 'description': 'Số dòng xóa'}}, 'required': ['title', 'change_type', 'file_paths']}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['title', 'change_type', 'file_paths']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'properties': {'title': {'type': 'string', 'description': 'Tiêu đề thay đổi'}, 'change_type': {'type': 'string', 'enum': ['new_feature', 'enhancement', 'bug_fix', 'refactor', 'performance', 'security'], 'description': 'Loại thay đổi'}, 'file_paths': {'type': 'array', 'items': {'type': 'string'}, 'description': 'Danh sách files đã thay đổi'}, 'lines_added': {'type': 'integer', 'description': 'Số dòng thêm'}, 'lines_removed': {'type': 'integer', 'description': 'Số dòng xóa'}}, 'required': ['title', 'change_type', 'file_paths']}, rule='required')
+        data_keys = set(data.keys())
+        if "title" in data_keys:
+            data_keys.remove("title")
+            data__title = data["title"]
+            if not isinstance(data__title, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".title must be string", value=data__title, name="" + (name_prefix or "data") + ".title", definition={'type': 'string', 'description': 'Tiêu đề thay đổi'}, rule='type')
+        if "change_type" in data_keys:
+            data_keys.remove("change_type")
+            data__changetype = data["change_type"]
+            if not isinstance(data__changetype, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".change_type must be string", value=data__changetype, name="" + (name_prefix or "data") + ".change_type", definition={'type': 'string', 'enum': ['new_feature', 'enhancement', 'bug_fix', 'refactor', 'performance', 'security'], 'description': 'Loại thay đổi'}, rule='type')
+            if not (isinstance(data__changetype, str) and data__changetype == 'new_feature' or isinstance(data__changetype, str) and data__changetype == 'enhancement' or isinstance(data__changetype, str) and data__changetype == 'bug_fix' or isinstance(data__changetype, str) and data__changetype == 'refactor' or isinstance(data__changetype, str) and data__changetype == 'performance' or isinstance(data__changetype, str) and data__changetype == 'security'):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".change_type must be one of ['new_feature', 'enhancement', 'bug_fix', 'refactor', 'performance', 'security']", value=data__changetype, name="" + (name_prefix or "data") + ".change_type", definition={'type': 'string', 'enum': ['new_feature', 'enhancement', 'bug_fix', 'refactor', 'performance', 'security'], 'description': 'Loại thay đổi'}, rule='enum')
+        if "file_paths" in data_keys:
+            data_keys.remove("file_paths")
+            data__filepaths = data["file_paths"]
+            if not isinstance(data__filepaths, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".file_paths must be array", value=data__filepaths, name="" + (name_prefix or "data") + ".file_paths", definition={'type': 'array', 'items': {'type': 'string'}, 'description': 'Danh sách files đã thay đổi'}, rule='type')
+            data__filepaths_is_list = isinstance(data__filepaths, (list, tuple))
+            if data__filepaths_is_list:
+                data__filepaths_len = len(data__filepaths)
+                for data__filepaths_x, data__filepaths_item in enumerate(data__filepaths):
+                    if not isinstance(data__filepaths_item, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".file_paths[{data__filepaths_x}]".format(**locals()) + " must be string", value=data__filepaths_item, name="" + (name_prefix or "data") + ".file_paths[{data__filepaths_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+        if "lines_added" in data_keys:
+            data_keys.remove("lines_added")
+            data__linesadded = data["lines_added"]
+            if not isinstance(data__linesadded, (int)) and not (isinstance(data__linesadded, float) and data__linesadded.is_integer()) or isinstance(data__linesadded, bool):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".lines_added must be integer", value=data__linesadded, name="" + (name_prefix or "data") + ".lines_added", definition={'type': 'integer', 'description': 'Số dòng thêm'}, rule='type')
+        if "lines_removed" in data_keys:
+            data_keys.remove("lines_removed")
+            data__linesremoved = data["lines_removed"]
+            if not isinstance(data__linesremoved, (int)) and not (isinstance(data__linesremoved, float) and data__linesremoved.is_integer()) or isinstance(data__linesremoved, bool):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".lines_removed must be integer", value=data__linesremoved, name="" + (name_prefix or "data") + ".lines_removed", definition={'type': 'integer', 'description': 'Số dòng xóa'}, rule='type')
+    return data
+
+def validate_store_user_feedback(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'properties': {'feedback_type': {'type': 'string', 'enum': ['bug_report', 'feature_request', 'improvement', 'question', 'compliment'], 'description': 'Loại feedback'}, 'title': {'type': 'string', 'description': 'Tiêu đề feedback'}, 'description': {'type': 'string', 'description': 'Nội dung feedback chi tiết'}, 'priority': {'type': 'string', 'enum': ['low', 'medium', 'high', 'critical'], 'description': 'Mức độ ưu tiên'}}, 'required': ['feedback_type', 'title', 'description']}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['feedback_type', 'title', 'description']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'properties': {'feedback_type': {'type': 'string', 'enum': ['bug_report', 'feature_request', 'improvement', 'question', 'compliment'], 'description': 'Loại feedback'}, 'title': {'type': 'string', 'description': 'Tiêu đề feedback'}, 'description': {'type': 'string', 'description': 'Nội dung feedback chi tiết'}, 'priority': {'type': 'string', 'enum': ['low', 'medium', 'high', 'critical'], 'description': 'Mức độ ưu tiên'}}, 'required': ['feedback_type', 'title', 'description']}, rule='required')
+        data_keys = set(data.keys())
+        if "feedback_type" in data_keys:
+            data_keys.remove("feedback_type")
+            data__feedbacktype = data["feedback_type"]
+            if not isinstance(data__feedbacktype, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".feedback_type must be string", value=data__feedbacktype, name="" + (name_prefix or "data") + ".feedback_type", definition={'type': 'string', 'enum': ['bug_report', 'feature_request', 'improvement', 'question', 'compliment'], 'description': 'Loại feedback'}, rule='type')
+            if not (isinstance(data__feedbacktype, str) and data__feedbacktype == 'bug_report' or isinstance(data__feedbacktype, str) and data__feedbacktype == 'feature_request' or isinstance(data__feedbacktype, str) and data__feedbacktype == 'improvement' or isinstance(data__feedbacktype, str) and data__feedbacktype == 'question' or isinstance(data__feedbacktype, str) and data__feedbacktype == 'compliment'):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".feedback_type must be one of ['bug_report', 'feature_request', 'improvement', 'question', 'compliment']", value=data__feedbacktype, name="" + (name_prefix or "data") + ".feedback_type", definition={'type': 'string', 'enum': ['bug_report', 'feature_request', 'improvement', 'question', 'compliment'], 'description': 'Loại feedback'}, rule='enum')
+        if "title" in data_keys:
+            data_keys.remove("title")
+            data__title = data["title"]
+            if not isinstance(data__title, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".title must be string", value=data__title, name="" + (name_prefix or "data") + ".title", definition={'type': 'string', 'description': 'Tiêu đề feedback'}, rule='type')
+        if "description" in data_keys:
+            data_keys.remove("description")
+            data__description = data["description"]
+            if not isinstance(data__description, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".description must be string", value=data__description, name="" + (name_prefix or "data") + ".description", definition={'type': 'string', 'description': 'Nội dung feedback chi tiết'}, rule='type')
+        if "priority" in data_keys:
+            data_keys.remove("priority")
+            data__priority = data["priority"]
+            if not isinstance(data__priority, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".priority must be string", value=data__priority, name="" + (name_prefix or "data") + ".priority", definition={'type': 'string', 'enum': ['low', 'medium', 'high', 'critical'], 'description': 'Mức độ ưu tiên'}, rule='type')
+            if not (isinstance(data__priority, str) and data__priority == 'low' or isinstance(data__priority, str) and data__priority == 'medium' or isinstance(data__priority, str) and data__priority == 'high' or isinstance(data__priority, str) and data__priority == 'critical'):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".priority must be one of ['low', 'medium', 'high', 'critical']", value=data__priority, name="" + (name_prefix or "data") + ".priority", definition={'type': 'string', 'enum': ['low', 'medium', 'high', 'critical'], 'description': 'Mức độ ưu tiên'}, rule='enum')
+    return data
+
+def validate_get_bug_impact_analysis(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'properties': {'bug_id': {'type': 'string', 'description': 'Bug ID cần phân tích'}}, 'required': ['bug_id']}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['bug_id']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'properties': {'bug_id': {'type': 'string', 'description': 'Bug ID cần phân tích'}}, 'required': ['bug_id']}, rule='required')
+        data_keys = set(data.keys())
+        if "bug_id" in data_keys:
+            data_keys.remove("bug_id")
+            data__bugid = data["bug_id"]
+            if not isinstance(data__bugid, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".bug_id must be string", value=data__bugid, name="" + (name_prefix or "data") + ".bug_id", definition={'type': 'string', 'description': 'Bug ID cần phân tích'}, rule='type')
+    return data
+
+def validate_get_change_impact_analysis(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'properties': {'file_paths': {'type': 'array', 'items': {'type': 'string'}, 'description': 'Danh sách file paths đã thay đổi'}, 'change_type': {'type': 'string', 'enum': ['new_feature', 'enhancement', 'bug_fix', 'refactor', 'performance', 'security'], 'description': 'Loại thay đổi'}}, 'required': ['file_paths']}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['file_paths']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'properties': {'file_paths': {'type': 'array', 'items': {'type': 'string'}, 'description': 'Danh sách file paths đã thay đổi'}, 'change_type': {'type': 'string', 'enum': ['new_feature', 'enhancement', 'bug_fix', 'refactor', 'performance', 'security'], 'description': 'Loại thay đổi'}}, 'required': ['file_paths']}, rule='required')
+        data_keys = set(data.keys())
+        if "file_paths" in data_keys:
+            data_keys.remove("file_paths")
+            data__filepaths = data["file_paths"]
+            if not isinstance(data__filepaths, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".file_paths must be array", value=data__filepaths, name="" + (name_prefix or "data") + ".file_paths", definition={'type': 'array', 'items': {'type': 'string'}, 'description': 'Danh sách file paths đã thay đổi'}, rule='type')
+            data__filepaths_is_list = isinstance(data__filepaths, (list, tuple))
+            if data__filepaths_is_list:
+                data__filepaths_len = len(data__filepaths)
+                for data__filepaths_x, data__filepaths_item in enumerate(data__filepaths):
+                    if not isinstance(data__filepaths_item, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".file_paths[{data__filepaths_x}]".format(**locals()) + " must be string", value=data__filepaths_item, name="" + (name_prefix or "data") + ".file_paths[{data__filepaths_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+        if "change_type" in data_keys:
+            data_keys.remove("change_type")
+            data__changetype = data["change_type"]
+            if not isinstance(data__changetype, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".change_type must be string", value=data__changetype, name="" + (name_prefix or "data") + ".change_type", definition={'type': 'string', 'enum': ['new_feature', 'enhancement', 'bug_fix', 'refactor', 'performance', 'security'], 'description': 'Loại thay đổi'}, rule='type')
+            if not (isinstance(data__changetype, str) and data__changetype == 'new_feature' or isinstance(data__changetype, str) and data__changetype == 'enhancement' or isinstance(data__changetype, str) and data__changetype == 'bug_fix' or isinstance(data__changetype, str) and data__changetype == 'refactor' or isinstance(data__changetype, str) and data__changetype == 'performance' or isinstance(data__changetype, str) and data__changetype == 'security'):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".change_type must be one of ['new_feature', 'enhancement', 'bug_fix', 'refactor', 'performance', 'security']", value=data__changetype, name="" + (name_prefix or "data") + ".change_type", definition={'type': 'string', 'enum': ['new_feature', 'enhancement', 'bug_fix', 'refactor', 'performance', 'security'], 'description': 'Loại thay đổi'}, rule='enum')
+    return data
+
+def validate_get_regression_risk(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'properties': {'changed_features': {'type': 'array', 'items': {'type': 'string'}, 'description': 'Danh sách feature IDs đã thay đổi'}, 'change_scope': {'type': 'string', 'enum': ['small', 'medium', 'large'], 'description': 'Phạm vi thay đổi'}}, 'required': ['changed_features']}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['changed_features']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'properties': {'changed_features': {'type': 'array', 'items': {'type': 'string'}, 'description': 'Danh sách feature IDs đã thay đổi'}, 'change_scope': {'type': 'string', 'enum': ['small', 'medium', 'large'], 'description': 'Phạm vi thay đổi'}}, 'required': ['changed_features']}, rule='required')
+        data_keys = set(data.keys())
+        if "changed_features" in data_keys:
+            data_keys.remove("changed_features")
+            data__changedfeatures = data["changed_features"]
+            if not isinstance(data__changedfeatures, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".changed_features must be array", value=data__changedfeatures, name="" + (name_prefix or "data") + ".changed_features", definition={'type': 'array', 'items': {'type': 'string'}, 'description': 'Danh sách feature IDs đã thay đổi'}, rule='type')
+            data__changedfeatures_is_list = isinstance(data__changedfeatures, (list, tuple))
+            if data__changedfeatures_is_list:
+                data__changedfeatures_len = len(data__changedfeatures)
+                for data__changedfeatures_x, data__changedfeatures_item in enumerate(data__changedfeatures):
+                    if not isinstance(data__changedfeatures_item, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".changed_features[{data__changedfeatures_x}]".format(**locals()) + " must be string", value=data__changedfeatures_item, name="" + (name_prefix or "data") + ".changed_features[{data__changedfeatures_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+        if "change_scope" in data_keys:
+            data_keys.remove("change_scope")
+            data__changescope = data["change_scope"]
+            if not isinstance(data__changescope, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".change_scope must be string", value=data__changescope, name="" + (name_prefix or "data") + ".change_scope", definition={'type': 'string', 'enum': ['small', 'medium', 'large'], 'description': 'Phạm vi thay đổi'}, rule='type')
+            if not (isinstance(data__changescope, str) and data__changescope == 'small' or isinstance(data__changescope, str) and data__changescope == 'medium' or isinstance(data__changescope, str) and data__changescope == 'large'):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".change_scope must be one of ['small', 'medium', 'large']", value=data__changescope, name="" + (name_prefix or "data") + ".change_scope", definition={'type': 'string', 'enum': ['small', 'medium', 'large'], 'description': 'Phạm vi thay đổi'}, rule='enum')
+    return data
+
+def validate_get_documents_to_update(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'properties': {'feature_changes': {'type': 'array', 'items': {'type': 'string'}, 'description': 'Danh sách features đã thay đổi'}, 'code_changes': {'type': 'array', 'items': {'type': 'string'}, 'description': 'Danh sách code files đã thay đổi'}}, 'required': ['feature_changes', 'code_changes']}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['feature_changes', 'code_changes']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'properties': {'feature_changes': {'type': 'array', 'items': {'type': 'string'}, 'description': 'Danh sách features đã thay đổi'}, 'code_changes': {'type': 'array', 'items': {'type': 'string'}, 'description': 'Danh sách code files đã thay đổi'}}, 'required': ['feature_changes', 'code_changes']}, rule='required')
+        data_keys = set(data.keys())
+        if "feature_changes" in data_keys:
+            data_keys.remove("feature_changes")
+            data__featurechanges = data["feature_changes"]
+            if not isinstance(data__featurechanges, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".feature_changes must be array", value=data__featurechanges, name="" + (name_prefix or "data") + ".feature_changes", definition={'type': 'array', 'items': {'type': 'string'}, 'description': 'Danh sách features đã thay đổi'}, rule='type')
+            data__featurechanges_is_list = isinstance(data__featurechanges, (list, tuple))
+            if data__featurechanges_is_list:
+                data__featurechanges_len = len(data__featurechanges)
+                for data__featurechanges_x, data__featurechanges_item in enumerate(data__featurechanges):
+                    if not isinstance(data__featurechanges_item, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".feature_changes[{data__featurechanges_x}]".format(**locals()) + " must be string", value=data__featurechanges_item, name="" + (name_prefix or "data") + ".feature_changes[{data__featurechanges_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+        if "code_changes" in data_keys:
+            data_keys.remove("code_changes")
+            data__codechanges = data["code_changes"]
+            if not isinstance(data__codechanges, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".code_changes must be array", value=data__codechanges, name="" + (name_prefix or "data") + ".code_changes", definition={'type': 'array', 'items': {'type': 'string'}, 'description': 'Danh sách code files đã thay đổi'}, rule='type')
+            data__codechanges_is_list = isinstance(data__codechanges, (list, tuple))
+            if data__codechanges_is_list:
+                data__codechanges_len = len(data__codechanges)
+                for data__codechanges_x, data__codechanges_item in enumerate(data__codechanges):
+                    if not isinstance(data__codechanges_item, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".code_changes[{data__codechanges_x}]".format(**locals()) + " must be string", value=data__codechanges_item, name="" + (name_prefix or "data") + ".code_changes[{data__codechanges_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+    return data
+
+def validate_get_comprehensive_test_plan(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'properties': {'code_changes': {'type': 'array', 'items': {'type': 'string'}, 'description': 'Danh sách code files đã thay đổi'}, 'feature_changes': {'type': 'array', 'items': {'type': 'string'}, 'description': 'Danh sách features đã thay đổi'}, 'risk_level': {'type': 'string', 'enum': ['low', 'medium', 'high', 'critical'], 'description': 'Mức độ rủi ro của thay đổi'}}, 'required': ['code_changes', 'feature_changes']}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['code_changes', 'feature_changes']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'properties': {'code_changes': {'type': 'array', 'items': {'type': 'string'}, 'description': 'Danh sách code files đã thay đổi'}, 'feature_changes': {'type': 'array', 'items': {'type': 'string'}, 'description': 'Danh sách features đã thay đổi'}, 'risk_level': {'type': 'string', 'enum': ['low', 'medium', 'high', 'critical'], 'description': 'Mức độ rủi ro của thay đổi'}}, 'required': ['code_changes', 'feature_changes']}, rule='required')
+        data_keys = set(data.keys())
+        if "code_changes" in data_keys:
+            data_keys.remove("code_changes")
+            data__codechanges = data["code_changes"]
+            if not isinstance(data__codechanges, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".code_changes must be array", value=data__codechanges, name="" + (name_prefix or "data") + ".code_changes", definition={'type': 'array', 'items': {'type': 'string'}, 'description': 'Danh sách code files đã thay đổi'}, rule='type')
+            data__codechanges_is_list = isinstance(data__codechanges, (list, tuple))
+            if data__codechanges_is_list:
+                data__codechanges_len = len(data__codechanges)
+                for data__codechanges_x, data__codechanges_item in enumerate(data__codechanges):
+                    if not isinstance(data__codechanges_item, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".code_changes[{data__codechanges_x}]".format(**locals()) + " must be string", value=data__codechanges_item, name="" + (name_prefix or "data") + ".code_changes[{data__codechanges_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+        if "feature_changes" in data_keys:
+            data_keys.remove("feature_changes")
+            data__featurechanges = data["feature_changes"]
+            if not isinstance(data__featurechanges, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".feature_changes must be array", value=data__featurechanges, name="" + (name_prefix or "data") + ".feature_changes", definition={'type': 'array', 'items': {'type': 'string'}, 'description': 'Danh sách features đã thay đổi'}, rule='type')
+            data__featurechanges_is_list = isinstance(data__featurechanges, (list, tuple))
+            if data__featurechanges_is_list:
+                data__featurechanges_len = len(data__featurechanges)
+                for data__featurechanges_x, data__featurechanges_item in enumerate(data__featurechanges):
+                    if not isinstance(data__featurechanges_item, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".feature_changes[{data__featurechanges_x}]".format(**locals()) + " must be string", value=data__featurechanges_item, name="" + (name_prefix or "data") + ".feature_changes[{data__featurechanges_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+        if "risk_level" in data_keys:
+            data_keys.remove("risk_level")
+            data__risklevel = data["risk_level"]
+            if not isinstance(data__risklevel, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".risk_level must be string", value=data__risklevel, name="" + (name_prefix or "data") + ".risk_level", definition={'type': 'string', 'enum': ['low', 'medium', 'high', 'critical'], 'description': 'Mức độ rủi ro của thay đổi'}, rule='type')
+            if not (isinstance(data__risklevel, str) and data__risklevel == 'low' or isinstance(data__risklevel, str) and data__risklevel == 'medium' or isinstance(data__risklevel, str) and data__risklevel == 'high' or isinstance(data__risklevel, str) and data__risklevel == 'critical'):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".risk_level must be one of ['low', 'medium', 'high', 'critical']", value=data__risklevel, name="" + (name_prefix or "data") + ".risk_level", definition={'type': 'string', 'enum': ['low', 'medium', 'high', 'critical'], 'description': 'Mức độ rủi ro của thay đổi'}, rule='enum')
+    return data
+
+VALIDATORS = {
+    "store_project_requirement": validate_store_project_requirement,
+    "store_feature_dependency": validate_store_feature_dependency,
+    "get_tests_to_run": validate_get_tests_to_run,
+    "get_related_features": validate_get_related_features,
+    "search_memory": validate_search_memory,
+    "store_bug_report": validate_store_bug_report,
+    "store_code_change": validate_store_code_change,
+    "store_user_feedback": validate_store_user_feedback,
+    "get_bug_impact_analysis": validate_get_bug_impact_analysis,
+    "get_change_impact_analysis": validate_get_change_impact_analysis,
+    "get_regression_risk": validate_get_regression_risk,
+    "get_documents_to_update": validate_get_documents_to_update,
+    "get_comprehensive_test_plan": validate_get_comprehensive_test_plan,
+}
@@ -3,16 +3,25 @@ MCP Protocol Handlers - Clean Architecture
 Mục đích: Handle MCP protocol requests với clean separation of concerns
 """
 
+from __future__ import annotations
+
 import asyncio
-from typing import Dict, Any, List, Optional
-from mcp.server import Server
-from mcp.types import (
-    Resource, Tool, TextContent, ImageContent, EmbeddedResource,
-    CallToolRequest, CallToolResult, ListToolsRequest, ListToolsResult
-)
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Tuple
+from fastjsonschema import JsonSchemaException
 from ..tools.tool_factory import MCPToolFactory
 from ..tools.base_mcp_tool import MCPToolRegistry, MCPToolExecutor
+from ..config.memory_tool_configs import get_validator
 from ..utils.logger import get_logger
+from ..utils.schema_cache import get_schema_validator
+
+# mcp.server / mcp.types là pydantic models nặng - chỉ import khi thật sự dùng
+if TYPE_CHECKING:
+    from mcp.server import Server
+    from mcp.types import Tool, TextContent
+
+
+SERVER_NAME = "cursor-graphiti-memory"
+SERVER_VERSION = "1.0.0"
 
 
 class GraphitiMCPServer:
@@ -22,14 +31,22 @@ class GraphitiMCPServer:
     DIP: Depends on tool abstractions
     """
     
+    __slots__ = ("tool_registry", "tool_executor", "logger", "server", "_cached_tools")
+    
     def __init__(self, tool_registry: MCPToolRegistry, tool_executor: MCPToolExecutor):
         """Initialize MCP server với tool registry và executor"""
         self.tool_registry = tool_registry
         self.tool_executor = tool_executor
         self.logger = get_logger(__name__)
         
+        # Tools là static sau bootstrap - build một lần, invalidate khi registry đổi
+        self._cached_tools: Optional[List[Tool]] = None
+        self.tool_registry.add_change_listener(self.invalidate_tool_cache)
+        
         # Create MCP server instance
-        self.server = Server("cursor-graphiti-memory")
+        from mcp.server import Server
+        
+        self.server = Server(SERVER_NAME)
         
         # Register MCP handlers
         self._register_handlers()
@@ -46,7 +63,7 @@ class GraphitiMCPServer:
         
         # Register tool execution handler
         @self.server.call_tool()
-        async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
+        async def call_tool(name: str, arguments: Dict[str, Any]) -> Tuple[TextContent]:
             return await self._handle_call_tool(name, arguments)
         
         self.logger.info("Registered MCP protocol handlers")
@@ -56,48 +73,81 @@ class GraphitiMCPServer:
         Handle list tools request
         SRP: Chỉ lo việc list tools
         """
+        if self._cached_tools is not None:
+            return self._cached_tools
+        
+        from mcp.types import Tool
+        
         try:
             tools = []
             tool_schemas = self.tool_registry.get_tool_schemas()
             
             for tool_name, schema in tool_schemas.items():
-                tool = Tool(
+                # model_construct: schema từ static configs đã validate sẵn -
+                # share inputSchema reference thay vì để pydantic rebuild dict
+                tool = Tool.model_construct(
                     name=schema["name"],
                     description=schema["description"],
                     inputSchema=schema["inputSchema"]
                 )
                 tools.append(tool)
             
-            self.logger.info(f"Listed {len(tools)} tools")
+            self._cached_tools = tools
+            self.logger.info("Listed %d tools", len(tools))
             return tools
             
         except Exception as e:
-            self.logger.error(f"Error listing tools: {e}", exc_info=True)
+            self.logger.error("Error listing tools: %s", e, exc_info=True)
             return []
     
-    async def _handle_call_tool(self, name: str, arguments: Dict[str, Any]) -> List[TextContent]:
+    async def _handle_call_tool(self, name: str, arguments: Dict[str, Any]) -> Tuple[TextContent]:
         """
         Handle tool execution request
         SRP: Chỉ lo việc execute tools
         """
+        from mcp.types import TextContent
+        
         try:
+            # Validate arguments với pre-compiled schema validator
+            validator = self._get_argument_validator(name)
+            if validator is not None:
+                validator(arguments)
+            
             # Execute tool through executor
-            result = await self.tool_executor.execute_tool(name, arguments)
+            text = await self.tool_executor.execute_tool(name, arguments)
             
-            # Return as TextContent
-            return [TextContent(
-                type="text",
-                text=result
-            )]
+        except JsonSchemaException as e:
+            # Client gửi sai arguments là expected - không cần traceback
+            text = f"❌ Invalid arguments for tool '{name}': {e.message}"
+            self.logger.warning(text)
             
         except Exception as e:
-            error_msg = f"❌ Error executing tool '{name}': {str(e)}"
-            self.logger.error(error_msg, exc_info=True)
-            
-            return [TextContent(
-                type="text",
-                text=error_msg
-            )]
+            # Unexpected error - giữ traceback để debug
+            text = f"❌ Error executing tool '{name}': {str(e)}"
+            self.logger.error(text, exc_info=True)
+        
+        # 1-tuple thay vì list: MCP chỉ iterate content
+        # (tuple 2 phần tử mới được hiểu là unstructured + structured output)
+        return (TextContent(type="text", text=text),)
+    
+    def _get_argument_validator(self, name: str):
+        """
+        Resolve argument validator cho tool
+        Static configs dùng validator compile sẵn, tools khác compile qua schema cache
+        """
+        validator = get_validator(name)
+        if validator is None:
+            try:
+                tool = self.tool_registry.get_tool(name)
+            except KeyError:
+                # Executor sẽ report tool không tồn tại
+                return None
+            validator = get_schema_validator(tool.input_schema)
+        return validator
+    
+    def invalidate_tool_cache(self) -> None:
+        """Drop cached list_tools response (gọi khi registry thay đổi)"""
+        self._cached_tools = None
     
     def get_server(self) -> Server:
         """Get MCP server instance"""
@@ -107,6 +157,8 @@ class GraphitiMCPServer:
         """
         Run MCP server với stdio transport
         """
+        # Note: stdio transport (de)serialize qua pydantic-core (Rust JSON) -
+        # swap stdlib json sang orjson/msgspec không ảnh hưởng hot path này
         from mcp.server.stdio import stdio_server
         
         self.logger.info("Starting MCP server with stdio transport")
@@ -126,12 +178,17 @@ class MCPServerBootstrap:
     DIP: Orchestrates dependencies without tight coupling
     """
     
+    __slots__ = (
+        "logger", "tool_registry", "tool_executor", "mcp_server", "_server_info_cache"
+    )
+    
     def __init__(self):
         """Initialize bootstrap"""
         self.logger = get_logger(__name__)
         self.tool_registry: Optional[MCPToolRegistry] = None
         self.tool_executor: Optional[MCPToolExecutor] = None
         self.mcp_server: Optional[GraphitiMCPServer] = None
+        self._server_info_cache: Optional[Dict[str, Any]] = None
     
     async def initialize(self) -> None:
         """
@@ -161,6 +218,7 @@ class MCPServerBootstrap:
             tool_factory = MCPToolFactory(memory_service, nlp_service)
             self.tool_registry = tool_factory.create_and_register_all_tools()
             self.tool_executor = tool_factory.get_executor()
+            self.tool_registry.add_change_listener(self._invalidate_server_info)
             
             # Create MCP server
             self.mcp_server = GraphitiMCPServer(self.tool_registry, self.tool_executor)
@@ -168,7 +226,7 @@ class MCPServerBootstrap:
             self.logger.info("✅ MCP Server initialized successfully")
             
         except Exception as e:
-            self.logger.error(f"Failed to initialize MCP server: {e}", exc_info=True)
+            self.logger.error("Failed to initialize MCP server: %s", e, exc_info=True)
             raise
     
     def _create_gemini_client(self):
@@ -186,7 +244,7 @@ class MCPServerBootstrap:
                 model=config.gemini.model
             )
         except Exception as e:
-            self.logger.warning(f"Failed to create Gemini client: {e}")
+            self.logger.warning("Failed to create Gemini client: %s", e)
             # Return mock client for development
             return self._create_mock_gemini_client()
     
@@ -195,15 +253,20 @@ class MCPServerBootstrap:
         Create mock Gemini client for development/testing
         """
         class MockGeminiClient:
-            async def analyze_requirement(self, requirement: str, project_name: str):
+            async def analyze_requirement(self, requirement: str, project_name: str,
+                                          raise_on_error: bool = False):
                 return {"category": "functional", "complexity": "medium"}
             
-            async def analyze_feature_dependency(self, feature_a: str, feature_b: str, relationship_type: str):
+            async def analyze_feature_dependency(self, feature_a: str, feature_b: str, relationship_type: str,
+                                                 raise_on_error: bool = False):
                 return {"impact_areas": ["testing"], "risk_score": 5, "mitigation_strategies": ["thorough_testing"]}
             
             async def analyze_code_change_impact(self, file_paths: list, change_type: str):
                 return {"affected_features": [], "required_tests": [], "risk_level": "medium"}
             
+            async def analyze_code_changes_batch(self, changes: list):
+                return [await self.analyze_code_change_impact(*change) for change in changes]
+            
             async def process_natural_language(self, message: str):
                 return f"Mock response for: {message}"
         
@@ -235,17 +298,21 @@ class MCPServerBootstrap:
             raise RuntimeError("MCP server not initialized. Call initialize() first.")
         
         try:
-            print("🚀 Cursor Graphiti MCP Server starting...")
-            print(f"🔧 Registered {len(self.tool_registry.get_all_tools())} tools")
-            print("🔗 Ready for Cursor IDE connection")
-            print("\n📝 Available tools:")
-            
-            # List available tools
-            for i, tool_name in enumerate(self.tool_registry.list_tool_names(), 1):
-                tool = self.tool_registry.get_tool(tool_name)
-                print(f"  {i:2d}. {tool_name}: {tool.description[:60]}...")
+            tools = self.tool_registry.get_all_tools()
             
-            print("\n✅ Server ready! Connect from Cursor IDE using MCP protocol.\n")
+            # Build banner trong một pass, in một lần trước khi stdio transport start
+            banner = [
+                "🚀 Cursor Graphiti MCP Server starting...",
+                f"🔧 Registered {len(tools)} tools",
+                "🔗 Ready for Cursor IDE connection",
+                "\n📝 Available tools:",
+            ]
+            banner.extend(
+                f"  {i:2d}. {tool_name}: {tool.description:.60}..."
+                for i, (tool_name, tool) in enumerate(tools.items(), 1)
+            )
+            banner.append("\n✅ Server ready! Connect from Cursor IDE using MCP protocol.\n")
+            print("\n".join(banner), flush=True)
             
             # Run MCP server with stdio transport
             await self.mcp_server.run_stdio()
@@ -254,7 +321,7 @@ class MCPServerBootstrap:
             self.logger.info("Server stopped by user")
             print("\n🛴 Server stopped gracefully.")
         except Exception as e:
-            self.logger.error(f"Server error: {e}", exc_info=True)
+            self.logger.error("Server error: %s", e, exc_info=True)
             print(f"\n❌ Server error: {e}")
             raise
     
@@ -277,11 +344,19 @@ class MCPServerBootstrap:
         if not self.tool_registry:
             return {"status": "not_initialized"}
         
-        tools = self.tool_registry.get_all_tools()
-        return {
-            "status": "initialized",
-            "total_tools": len(tools),
-            "tool_names": list(tools.keys()),
-            "server_name": "cursor-graphiti-memory",
-            "version": "1.0.0"
-        }
+        if self._server_info_cache is None:
+            tool_names = tuple(self.tool_registry.list_tool_names())
+            self._server_info_cache = {
+                "status": "initialized",
+                "total_tools": len(tool_names),
+                "tool_names": tool_names,
+                "server_name": SERVER_NAME,
+                "version": SERVER_VERSION
+            }
+        
+        # Shallow copy để caller không sửa được cache
+        return dict(self._server_info_cache)
+    
+    def _invalidate_server_info(self) -> None:
+        """Drop cached server info (gọi khi registry thay đổi)"""
+        self._server_info_cache = None
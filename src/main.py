@@ -16,6 +16,12 @@ from handlers.mcp_handler import MCPServerBootstrap
 from utils.logger import setup_logger
 from utils.config import get_config
 
+# uvloop là optional - không có trên Windows, fallback về default asyncio loop
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 
 async def main():
     """
@@ -53,9 +59,14 @@ async def main():
 def run_server():
     """
     Synchronous entry point for external calls
+    Dùng uvloop (libuv) cho stdio transport khi available
     """
     try:
-        asyncio.run(main())
+        if uvloop is not None:
+            with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+                runner.run(main())
+        else:
+            asyncio.run(main())
     except KeyboardInterrupt:
         pass
     except Exception as e:
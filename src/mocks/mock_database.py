@@ -3,31 +3,69 @@ Mock Database cho Development Mode
 In-memory storage để test mà không cần PostgreSQL thật
 """
 import json
+import time
 import uuid
-from typing import Dict, Any, List, Optional
+from collections import defaultdict
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from datetime import datetime
 
+import orjson
+
+
+TABLE_NAMES = (
+    "requirements",
+    "features",
+    "bugs",
+    "code_changes",
+    "tests",
+    "test_results",
+    "user_feedback",
+    "documents",
+    "code_files",
+    "test_coverage",
+    "relationships"
+)
+
+_TIMESTAMP_FIELDS = ("created_at", "updated_at")
+
+# Sentinel cho field không tồn tại trong record
+_MISSING = object()
+
+
+def _ns_to_iso(timestamp_ns: int) -> str:
+    """Format time.time_ns() timestamp thành ISO string (local time, microsecond precision)"""
+    seconds, nanos = divmod(timestamp_ns, 1_000_000_000)
+    return datetime.fromtimestamp(seconds).replace(microsecond=nanos // 1000).isoformat()
+
 
 class MockDatabase:
-    """Mock implementation của database cho development"""
-    
-    def __init__(self):
-        """Khởi tạo in-memory storage"""
-        self.tables = {
-            "requirements": {},
-            "features": {},
-            "bugs": {},
-            "code_changes": {},
-            "tests": {},
-            "test_results": {},
-            "user_feedback": {},
-            "documents": {},
-            "code_files": {},
-            "test_coverage": {},
-            "relationships": {}
-        }
+    """
+    Mock implementation của database cho development
+    select()/search() trả về live record dicts - sửa record phải qua update():
+    sửa in place thì field indexes và lowercase search shadow không thấy thay đổi
+    """
+    
+    def __init__(self, defensive_copy: bool = True):
+        """
+        Khởi tạo in-memory storage
+        defensive_copy=False: insert giữ luôn dict của caller (caller nhường ownership),
+        dùng cho bulk ingest/benchmarks không reuse dict
+        """
+        self._defensive_copy = defensive_copy
+        self.tables = {table: {} for table in TABLE_NAMES}
         self.connection_count = 0
         self.query_count = 0
+        
+        # Secondary indexes: entity_id -> relationship ids
+        self._rel_by_source: Dict[str, List[str]] = defaultdict(list)
+        self._rel_by_target: Dict[str, List[str]] = defaultdict(list)
+        
+        # Lazy field indexes cho select(where=...): table -> field -> value -> ids
+        # (dict làm ordered set để giữ thứ tự kết quả ổn định)
+        self._field_index: Dict[str, Dict[str, Dict[Any, Dict[str, None]]]] = {}
+        
+        # Lowercase shadow của string fields cho search: table -> id -> field -> lowered
+        self._lower_cache: Dict[str, Dict[str, Dict[str, str]]] = {table: {} for table in self.tables}
     
     def connect(self) -> bool:
         """Mô phỏng database connection"""
@@ -49,12 +87,28 @@ class MockDatabase:
         if "id" not in data:
             data["id"] = f"{table}_{uuid.uuid4().hex[:8]}"
         
-        # Add timestamps
-        data["created_at"] = datetime.now().isoformat()
-        data["updated_at"] = datetime.now().isoformat()
+        # Add timestamps (int ns - chỉ format ISO lúc export/display)
+        now = time.time_ns()
+        data["created_at"] = now
+        data["updated_at"] = now
+        
+        if table == "relationships":
+            self._normalize_entity_types(data)
+        
+        # Insert đè id đã có: gỡ record cũ khỏi field/relationship indexes trước khi thay
+        previous = self.tables[table].get(data["id"])
+        if previous is not None:
+            self._unindex_fields(table, data["id"], previous)
+            if table == "relationships":
+                self._unindex_relationship(data["id"], previous)
         
         # Store data
-        self.tables[table][data["id"]] = data.copy()
+        self.tables[table][data["id"]] = data.copy() if self._defensive_copy else data
+        
+        if table == "relationships":
+            self._index_relationship(data["id"], data)
+        self._index_fields(table, data["id"], data)
+        self._lower_cache[table][data["id"]] = self._lowercase_fields(data)
         
         return data["id"]
     
@@ -69,8 +123,19 @@ class MockDatabase:
             return False
         
         # Update data
-        data["updated_at"] = datetime.now().isoformat()
-        self.tables[table][id].update(data)
+        data["updated_at"] = time.time_ns()
+        
+        record = self.tables[table][id]
+        self._unindex_fields(table, id, record)
+        if table == "relationships":
+            self._normalize_entity_types(data)
+            self._unindex_relationship(id, record)
+            record.update(data)
+            self._index_relationship(id, record)
+        else:
+            record.update(data)
+        self._index_fields(table, id, record)
+        self._lower_cache[table][id] = self._lowercase_fields(record)
         
         return True
     
@@ -79,32 +144,38 @@ class MockDatabase:
         """Select data từ table"""
         self.query_count += 1
         
-        if table not in self.tables:
+        records = self.tables.get(table)
+        if records is None:
             raise ValueError(f"Table {table} does not exist")
         
         # Get specific record by ID
         if id:
-            if id in self.tables[table]:
-                return [self.tables[table][id]]
-            return []
+            record = records.get(id)
+            return [record] if record is not None else []
+        
+        # Indexed lookup khi tất cả where values hashable
+        if where and self._is_hashable_where(where):
+            candidate_ids = None
+            for key, value in where.items():
+                ids = self._ensure_index(table, key).get(value, {})
+                if candidate_ids is None:
+                    candidate_ids = dict(ids)
+                else:
+                    candidate_ids = {rid: None for rid in candidate_ids if rid in ids}
+                if not candidate_ids:
+                    return []
+            return [records[rid] for rid in candidate_ids]
         
         # Get all records
-        results = list(self.tables[table].values())
-        
-        # Apply where conditions
-        if where:
-            filtered_results = []
-            for record in results:
-                match = True
-                for key, value in where.items():
-                    if key not in record or record[key] != value:
-                        match = False
-                        break
-                if match:
-                    filtered_results.append(record)
-            results = filtered_results
+        if not where:
+            return list(records.values())
         
-        return results
+        # Apply where conditions (linear scan cho unhashable values)
+        conditions = tuple(where.items())
+        return [
+            record for record in records.values()
+            if all(record.get(key, _MISSING) == value for key, value in conditions)
+        ]
     
     def delete(self, table: str, id: str) -> bool:
         """Delete record từ table"""
@@ -114,27 +185,38 @@ class MockDatabase:
             raise ValueError(f"Table {table} does not exist")
         
         if id in self.tables[table]:
-            del self.tables[table][id]
+            record = self.tables[table].pop(id)
+            self._unindex_fields(table, id, record)
+            self._lower_cache[table].pop(id, None)
+            if table == "relationships":
+                self._unindex_relationship(id, record)
             return True
         
         return False
     
     def search(self, table: str, query: str, fields: List[str]) -> List[Dict[str, Any]]:
-        """Search records theo text query"""
+        """
+        Search records theo text query
+        Match trên lowercase shadow build lúc insert/update - record sửa in place (không qua update())
+        vẫn được search theo giá trị cũ
+        """
         self.query_count += 1
         
-        if table not in self.tables:
+        records = self.tables.get(table)
+        if records is None:
             return []
         
         results = []
+        append = results.append
         query_lower = query.lower()
         
-        for record in self.tables[table].values():
+        # So sánh trên lowercase shadow - không .lower() lại mỗi query
+        for record_id, lowered in self._lower_cache[table].items():
             for field in fields:
-                if field in record and isinstance(record[field], str):
-                    if query_lower in record[field].lower():
-                        results.append(record)
-                        break
+                value = lowered.get(field)
+                if value is not None and query_lower in value:
+                    append(records[record_id])
+                    break
         
         return results
     
@@ -143,33 +225,130 @@ class MockDatabase:
         self.query_count += 1
         
         related = []
+        append = related.append
+        tables = self.tables
+        relationships = tables["relationships"]
+        
+        # Chỉ đi qua relationships của entity này (qua indexes), không scan cả table
+        for rel_id in self._rel_by_source.get(entity_id, ()):
+            rel = relationships[rel_id]
+            # Find target entity
+            target_table = tables.get(rel.get("target_entity_type", ""))
+            if target_table is not None:
+                entity = target_table.get(rel.get("target_entity_id"))
+                if entity is not None:
+                    append({"relationship": rel, "entity": entity})
         
-        # Find relationships involving this entity
-        for rel in self.tables["relationships"].values():
+        for rel_id in self._rel_by_target.get(entity_id, ()):
+            rel = relationships[rel_id]
             if rel.get("source_entity_id") == entity_id:
-                # Find target entity
-                target_type = rel.get("target_entity_type", "").lower()
-                target_id = rel.get("target_entity_id")
-                
-                if target_type in self.tables and target_id in self.tables[target_type]:
-                    related.append({
-                        "relationship": rel,
-                        "entity": self.tables[target_type][target_id]
-                    })
+                # Self-relationship đã xử lý ở trên
+                continue
             
-            elif rel.get("target_entity_id") == entity_id:
-                # Find source entity
-                source_type = rel.get("source_entity_type", "").lower()
-                source_id = rel.get("source_entity_id")
-                
-                if source_type in self.tables and source_id in self.tables[source_type]:
-                    related.append({
-                        "relationship": rel,
-                        "entity": self.tables[source_type][source_id]
-                    })
+            # Find source entity
+            source_table = tables.get(rel.get("source_entity_type", ""))
+            if source_table is not None:
+                entity = source_table.get(rel.get("source_entity_id"))
+                if entity is not None:
+                    append({"relationship": rel, "entity": entity})
         
         return related
     
+    @staticmethod
+    def _normalize_entity_types(rel: Dict[str, Any]) -> None:
+        """Lowercase entity types một lần lúc ghi - lookup không cần .lower() nữa"""
+        for key in ("source_entity_type", "target_entity_type"):
+            value = rel.get(key)
+            if isinstance(value, str):
+                rel[key] = value.lower()
+    
+    def _index_relationship(self, rel_id: str, rel: Dict[str, Any]) -> None:
+        """Add relationship vào source/target indexes"""
+        source_id = rel.get("source_entity_id")
+        target_id = rel.get("target_entity_id")
+        if source_id is not None:
+            self._rel_by_source[source_id].append(rel_id)
+        if target_id is not None:
+            self._rel_by_target[target_id].append(rel_id)
+    
+    def _unindex_relationship(self, rel_id: str, rel: Dict[str, Any]) -> None:
+        """Remove relationship khỏi source/target indexes"""
+        for index, key in ((self._rel_by_source, "source_entity_id"),
+                           (self._rel_by_target, "target_entity_id")):
+            rel_ids = index.get(rel.get(key))
+            if rel_ids is not None and rel_id in rel_ids:
+                rel_ids.remove(rel_id)
+    
+    @staticmethod
+    def _is_hashable_where(where: Dict[str, Any]) -> bool:
+        """Check where values có dùng được làm index key không"""
+        try:
+            for value in where.values():
+                hash(value)
+        except TypeError:
+            return False
+        return True
+    
+    def _ensure_index(self, table: str, field: str) -> Dict[Any, Dict[str, None]]:
+        """Get field index, build lazily bằng một lần scan table"""
+        table_indexes = self._field_index.setdefault(table, {})
+        index = table_indexes.get(field)
+        if index is None:
+            index = {}
+            for record_id, record in self.tables[table].items():
+                if field in record:
+                    self._add_to_index(index, record[field], record_id)
+            table_indexes[field] = index
+        return index
+    
+    @staticmethod
+    def _add_to_index(index: Dict[Any, Dict[str, None]], value: Any, record_id: str) -> None:
+        """Add record id vào index bucket (bỏ qua unhashable values)"""
+        try:
+            index.setdefault(value, {})[record_id] = None
+        except TypeError:
+            pass
+    
+    def _index_fields(self, table: str, record_id: str, record: Dict[str, Any]) -> None:
+        """Patch các field indexes đã build cho record mới/đã update"""
+        for field, index in self._field_index.get(table, {}).items():
+            if field in record:
+                self._add_to_index(index, record[field], record_id)
+    
+    def _unindex_fields(self, table: str, record_id: str, record: Dict[str, Any]) -> None:
+        """Remove record khỏi các field indexes đã build"""
+        for field, index in self._field_index.get(table, {}).items():
+            if field not in record:
+                continue
+            try:
+                bucket = index.get(record[field])
+            except TypeError:
+                continue
+            if bucket is not None:
+                bucket.pop(record_id, None)
+                if not bucket:
+                    del index[record[field]]
+    
+    @staticmethod
+    def _lowercase_fields(record: Dict[str, Any]) -> Dict[str, str]:
+        """Lowercase copy của các string fields trong record"""
+        return {field: value.lower() for field, value in record.items() if isinstance(value, str)}
+    
+    def _rebuild_lower_cache(self) -> None:
+        """Rebuild lowercase shadow từ tables (sau import/clear)"""
+        self._lower_cache = {
+            table: {record_id: self._lowercase_fields(record) for record_id, record in records.items()}
+            for table, records in self.tables.items()
+        }
+    
+    def _rebuild_relationship_indexes(self) -> None:
+        """Rebuild indexes từ relationships table (sau import/clear)"""
+        self._rel_by_source.clear()
+        self._rel_by_target.clear()
+        for rel_id, rel in self.tables.get("relationships", {}).items():
+            self._normalize_entity_types(rel)
+            self._index_relationship(rel_id, rel)
+    
     def get_stats(self) -> Dict[str, Any]:
         """Trả về database statistics"""
         stats = {
@@ -187,6 +366,9 @@ class MockDatabase:
         """Xóa toàn bộ data (cho testing)"""
         for table in self.tables:
             self.tables[table].clear()
+        self._field_index.clear()
+        self._rebuild_relationship_indexes()
+        self._rebuild_lower_cache()
     
     def export_data(self) -> Dict[str, Any]:
         """Export toàn bộ data để backup"""
@@ -195,16 +377,51 @@ class MockDatabase:
             "stats": self.get_stats()
         }
     
+    def iter_records(self) -> Iterator[Tuple[str, str, Dict[str, Any]]]:
+        """Stream (table, id, record) - không build full snapshot"""
+        for table, records in self.tables.items():
+            for record_id, record in records.items():
+                yield table, record_id, record
+    
+    def export_to_jsonl(self, path: str) -> int:
+        """
+        Export data ra JSON Lines file, mỗi record một dòng
+        Streaming: peak memory không tăng theo database size
+        Returns số records đã ghi
+        """
+        count = 0
+        with open(path, "wb") as f:
+            for table, record_id, record in self.iter_records():
+                if any(isinstance(record.get(field), int) for field in _TIMESTAMP_FIELDS):
+                    record = self._with_iso_timestamps(record)
+                f.write(orjson.dumps({"table": table, "id": record_id, "record": record}))
+                f.write(b"\n")
+                count += 1
+        return count
+    
+    @staticmethod
+    def _with_iso_timestamps(record: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy record với timestamps ns đã format thành ISO strings"""
+        formatted = dict(record)
+        for field in _TIMESTAMP_FIELDS:
+            value = formatted.get(field)
+            if isinstance(value, int):
+                formatted[field] = _ns_to_iso(value)
+        return formatted
+    
     def import_data(self, data: Dict[str, Any]):
         """Import data từ backup"""
         if "tables" in data:
             self.tables = data["tables"]
+            self._field_index.clear()
+            self._rebuild_relationship_indexes()
+            self._rebuild_lower_cache()
 
 
 # Factory function để tạo mock database
-def create_mock_database() -> MockDatabase:
+def create_mock_database(defensive_copy: bool = True) -> MockDatabase:
     """Tạo mock database instance"""
-    return MockDatabase()
+    return MockDatabase(defensive_copy=defensive_copy)
 
 
 # Example usage và testing
@@ -3,53 +3,93 @@ Mock Gemini Client cho Development Mode
 Trả về responses giả để test mà không cần API key thật
 """
 import time
-import json
 import random
+import re
 from typing import Dict, Any, List
 
+import orjson
+
+
+# Routing keywords - so khớp theo tokens của prompt (gồm cả dạng số nhiều hay gặp)
+_WORD_RE = re.compile(r"[a-z]+")
+_PRIORITY_WORDS = frozenset({"priority", "priorities", "urgent"})
+_SEVERITY_WORDS = frozenset({"severity", "bug", "bugs"})
+_KEYWORD_WORDS = frozenset({"keyword", "keywords", "extract"})
+_TEST_WORDS = frozenset({"test", "tests"})
+_SUGGEST_WORDS = frozenset({"suggest", "suggestion", "suggestions"})
+_IMPACT_WORDS = frozenset({"impact", "analysis"})
+_NATURAL_WORDS = frozenset({"natural"})
+_LANGUAGE_WORDS = frozenset({"language"})
+_CHAT_WORDS = frozenset({"chat"})
+
 
 class MockGeminiClient:
     """Mock implementation của Gemini Client cho development"""
     
-    def __init__(self, api_key: str = "mock_key"):
-        """Khởi tạo mock client"""
+    # Pre-defined responses cho different use cases
+    # Class-level tuples: immutable, share giữa instances, không rebuild mỗi __init__
+    MOCK_RESPONSES = {
+        "priority_analysis": ("low", "medium", "high", "critical"),
+        "severity_analysis": ("minor", "major", "critical", "blocker"),
+        "keywords": (
+            "authentication, login, security, oauth",
+            "database, storage, persistence, sql",
+            "frontend, ui, user interface, react",
+            "backend, api, server, endpoint",
+            "testing, quality assurance, automation"
+        ),
+        "test_suggestions": (
+            "1. Test valid input scenarios\n2. Test invalid input handling\n3. Test edge cases\n4. Test error conditions",
+            "1. Unit tests for core functionality\n2. Integration tests for API endpoints\n3. E2E tests for user workflows",
+            "1. Performance testing under load\n2. Security testing for vulnerabilities\n3. Compatibility testing across browsers"
+        ),
+        "impact_analysis": (
+            {
+                "affected_modules": ["auth", "user", "session"],
+                "risk_level": "medium",
+                "recommended_tests": ["test_auth", "test_user_session", "test_login_flow"]
+            },
+            {
+                "affected_modules": ["database", "storage"],
+                "risk_level": "high", 
+                "recommended_tests": ["test_db_migration", "test_data_integrity"]
+            },
+            {
+                "affected_modules": ["frontend", "ui"],
+                "risk_level": "low",
+                "recommended_tests": ["test_ui_components", "test_responsive_design"]
+            }
+        )
+    }
+    
+    CHAT_RESPONSES = (
+        "Dựa trên phân tích, tôi khuyên bạn nên chạy các tests liên quan đến authentication và user management.",
+        "Thay đổi này có thể ảnh hưởng đến module database và storage. Hãy kiểm tra data integrity tests.",
+        "Tôi thấy đây là một bug có mức độ nghiêm trọng medium. Nên ưu tiên fix trong sprint hiện tại.",
+        "Feature này có dependency với authentication system. Hãy đảm bảo test integration giữa các modules.",
+        "Dựa trên code changes, bạn nên update documentation cho API endpoints và user guide."
+    )
+    
+    def __init__(self, api_key: str = "mock_key", simulated_latency_s: float = 0.0):
+        """
+        Khởi tạo mock client
+        simulated_latency_s > 0 để mô phỏng API delay (mặc định không sleep)
+        """
         self.api_key = api_key
         self.request_count = 0
+        self._latency = simulated_latency_s
         
-        # Pre-defined responses cho different use cases
-        self.mock_responses = {
-            "priority_analysis": ["low", "medium", "high", "critical"],
-            "severity_analysis": ["minor", "major", "critical", "blocker"],
-            "keywords": [
-                "authentication, login, security, oauth",
-                "database, storage, persistence, sql",
-                "frontend, ui, user interface, react",
-                "backend, api, server, endpoint",
-                "testing, quality assurance, automation"
-            ],
-            "test_suggestions": [
-                "1. Test valid input scenarios\n2. Test invalid input handling\n3. Test edge cases\n4. Test error conditions",
-                "1. Unit tests for core functionality\n2. Integration tests for API endpoints\n3. E2E tests for user workflows",
-                "1. Performance testing under load\n2. Security testing for vulnerabilities\n3. Compatibility testing across browsers"
-            ],
-            "impact_analysis": [
-                {
-                    "affected_modules": ["auth", "user", "session"],
-                    "risk_level": "medium",
-                    "recommended_tests": ["test_auth", "test_user_session", "test_login_flow"]
-                },
-                {
-                    "affected_modules": ["database", "storage"],
-                    "risk_level": "high", 
-                    "recommended_tests": ["test_db_migration", "test_data_integrity"]
-                },
-                {
-                    "affected_modules": ["frontend", "ui"],
-                    "risk_level": "low",
-                    "recommended_tests": ["test_ui_components", "test_responsive_design"]
-                }
-            ]
-        }
+        # Dispatch table: (word groups, responder) - match khi mỗi group có ít nhất một word trong prompt,
+        # check theo thứ tự, dừng ở match đầu tiên
+        self._dispatch = (
+            ((_PRIORITY_WORDS,), self._respond_priority),
+            ((_SEVERITY_WORDS,), self._respond_severity),
+            ((_KEYWORD_WORDS,), self._respond_keywords),
+            ((_TEST_WORDS, _SUGGEST_WORDS), self._respond_test_suggestions),
+            ((_IMPACT_WORDS,), self._respond_impact_analysis),
+            ((_NATURAL_WORDS, _LANGUAGE_WORDS), self._generate_chat_response),
+            ((_CHAT_WORDS,), self._generate_chat_response),
+        )
     
     def generate_response(self, prompt: str, **kwargs) -> str:
         """
@@ -58,46 +98,45 @@ class MockGeminiClient:
         """
         self.request_count += 1
         
-        # Simulate API delay
-        time.sleep(0.1)
+        # Simulate API delay (chỉ khi được config)
+        if self._latency:
+            time.sleep(self._latency)
         
         # Analyze prompt để trả về appropriate response
-        prompt_lower = prompt.lower()
-        
-        if "priority" in prompt_lower or "urgent" in prompt_lower:
-            return random.choice(self.mock_responses["priority_analysis"])
-        
-        elif "severity" in prompt_lower or "bug" in prompt_lower:
-            return random.choice(self.mock_responses["severity_analysis"])
+        # Tokenize một lần, mỗi route chỉ còn set membership tests
+        words = frozenset(_WORD_RE.findall(prompt.lower()))
         
-        elif "keyword" in prompt_lower or "extract" in prompt_lower:
-            return random.choice(self.mock_responses["keywords"])
+        for word_groups, responder in self._dispatch:
+            if all(not group.isdisjoint(words) for group in word_groups):
+                return responder(prompt)
         
-        elif "test" in prompt_lower and "suggest" in prompt_lower:
-            return random.choice(self.mock_responses["test_suggestions"])
-        
-        elif "impact" in prompt_lower or "analysis" in prompt_lower:
-            impact_data = random.choice(self.mock_responses["impact_analysis"])
-            return json.dumps(impact_data, indent=2)
-        
-        elif "natural language" in prompt_lower or "chat" in prompt_lower:
-            return self._generate_chat_response(prompt)
-        
-        else:
-            # Default response
-            return f"Mock response for prompt: {prompt[:50]}..."
+        # Default response
+        return f"Mock response for prompt: {prompt[:50]}..."
+    
+    def _respond_priority(self, prompt: str) -> str:
+        """Mock priority analysis"""
+        return random.choice(self.MOCK_RESPONSES["priority_analysis"])
+    
+    def _respond_severity(self, prompt: str) -> str:
+        """Mock severity analysis"""
+        return random.choice(self.MOCK_RESPONSES["severity_analysis"])
+    
+    def _respond_keywords(self, prompt: str) -> str:
+        """Mock keyword extraction"""
+        return random.choice(self.MOCK_RESPONSES["keywords"])
+    
+    def _respond_test_suggestions(self, prompt: str) -> str:
+        """Mock test suggestions"""
+        return random.choice(self.MOCK_RESPONSES["test_suggestions"])
+    
+    def _respond_impact_analysis(self, prompt: str) -> str:
+        """Mock impact analysis (JSON string)"""
+        impact_data = random.choice(self.MOCK_RESPONSES["impact_analysis"])
+        return orjson.dumps(impact_data, option=orjson.OPT_INDENT_2).decode("utf-8")
     
     def _generate_chat_response(self, prompt: str) -> str:
         """Tạo chat response cho natural language queries"""
-        responses = [
-            "Dựa trên phân tích, tôi khuyên bạn nên chạy các tests liên quan đến authentication và user management.",
-            "Thay đổi này có thể ảnh hưởng đến module database và storage. Hãy kiểm tra data integrity tests.",
-            "Tôi thấy đây là một bug có mức độ nghiêm trọng medium. Nên ưu tiên fix trong sprint hiện tại.",
-            "Feature này có dependency với authentication system. Hãy đảm bảo test integration giữa các modules.",
-            "Dựa trên code changes, bạn nên update documentation cho API endpoints và user guide."
-        ]
-        
-        return random.choice(responses)
+        return random.choice(self.CHAT_RESPONSES)
     
     def get_usage_stats(self) -> Dict[str, Any]:
         """Trả về thống kê sử dụng mock API"""
@@ -118,9 +157,10 @@ class MockGeminiClient:
 
 
 # Factory function để tạo mock client
-def create_mock_gemini_client(api_key: str = "mock_key") -> MockGeminiClient:
+def create_mock_gemini_client(api_key: str = "mock_key",
+                              simulated_latency_s: float = 0.0) -> MockGeminiClient:
     """Tạo mock Gemini client instance"""
-    return MockGeminiClient(api_key)
+    return MockGeminiClient(api_key, simulated_latency_s=simulated_latency_s)
 
 
 # Example usage
@@ -0,0 +1,312 @@
+"""
+SQLite-backed Mock Database cho large datasets
+Cùng API với MockDatabase nhưng scan/filter/search chạy trong SQLite (C) thay vì Python loops
+Dùng khi mock data lớn (>10k records/table); data nhỏ thì MockDatabase nhanh hơn
+"""
+import re
+import sqlite3
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+
+import orjson
+
+from .mock_database import TABLE_NAMES, _TIMESTAMP_FIELDS, _ns_to_iso
+
+
+# Field names dùng được trong JSON path literal (cần cho expression indexes)
+_SAFE_FIELD_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+_SCALAR_TYPES = (str, int, float, bool)
+
+
+class SQLiteMockDatabase:
+    """
+    Mock database lưu records dạng JSON trong SQLite in-memory
+    Records trả về là copies (decode từ JSON) - muốn sửa phải gọi update()
+    """
+    
+    def __init__(self, path: str = ":memory:"):
+        """
+        Khởi tạo SQLite storage với một table (id, data JSON) cho mỗi entity type
+        Autocommit: mỗi write persist ngay (path là file) và không giữ write lock giữa các calls
+        """
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._indexed_fields: Dict[str, set] = {table: set() for table in TABLE_NAMES}
+        self.connection_count = 0
+        self.query_count = 0
+        
+        for table in TABLE_NAMES:
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} (id TEXT PRIMARY KEY, data TEXT NOT NULL)"
+            )
+        # Relationship lookups theo entity id luôn cần index
+        for field in ("source_entity_id", "target_entity_id"):
+            self._ensure_index("relationships", field)
+    
+    def connect(self) -> bool:
+        """Mô phỏng database connection"""
+        self.connection_count += 1
+        return True
+    
+    def disconnect(self):
+        """Mô phỏng database disconnection"""
+        pass
+    
+    def close(self) -> None:
+        """Đóng SQLite connection (data đã commit sẵn)"""
+        self._conn.close()
+    
+    def insert(self, table: str, data: Dict[str, Any]) -> str:
+        """Insert data vào table"""
+        self.query_count += 1
+        self._check_table(table)
+        
+        # Generate ID nếu không có
+        if "id" not in data:
+            data["id"] = f"{table}_{uuid.uuid4().hex[:8]}"
+        
+        # Add timestamps (int ns giống MockDatabase)
+        now = time.time_ns()
+        data["created_at"] = now
+        data["updated_at"] = now
+        
+        if table == "relationships":
+            self._normalize_entity_types(data)
+        
+        self._conn.execute(
+            f"INSERT OR REPLACE INTO {table} (id, data) VALUES (?, ?)",
+            (data["id"], orjson.dumps(data)),
+        )
+        return data["id"]
+    
+    def update(self, table: str, id: str, data: Dict[str, Any]) -> bool:
+        """Update data trong table"""
+        self.query_count += 1
+        self._check_table(table)
+        
+        record = self._get(table, id)
+        if record is None:
+            return False
+        
+        data["updated_at"] = time.time_ns()
+        if table == "relationships":
+            self._normalize_entity_types(data)
+        record.update(data)
+        
+        self._conn.execute(
+            f"UPDATE {table} SET data = ? WHERE id = ?", (orjson.dumps(record), id)
+        )
+        return True
+    
+    def select(self, table: str, id: Optional[str] = None,
+               where: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """Select data từ table"""
+        self.query_count += 1
+        self._check_table(table)
+        
+        # Get specific record by ID
+        if id:
+            record = self._get(table, id)
+            return [record] if record is not None else []
+        
+        # Push scalar conditions trên safe field names xuống SQL, phần còn lại filter trong Python
+        clauses: List[str] = []
+        params: List[Any] = []
+        remaining: List[Tuple[str, Any]] = []
+        for key, value in (where or {}).items():
+            if _SAFE_FIELD_RE.match(key) and isinstance(value, _SCALAR_TYPES):
+                self._ensure_index(table, key)
+                clauses.append(f"{self._json_field(key)} IS ?")
+                params.append(value)
+            else:
+                remaining.append((key, value))
+        
+        sql = f"SELECT data FROM {table}"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY rowid"
+        
+        records = [orjson.loads(row[0]) for row in self._conn.execute(sql, params)]
+        if remaining:
+            records = [
+                record for record in records
+                if all(key in record and record[key] == value for key, value in remaining)
+            ]
+        return records
+    
+    def delete(self, table: str, id: str) -> bool:
+        """Delete record từ table"""
+        self.query_count += 1
+        self._check_table(table)
+        
+        cursor = self._conn.execute(f"DELETE FROM {table} WHERE id = ?", (id,))
+        return cursor.rowcount > 0
+    
+    def search(self, table: str, query: str, fields: List[str]) -> List[Dict[str, Any]]:
+        """
+        Search records theo text query (LIKE trong SQLite)
+        Note: LIKE chỉ case-insensitive với ASCII
+        """
+        self.query_count += 1
+        
+        if table not in TABLE_NAMES:
+            return []
+        
+        search_fields = [field for field in fields if _SAFE_FIELD_RE.match(field)]
+        if not search_fields:
+            return []
+        
+        pattern = "%" + re.sub(r"([\\%_])", r"\\\1", query) + "%"
+        conditions = " OR ".join(
+            f"(json_type(data, '$.{field}') = 'text' AND {self._json_field(field)} LIKE ? ESCAPE '\\')"
+            for field in search_fields
+        )
+        rows = self._conn.execute(
+            f"SELECT data FROM {table} WHERE {conditions} ORDER BY rowid",
+            [pattern] * len(search_fields),
+        )
+        return [orjson.loads(row[0]) for row in rows]
+    
+    def get_related_records(self, entity_id: str) -> List[Dict[str, Any]]:
+        """Tìm records liên quan thông qua relationships (qua expression indexes)"""
+        self.query_count += 1
+        
+        related = []
+        rows = self._conn.execute(
+            f"SELECT data FROM relationships WHERE {self._json_field('source_entity_id')} = ? "
+            f"UNION ALL SELECT data FROM relationships WHERE {self._json_field('target_entity_id')} = ? "
+            f"AND {self._json_field('source_entity_id')} IS NOT ?",
+            (entity_id, entity_id, entity_id),
+        )
+        for (data,) in rows:
+            rel = orjson.loads(data)
+            # Entity ở đầu còn lại của relationship
+            side = "target" if rel.get("source_entity_id") == entity_id else "source"
+            entity_table = rel.get(f"{side}_entity_type", "")
+            if entity_table in TABLE_NAMES:
+                entity = self._get(entity_table, rel.get(f"{side}_entity_id"))
+                if entity is not None:
+                    related.append({"relationship": rel, "entity": entity})
+        
+        return related
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Trả về database statistics"""
+        return {
+            "connection_count": self.connection_count,
+            "query_count": self.query_count,
+            "table_counts": {
+                table: self._conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                for table in TABLE_NAMES
+            }
+        }
+    
+    def clear_all_data(self):
+        """Xóa toàn bộ data (cho testing)"""
+        with self._transaction():
+            for table in TABLE_NAMES:
+                self._conn.execute(f"DELETE FROM {table}")
+    
+    def iter_records(self) -> Iterator[Tuple[str, str, Dict[str, Any]]]:
+        """Stream (table, id, record) - không build full snapshot"""
+        for table in TABLE_NAMES:
+            for record_id, data in self._conn.execute(f"SELECT id, data FROM {table} ORDER BY rowid"):
+                yield table, record_id, orjson.loads(data)
+    
+    def export_data(self) -> Dict[str, Any]:
+        """Export toàn bộ data để backup (cùng format với MockDatabase)"""
+        tables: Dict[str, Dict[str, Any]] = {table: {} for table in TABLE_NAMES}
+        for table, record_id, record in self.iter_records():
+            tables[table][record_id] = record
+        return {
+            "tables": tables,
+            "stats": self.get_stats()
+        }
+    
+    def export_to_jsonl(self, path: str) -> int:
+        """
+        Export data ra JSON Lines file, mỗi record một dòng
+        Returns số records đã ghi
+        """
+        count = 0
+        with open(path, "wb") as f:
+            for table, record_id, record in self.iter_records():
+                for field in _TIMESTAMP_FIELDS:
+                    if isinstance(record.get(field), int):
+                        record[field] = _ns_to_iso(record[field])
+                f.write(orjson.dumps({"table": table, "id": record_id, "record": record}))
+                f.write(b"\n")
+                count += 1
+        return count
+    
+    def import_data(self, data: Dict[str, Any]):
+        """Import data từ backup (thay thế data hiện tại)"""
+        if "tables" not in data:
+            return
+        
+        # Clear + insert trong một transaction: import fail thì data cũ còn nguyên
+        with self._transaction():
+            for table in TABLE_NAMES:
+                self._conn.execute(f"DELETE FROM {table}")
+            for table, records in data["tables"].items():
+                if table not in TABLE_NAMES:
+                    continue
+                rows = []
+                for record_id, record in records.items():
+                    if table == "relationships":
+                        self._normalize_entity_types(record)
+                    rows.append((record_id, orjson.dumps(record)))
+                self._conn.executemany(f"INSERT OR REPLACE INTO {table} (id, data) VALUES (?, ?)", rows)
+    
+    # Private helper methods
+    
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        """Explicit transaction cho multi-statement writes (connection chạy autocommit)"""
+        self._conn.execute("BEGIN")
+        try:
+            yield
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+    
+    @staticmethod
+    def _check_table(table: str) -> None:
+        """Validate table name (table names được interpolate vào SQL)"""
+        if table not in TABLE_NAMES:
+            raise ValueError(f"Table {table} does not exist")
+    
+    @staticmethod
+    def _json_field(field: str) -> str:
+        """SQL expression cho field trong JSON data (field đã qua _SAFE_FIELD_RE)"""
+        return f"json_extract(data, '$.{field}')"
+    
+    @staticmethod
+    def _normalize_entity_types(rel: Dict[str, Any]) -> None:
+        """Lowercase entity types một lần lúc ghi"""
+        for key in ("source_entity_type", "target_entity_type"):
+            value = rel.get(key)
+            if isinstance(value, str):
+                rel[key] = value.lower()
+    
+    def _get(self, table: str, record_id: Any) -> Optional[Dict[str, Any]]:
+        """Get một record theo id"""
+        row = self._conn.execute(f"SELECT data FROM {table} WHERE id = ?", (record_id,)).fetchone()
+        return orjson.loads(row[0]) if row else None
+    
+    def _ensure_index(self, table: str, field: str) -> None:
+        """Tạo expression index cho field lần đầu field được query"""
+        if field in self._indexed_fields[table]:
+            return
+        self._conn.execute(
+            f"CREATE INDEX IF NOT EXISTS idx_{table}_{field} ON {table} ({self._json_field(field)})"
+        )
+        self._indexed_fields[table].add(field)
+
+
+# Factory function để tạo SQLite mock database
+def create_sqlite_mock_database(path: str = ":memory:") -> SQLiteMockDatabase:
+    """Tạo SQLite-backed mock database instance"""
+    return SQLiteMockDatabase(path)
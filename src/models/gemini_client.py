@@ -3,26 +3,207 @@ Gemini AI Client Wrapper
 Mục đích: Wrap Gemini API với error handling và optimizations
 """
 
+import hashlib
 import logging
+import re
+from collections import OrderedDict
 import google.generativeai as genai
 from typing import Dict, Any, Optional
 import asyncio
-import json
+from types import MappingProxyType
+import orjson
 from ..utils.logger import get_logger
 
 
+# Markdown-fenced JSON response: ```json ... ``` hoặc ``` ... ```
+_FENCE_RE = re.compile(r"^\s*```(?:json)?\s*(.*?)\s*```\s*$", re.DOTALL)
+
+
+# =================== PROMPT TEMPLATES ===================
+# Phần constant của prompts build một lần lúc import, mỗi request chỉ join với values
+
+_REQUIREMENT_PROMPT_HEAD = """
+        Phân tích requirement và trả về JSON:
+        
+        Requirement: """
+_REQUIREMENT_PROMPT_MID = """
+        Project: """
+_REQUIREMENT_PROMPT_TAIL = """
+        
+        Format JSON:
+        {
+            "category": "functional|non-functional|business|technical",
+            "complexity": "low|medium|high",
+            "dependencies": ["dep1", "dep2"],
+            "risk_areas": ["risk1", "risk2"],
+            "testing_types": ["unit", "integration", "e2e"],
+            "affected_docs": ["README.md", "API.md"],
+            "affected_code_files": ["src/module.py"]
+        }
+        """
+
+_DEPENDENCY_PROMPT_HEAD = """
+        Phân tích impact của relationship:
+        
+        Feature A: """
+_DEPENDENCY_PROMPT_FEATURE_B = """
+        Feature B: """
+_DEPENDENCY_PROMPT_RELATIONSHIP = """  
+        Relationship: """
+_DEPENDENCY_PROMPT_TAIL = """
+        
+        Trả về JSON:
+        {
+            "impact_areas": ["area1", "area2"],
+            "risk_score": 1-10,
+            "mitigation_strategies": ["strategy1", "strategy2"],
+            "affected_tests": ["test1.py", "test2.py"],
+            "documentation_updates": ["doc1.md", "doc2.md"]
+        }
+        """
+
+_CODE_CHANGE_PROMPT_HEAD = """
+        Phân tích impact của code changes:
+        
+        Changed Files: """
+_CODE_CHANGE_PROMPT_MID = """
+        Change Type: """
+_CODE_CHANGE_PROMPT_TAIL = """
+        
+        Trả về JSON:
+        {
+            "affected_features": ["feature1", "feature2"],
+            "required_tests": ["test1.py", "test2.py"],
+            "documentation_updates": ["README.md", "API.md"],
+            "risk_level": "low|medium|high|critical",
+            "breaking_changes": true/false,
+            "rollback_complexity": "low|medium|high"
+        }
+        """
+
+_CODE_CHANGES_BATCH_PROMPT_HEAD = """
+        Phân tích impact của từng code change trong danh sách:
+        """
+_CODE_CHANGES_BATCH_PROMPT_TAIL = """
+        
+        Trả về JSON với một analysis cho mỗi change, đúng thứ tự danh sách:
+        {
+            "analyses": [
+                {
+                    "affected_features": ["feature1", "feature2"],
+                    "required_tests": ["test1.py", "test2.py"],
+                    "documentation_updates": ["README.md", "API.md"],
+                    "risk_level": "low|medium|high|critical",
+                    "breaking_changes": true/false,
+                    "rollback_complexity": "low|medium|high"
+                }
+            ]
+        }
+        """
+
+_DOCUMENT_STALENESS_PROMPT_HEAD = """
+        Phân tích document staleness:
+        
+        Document: """
+_DOCUMENT_STALENESS_PROMPT_MID = """
+        Related Features: """
+_DOCUMENT_STALENESS_PROMPT_TAIL = """
+        
+        Trả về JSON:
+        {
+            "needs_update": true/false,
+            "staleness_score": 0-10,
+            "update_priority": "low|medium|high",
+            "suggested_sections": ["section1", "section2"],
+            "estimated_effort": "30min|1h|2h|4h"
+        }
+        """
+
+_NATURAL_LANGUAGE_PROMPT_HEAD = """
+        Xử lý natural language message và trả về structured response:
+        
+        User Message: """
+_NATURAL_LANGUAGE_PROMPT_TAIL = """
+        
+        Hãy phân tích message và trả về response hữu ích, bao gồm:
+        - Hiểu ý đồ của user
+        - Gợi ý hành động cụ thể
+        - Tools nào có thể sử dụng
+        - Thông tin bổ sung nếu cần
+        
+        Format: Friendly, helpful, và actionable
+        """
+
+
+# =================== FALLBACK ANALYSES ===================
+# Frozen defaults build một lần - getters trả shallow copy (values là tuples, share an toàn)
+
+_FALLBACK_ANALYSIS = MappingProxyType({
+    "category": "functional",
+    "complexity": "medium", 
+    "dependencies": (),
+    "risk_areas": (),
+    "testing_types": ("unit",),
+    "affected_docs": (),
+    "affected_code_files": ()
+})
+
+_FALLBACK_DEPENDENCY_ANALYSIS = MappingProxyType({
+    "impact_areas": ("unknown",),
+    "risk_score": 5,
+    "mitigation_strategies": ("thorough_testing",),
+    "affected_tests": (),
+    "documentation_updates": ()
+})
+
+_FALLBACK_CODE_ANALYSIS = MappingProxyType({
+    "affected_features": (),
+    "required_tests": (),
+    "documentation_updates": (),
+    "risk_level": "medium",
+    "breaking_changes": False,
+    "rollback_complexity": "medium"
+})
+
+_FALLBACK_DOCUMENT_ANALYSIS = MappingProxyType({
+    "needs_update": False,
+    "staleness_score": 5,
+    "update_priority": "medium",
+    "suggested_sections": (),
+    "estimated_effort": "1h"
+})
+
+
+class GeminiAnalysisError(Exception):
+    """
+    Gemini analysis failed (request error hoặc response không parse được)
+    Mang theo fallback analysis để caller degrade như non-raising path
+    """
+    
+    def __init__(self, message: str, fallback: Dict[str, Any]):
+        super().__init__(message)
+        self.fallback = fallback
+
+
 class GeminiClient:
     """
     Wrapper cho Gemini-2.5-Flash API
     Tối ưu hóa cho cost-effectiveness và speed
     """
     
-    def __init__(self, api_key: str, model: str = "gemini-2.5-flash"):
-        """Initialize Gemini client với API key"""
+    def __init__(self, api_key: str, model: str = "gemini-2.5-flash", prompt_cache_size: int = 512):
+        """
+        Initialize Gemini client với API key
+        prompt_cache_size: số JSON responses giữ trong LRU cache theo prompt (0 = tắt)
+        """
         self.api_key = api_key
         self.model_name = model
         self.logger = get_logger(__name__)
         
+        # LRU cache: blake2b(prompt) -> serialized JSON response (code change / document analyses)
+        self._prompt_cache: "OrderedDict[bytes, bytes]" = OrderedDict()
+        self._prompt_cache_size = prompt_cache_size
+        
         # Configure Gemini với settings tối ưu
         genai.configure(api_key=api_key)
         
@@ -37,33 +218,54 @@ class GeminiClient:
             }
         )
         
-    async def analyze_requirement(self, requirement: str, project_name: str) -> Dict[str, Any]:
+    async def analyze_requirement(self, requirement: str, project_name: str,
+                                  raise_on_error: bool = False) -> Dict[str, Any]:
         """
         Phân tích requirement và extract metadata
         Cognitive load: < 70% - single responsibility
+        raise_on_error: raise GeminiAnalysisError thay vì trả fallback (caller cần biết để không cache)
         """
         prompt = self._build_requirement_analysis_prompt(requirement, project_name)
         
         try:
-            response = await self._generate_content_async(prompt)
-            return self._parse_json_response(response.text)
+            # MemoryService cache analysis này theo normalized key - không cache thêm theo prompt
+            return await self._generate_json(prompt, raise_on_empty=raise_on_error, use_cache=False)
         except Exception as e:
             self.logger.warning(f"Gemini analysis failed: {e}")
+            if raise_on_error:
+                raise GeminiAnalysisError(str(e), self._get_fallback_analysis()) from e
             return self._get_fallback_analysis()
     
+    async def analyze_requirements_bulk(self, items: list[tuple[str, str]],
+                                        max_concurrency: int = 8) -> list[Dict[str, Any]]:
+        """
+        Phân tích nhiều (requirement, project_name) cùng lúc
+        Gemini calls chạy concurrent (tối đa max_concurrency), kết quả giữ đúng thứ tự items
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def analyze_one(requirement: str, project_name: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.analyze_requirement(requirement, project_name)
+        
+        return await asyncio.gather(*(analyze_one(*item) for item in items))
+    
     async def analyze_feature_dependency(self, feature_a: str, feature_b: str, 
-                                       relationship_type: str) -> Dict[str, Any]:
+                                       relationship_type: str, raise_on_error: bool = False) -> Dict[str, Any]:
         """
         Phân tích impact của feature dependency
         Cognitive load: < 70% - focused on dependency analysis
+        raise_on_error: raise GeminiAnalysisError thay vì trả fallback
         """
         prompt = self._build_dependency_analysis_prompt(feature_a, feature_b, relationship_type)
         
         try:
-            response = await self._generate_content_async(prompt)
-            return self._parse_json_response(response.text)
+            # MemoryService cache analysis này theo normalized key - không cache thêm theo prompt
+            return await self._generate_json(prompt, raise_on_empty=raise_on_error, use_cache=False)
         except Exception as e:
             self.logger.warning(f"Dependency analysis failed: {e}")
+            if raise_on_error:
+                raise GeminiAnalysisError(str(e), self._get_fallback_dependency_analysis()) from e
             return self._get_fallback_dependency_analysis()
     
     async def analyze_code_change_impact(self, file_paths: list[str], 
@@ -75,12 +277,38 @@ class GeminiClient:
         prompt = self._build_code_change_analysis_prompt(file_paths, change_type)
         
         try:
-            response = await self._generate_content_async(prompt)
-            return self._parse_json_response(response.text)
+            return await self._generate_json(prompt)
         except Exception as e:
             self.logger.warning(f"Code change analysis failed: {e}")
             return self._get_fallback_code_analysis()
     
+    async def analyze_code_changes_batch(self, changes: list[tuple[list[str], str]]) -> list[Dict[str, Any]]:
+        """
+        Phân tích nhiều (file_paths, change_type) trong một Gemini request
+        Kết quả giữ đúng thứ tự changes; response thiếu/sai số lượng thì change đó dùng fallback analysis
+        """
+        if len(changes) <= 1:
+            return [await self.analyze_code_change_impact(*change) for change in changes]
+        
+        prompt = self._build_code_changes_batch_prompt(changes)
+        
+        try:
+            result = await self._generate_json(prompt)
+            # Chấp nhận cả JSON array trần thay vì {"analyses": [...]}
+            analyses = result.get("analyses") if isinstance(result, dict) else result
+        except Exception as e:
+            self.logger.warning(f"Batch code change analysis failed: {e}")
+            analyses = None
+        
+        if not isinstance(analyses, list) or len(analyses) != len(changes):
+            self.logger.warning(f"Batch code change analysis returned unexpected shape for {len(changes)} changes")
+            analyses = [None] * len(changes)
+        
+        return [
+            analysis if isinstance(analysis, dict) else self._get_fallback_code_analysis()
+            for analysis in analyses
+        ]
+    
     async def analyze_document_staleness(self, doc_path: str, 
                                        related_features: list[str]) -> Dict[str, Any]:
         """
@@ -90,8 +318,7 @@ class GeminiClient:
         prompt = self._build_document_staleness_prompt(doc_path, related_features)
         
         try:
-            response = await self._generate_content_async(prompt)
-            return self._parse_json_response(response.text)
+            return await self._generate_json(prompt)
         except Exception as e:
             self.logger.warning(f"Document staleness analysis failed: {e}")
             return self._get_fallback_document_analysis()
@@ -112,6 +339,40 @@ class GeminiClient:
     
     # Private helper methods
     
+    async def _generate_json(self, prompt: str, raise_on_empty: bool = False,
+                             use_cache: bool = True) -> Dict[str, Any]:
+        """
+        Generate và parse JSON response, memoized theo prompt (LRU)
+        Cache hit bỏ qua hoàn toàn Gemini round-trip
+        raise_on_empty: response empty/invalid raise ValueError thay vì trả về như bình thường
+        use_cache: False cho analyses mà caller đã tự cache (tránh hai LRU chồng nhau)
+        """
+        use_cache = use_cache and self._prompt_cache_size > 0
+        if use_cache:
+            key = hashlib.blake2b(prompt.encode("utf-8"), digest_size=16).digest()
+            cached = self._prompt_cache.get(key)
+            if cached is not None:
+                self._prompt_cache.move_to_end(key)
+                # Cache giữ serialized JSON - mỗi hit decode ra object tree mới (deep copy)
+                return orjson.loads(cached)
+        
+        response = await self._generate_content_async(prompt)
+        result = self._parse_json_response(response.text)
+        
+        # Chỉ cache parse thành công - empty/invalid response sẽ được thử lại
+        if not result or not isinstance(result, dict):
+            if raise_on_empty:
+                raise ValueError("Empty or invalid JSON analysis response")
+            return result
+        
+        if use_cache:
+            self._prompt_cache[key] = orjson.dumps(result)
+            if len(self._prompt_cache) > self._prompt_cache_size:
+                self._prompt_cache.popitem(last=False)
+        
+        # result là object vừa parse, cache không share reference nào với nó
+        return result
+    
     async def _generate_content_async(self, prompt: str):
         """Generate content with async support"""
         # Note: google.generativeai doesn't have native async support
@@ -120,155 +381,66 @@ class GeminiClient:
     
     def _build_requirement_analysis_prompt(self, requirement: str, project_name: str) -> str:
         """Build prompt cho requirement analysis - helper method"""
-        return f"""
-        Phân tích requirement và trả về JSON:
-        
-        Requirement: {requirement}
-        Project: {project_name}
-        
-        Format JSON:
-        {{
-            "category": "functional|non-functional|business|technical",
-            "complexity": "low|medium|high",
-            "dependencies": ["dep1", "dep2"],
-            "risk_areas": ["risk1", "risk2"],
-            "testing_types": ["unit", "integration", "e2e"],
-            "affected_docs": ["README.md", "API.md"],
-            "affected_code_files": ["src/module.py"]
-        }}
-        """
+        return "".join((_REQUIREMENT_PROMPT_HEAD, requirement, _REQUIREMENT_PROMPT_MID,
+                        project_name, _REQUIREMENT_PROMPT_TAIL))
     
     def _build_dependency_analysis_prompt(self, feature_a: str, feature_b: str, 
                                         relationship_type: str) -> str:
         """Build prompt cho dependency analysis - helper method"""
-        return f"""
-        Phân tích impact của relationship:
-        
-        Feature A: {feature_a}
-        Feature B: {feature_b}  
-        Relationship: {relationship_type}
-        
-        Trả về JSON:
-        {{
-            "impact_areas": ["area1", "area2"],
-            "risk_score": 1-10,
-            "mitigation_strategies": ["strategy1", "strategy2"],
-            "affected_tests": ["test1.py", "test2.py"],
-            "documentation_updates": ["doc1.md", "doc2.md"]
-        }}
-        """
+        return "".join((_DEPENDENCY_PROMPT_HEAD, feature_a, _DEPENDENCY_PROMPT_FEATURE_B,
+                        feature_b, _DEPENDENCY_PROMPT_RELATIONSHIP, relationship_type,
+                        _DEPENDENCY_PROMPT_TAIL))
     
     def _build_code_change_analysis_prompt(self, file_paths: list[str], 
                                          change_type: str) -> str:
         """Build prompt cho code change analysis"""
         files_str = ", ".join(file_paths)
-        return f"""
-        Phân tích impact của code changes:
-        
-        Changed Files: {files_str}
-        Change Type: {change_type}
-        
-        Trả về JSON:
-        {{
-            "affected_features": ["feature1", "feature2"],
-            "required_tests": ["test1.py", "test2.py"],
-            "documentation_updates": ["README.md", "API.md"],
-            "risk_level": "low|medium|high|critical",
-            "breaking_changes": true/false,
-            "rollback_complexity": "low|medium|high"
-        }}
-        """
+        return "".join((_CODE_CHANGE_PROMPT_HEAD, files_str, _CODE_CHANGE_PROMPT_MID,
+                        change_type, _CODE_CHANGE_PROMPT_TAIL))
+    
+    def _build_code_changes_batch_prompt(self, changes: list[tuple[list[str], str]]) -> str:
+        """Build một prompt liệt kê đánh số tất cả code changes"""
+        lines = [
+            f"\n        {index}. Changed Files: {', '.join(file_paths)} | Change Type: {change_type}"
+            for index, (file_paths, change_type) in enumerate(changes, 1)
+        ]
+        return "".join((_CODE_CHANGES_BATCH_PROMPT_HEAD, *lines, _CODE_CHANGES_BATCH_PROMPT_TAIL))
     
     def _build_document_staleness_prompt(self, doc_path: str, 
                                        related_features: list[str]) -> str:
         """Build prompt cho document staleness analysis"""
         features_str = ", ".join(related_features)
-        return f"""
-        Phân tích document staleness:
-        
-        Document: {doc_path}
-        Related Features: {features_str}
-        
-        Trả về JSON:
-        {{
-            "needs_update": true/false,
-            "staleness_score": 0-10,
-            "update_priority": "low|medium|high",
-            "suggested_sections": ["section1", "section2"],
-            "estimated_effort": "30min|1h|2h|4h"
-        }}
-        """
+        return "".join((_DOCUMENT_STALENESS_PROMPT_HEAD, doc_path, _DOCUMENT_STALENESS_PROMPT_MID,
+                        features_str, _DOCUMENT_STALENESS_PROMPT_TAIL))
     
     def _build_natural_language_prompt(self, message: str) -> str:
         """Build prompt cho natural language processing"""
-        return f"""
-        Xử lý natural language message và trả về structured response:
-        
-        User Message: {message}
-        
-        Hãy phân tích message và trả về response hữu ích, bao gồm:
-        - Hiểu ý đồ của user
-        - Gợi ý hành động cụ thể
-        - Tools nào có thể sử dụng
-        - Thông tin bổ sung nếu cần
-        
-        Format: Friendly, helpful, và actionable
-        """
+        return "".join((_NATURAL_LANGUAGE_PROMPT_HEAD, message, _NATURAL_LANGUAGE_PROMPT_TAIL))
     
     def _parse_json_response(self, response_text: str) -> Dict[str, Any]:
         """Parse JSON response với error handling"""
         try:
-            # Clean response text (remove markdown formatting)
-            clean_text = response_text.strip()
-            if clean_text.startswith("```json"):
-                clean_text = clean_text[7:]
-            if clean_text.endswith("```"):
-                clean_text = clean_text[:-3]
+            # Clean response text (remove markdown formatting) trong một regex match
+            match = _FENCE_RE.match(response_text)
+            payload = match.group(1) if match else response_text.strip()
             
-            return json.loads(clean_text.strip())
-        except json.JSONDecodeError as e:
+            return orjson.loads(payload)
+        except orjson.JSONDecodeError as e:
             self.logger.warning(f"Failed to parse JSON response: {e}")
             return {}
     
     def _get_fallback_analysis(self) -> Dict[str, Any]:
         """Fallback analysis khi Gemini fail"""
-        return {
-            "category": "functional",
-            "complexity": "medium", 
-            "dependencies": [],
-            "risk_areas": [],
-            "testing_types": ["unit"],
-            "affected_docs": [],
-            "affected_code_files": []
-        }
+        return dict(_FALLBACK_ANALYSIS)
     
     def _get_fallback_dependency_analysis(self) -> Dict[str, Any]:
         """Fallback dependency analysis"""
-        return {
-            "impact_areas": ["unknown"],
-            "risk_score": 5,
-            "mitigation_strategies": ["thorough_testing"],
-            "affected_tests": [],
-            "documentation_updates": []
-        }
+        return dict(_FALLBACK_DEPENDENCY_ANALYSIS)
     
     def _get_fallback_code_analysis(self) -> Dict[str, Any]:
         """Fallback code change analysis"""
-        return {
-            "affected_features": [],
-            "required_tests": [],
-            "documentation_updates": [],
-            "risk_level": "medium",
-            "breaking_changes": False,
-            "rollback_complexity": "medium"
-        }
+        return dict(_FALLBACK_CODE_ANALYSIS)
     
     def _get_fallback_document_analysis(self) -> Dict[str, Any]:
         """Fallback document analysis"""
-        return {
-            "needs_update": False,
-            "staleness_score": 5,
-            "update_priority": "medium",
-            "suggested_sections": [],
-            "estimated_effort": "1h"
-        }
+        return dict(_FALLBACK_DOCUMENT_ANALYSIS)
@@ -6,22 +6,88 @@ Core Entities (11):
 - ProjectRequirement, Feature, Bug, CodeChange, Test, TestResult, UserFeedback
 - DocumentEntity, CodeFileEntity, TestCoverage, EntityRelationship
 
-Enhanced Relationships (17):
+Relationships (17, RelType):
 - Original: depends_on, conflicts_with, enhances, blocks, related_to, implements, tests, fixes, caused_by
-- New: documents, described_by, covers, covered_by, imports, imported_by, references, referenced_by
+- Docs/code: documents, described_by, covers, covered_by, imports, imported_by, references, referenced_by
 
 Capabilities: Change Detection → Doc/Code Impact Analysis → Test Recommendations → Auto Updates → Quality Assurance
 """
 
-from dataclasses import dataclass, field
+import sys
+import time
+from array import array
+from collections import defaultdict
+from dataclasses import dataclass, field, replace
 from datetime import datetime
-from enum import Enum
-from typing import List, Dict, Any, Optional
+from enum import Enum, IntEnum
+from itertools import accumulate
+from typing import List, Dict, Any, Iterable, Optional, Sequence, Tuple, Union
+
+
+# =================== TIMESTAMPS ===================
+# Timestamps lưu dạng int epoch-nanoseconds (time.time_ns) - tạo và so sánh rẻ hơn datetime,
+# datetime chỉ build khi đọc qua properties (display/format)
+
+_NS_PER_SECOND = 1_000_000_000
+_NS_PER_DAY = 86_400 * _NS_PER_SECOND
+
+
+def _ns_to_datetime(timestamp_ns: Optional[int]) -> Optional[datetime]:
+    """Convert epoch-ns timestamp thành local datetime (microsecond precision)"""
+    if timestamp_ns is None:
+        return None
+    seconds, nanos = divmod(timestamp_ns, _NS_PER_SECOND)
+    return datetime.fromtimestamp(seconds).replace(microsecond=nanos // 1000)
+
+
+def _datetime_view(ns_field: str) -> property:
+    """Read-only datetime property cho một *_ns field"""
+    return property(lambda self: _ns_to_datetime(getattr(self, ns_field)),
+                    doc=f"{ns_field} dưới dạng datetime")
+
+
+# =================== DEFAULTS ===================
+# List fields mặc định share một empty tuple - phần lớn entities không dùng hết các fields này,
+# không cần allocate list rỗng cho từng field của từng instance. Muốn ghi thì gán list mới.
+
+_EMPTY: Tuple[()] = ()
+
+
+def _as_list(values: Sequence[Any]) -> List[Any]:
+    """List có thể append (copy một lần nếu field vẫn là _EMPTY/tuple)"""
+    return values if isinstance(values, list) else list(values)
+
+
+# =================== STRING INTERNING ===================
+# File paths / feature ids lặp lại giữa rất nhiều entities - intern để các giá trị bằng nhau
+# share một str object (ít memory hơn, so sánh/hash nhanh hơn)
+
+_intern = sys.intern
+
+
+def _intern_all(values: Sequence[str]) -> Sequence[str]:
+    """Intern từng string trong list (giữ nguyên thứ tự), empty giữ nguyên _EMPTY"""
+    if not values:
+        return _EMPTY
+    return [_intern(value) for value in values]
 
 
 # =================== ENUMS ===================
 
-class Priority(Enum):
+class _OrdinalEnum(Enum):
+    """
+    String-valued enum kèm int ordinal (0, 1, 2... theo thứ tự khai báo)
+    .value giữ string cho parsing/serialization, ordinal dùng index thẳng vào score tuples
+    """
+    
+    def __new__(cls, value: str):
+        member = object.__new__(cls)
+        member._value_ = value
+        member.ordinal = len(cls.__members__)
+        return member
+
+
+class Priority(_OrdinalEnum):
     LOW = "low"
     MEDIUM = "medium" 
     HIGH = "high"
@@ -35,14 +101,14 @@ class Status(Enum):
     BLOCKED = "blocked"
     CANCELLED = "cancelled"
 
-class BugSeverity(Enum):
+class BugSeverity(_OrdinalEnum):
     TRIVIAL = "trivial"
     MINOR = "minor"
     MAJOR = "major"
     CRITICAL = "critical"
     BLOCKER = "blocker"
 
-class ChangeType(Enum):
+class ChangeType(_OrdinalEnum):
     NEW_FEATURE = "new_feature"
     ENHANCEMENT = "enhancement"
     BUG_FIX = "bug_fix"
@@ -50,16 +116,48 @@ class ChangeType(Enum):
     PERFORMANCE = "performance"
     SECURITY = "security"
 
-class RelationshipType(Enum):
-    DEPENDS_ON = "depends_on"
-    CONFLICTS_WITH = "conflicts_with"
-    ENHANCES = "enhances"
-    BLOCKS = "blocks"
-    RELATED_TO = "related_to"
-    IMPLEMENTS = "implements"
-    TESTS = "tests"
-    FIXES = "fixes"
-    CAUSED_BY = "caused_by"
+class RelType(IntEnum):
+    """
+    Relationship types (int ids liên tục từ 0 - index thẳng vào per-type tables/arrays)
+    String form cho serialization/ids qua .label / RelType.from_label()
+    """
+    # Original relationships
+    DEPENDS_ON = 0
+    CONFLICTS_WITH = 1
+    ENHANCES = 2
+    BLOCKS = 3
+    RELATED_TO = 4
+    IMPLEMENTS = 5
+    TESTS = 6
+    FIXES = 7
+    CAUSED_BY = 8
+    
+    # Relationships for docs and code
+    DOCUMENTS = 9           # Doc documents Feature/Code
+    DESCRIBED_BY = 10       # Feature described by Doc
+    COVERS = 11             # Test covers Code/Feature
+    COVERED_BY = 12         # Code covered by Test
+    IMPORTS = 13            # Code imports Code
+    IMPORTED_BY = 14        # Code imported by Code
+    REFERENCES = 15         # Doc references Code/Feature
+    REFERENCED_BY = 16      # Code/Feature referenced by Doc
+    
+    @property
+    def label(self) -> str:
+        """String value (lowercase name) dùng cho serialization"""
+        return _REL_STRING[self]
+    
+    @classmethod
+    def from_label(cls, label: str) -> "RelType":
+        """Parse string value, raise ValueError nếu không hợp lệ"""
+        try:
+            return _REL_BY_STRING[label]
+        except KeyError:
+            raise ValueError(f"{label!r} is not a valid {cls.__name__}") from None
+
+
+_REL_STRING = tuple(member.name.lower() for member in RelType)
+_REL_BY_STRING = {label: member for label, member in zip(_REL_STRING, RelType)}
 
 class TestType(Enum):
     UNIT = "unit"
@@ -69,7 +167,7 @@ class TestType(Enum):
     SECURITY = "security"
     REGRESSION = "regression"
 
-class FeedbackType(Enum):
+class FeedbackType(_OrdinalEnum):
     BUG_REPORT = "bug_report"
     FEATURE_REQUEST = "feature_request"
     IMPROVEMENT = "improvement"
@@ -77,9 +175,22 @@ class FeedbackType(Enum):
     COMPLIMENT = "compliment"
 
 
+# Score tables index theo enum ordinal (thứ tự khai báo ở trên)
+_PRIORITY_MULTIPLIERS = (1, 2, 3, 4)                  # low, medium, high, critical
+_SEVERITY_SCORES = (1, 2, 4, 6, 8)                    # trivial, minor, major, critical, blocker
+_FEEDBACK_TYPE_SCORES = (5, 3, 2, 1, 1)               # bug_report, feature_request, improvement, question, compliment
+
+# Test types - tuple nhỏ: membership check bằng identity, không hash enum
+_CRITICAL_TEST_TYPES = (TestType.INTEGRATION, TestType.E2E, TestType.SECURITY)
+
+# Số ngày cho một đơn vị staleness theo update_frequency (mặc định monthly)
+_STALENESS_PERIOD_DAYS = {"on_change": 7.0, "weekly": 7.0}  # on_change: stale after 1 week
+_DEFAULT_STALENESS_PERIOD_DAYS = 30.0
+
+
 # =================== CORE ENTITIES ===================
 
-@dataclass
+@dataclass(slots=True)
 class ProjectRequirement:
     """Core project requirements entity"""
     id: str
@@ -90,23 +201,25 @@ class ProjectRequirement:
     project_name: str
     category: str = "functional"
     business_value: str = ""
-    acceptance_criteria: List[str] = field(default_factory=list)
-    stakeholders: List[str] = field(default_factory=list)
-    tags: List[str] = field(default_factory=list)
+    acceptance_criteria: Sequence[str] = _EMPTY
+    stakeholders: Sequence[str] = _EMPTY
+    tags: Sequence[str] = _EMPTY
     estimated_effort: str = "medium"
     actual_effort: Optional[str] = None
-    created_at: datetime = field(default_factory=datetime.now)
-    updated_at: datetime = field(default_factory=datetime.now)
+    created_at_ns: int = field(default_factory=time.time_ns)
+    updated_at_ns: int = field(default_factory=time.time_ns)
     created_by: str = ""
     
+    created_at = _datetime_view("created_at_ns")
+    updated_at = _datetime_view("updated_at_ns")
+    
     def get_complexity_score(self) -> int:
         """Calculate complexity based on criteria count và dependencies"""
         base_score = len(self.acceptance_criteria)
-        priority_multiplier = {"low": 1, "medium": 2, "high": 3, "critical": 4}
-        return base_score * priority_multiplier.get(self.priority.value, 2)
+        return base_score * _PRIORITY_MULTIPLIERS[self.priority.ordinal]
 
 
-@dataclass
+@dataclass(slots=True)
 class Feature:
     """Software feature entity"""
     id: str
@@ -115,14 +228,17 @@ class Feature:
     status: Status
     feature_type: str = "functional"
     module: str = ""
-    file_paths: List[str] = field(default_factory=list)
-    api_endpoints: List[str] = field(default_factory=list)
-    database_tables: List[str] = field(default_factory=list)
-    external_dependencies: List[str] = field(default_factory=list)
+    file_paths: Sequence[str] = _EMPTY
+    api_endpoints: Sequence[str] = _EMPTY
+    database_tables: Sequence[str] = _EMPTY
+    external_dependencies: Sequence[str] = _EMPTY
     performance_requirements: Dict[str, Any] = field(default_factory=dict)
-    security_considerations: List[str] = field(default_factory=list)
-    created_at: datetime = field(default_factory=datetime.now)
-    updated_at: datetime = field(default_factory=datetime.now)
+    security_considerations: Sequence[str] = _EMPTY
+    created_at_ns: int = field(default_factory=time.time_ns)
+    updated_at_ns: int = field(default_factory=time.time_ns)
+    
+    created_at = _datetime_view("created_at_ns")
+    updated_at = _datetime_view("updated_at_ns")
     
     def get_complexity_score(self) -> int:
         """Calculate feature complexity based on dependencies và scope"""
@@ -133,7 +249,7 @@ class Feature:
         return file_score + api_score + db_score + ext_score
 
 
-@dataclass
+@dataclass(slots=True)
 class Bug:
     """Bug tracking entity"""
     id: str
@@ -143,37 +259,39 @@ class Bug:
     priority: Priority
     status: Status
     bug_type: str = "functional"
-    affected_features: List[str] = field(default_factory=list)
-    affected_files: List[str] = field(default_factory=list)
-    steps_to_reproduce: List[str] = field(default_factory=list)
+    affected_features: Sequence[str] = _EMPTY
+    affected_files: Sequence[str] = _EMPTY
+    steps_to_reproduce: Sequence[str] = _EMPTY
     expected_behavior: str = ""
     actual_behavior: str = ""
     environment: Dict[str, str] = field(default_factory=dict)
-    error_logs: List[str] = field(default_factory=list)
+    error_logs: Sequence[str] = _EMPTY
     root_cause: str = ""
     fix_description: str = ""
     regression_risk: str = "medium"
-    created_at: datetime = field(default_factory=datetime.now)
-    updated_at: datetime = field(default_factory=datetime.now)
+    created_at_ns: int = field(default_factory=time.time_ns)
+    updated_at_ns: int = field(default_factory=time.time_ns)
     reported_by: str = ""
     assigned_to: str = ""
     
+    created_at = _datetime_view("created_at_ns")
+    updated_at = _datetime_view("updated_at_ns")
+    
     def get_impact_score(self) -> int:
         """Calculate bug impact based on severity và affected scope"""
-        severity_scores = {"trivial": 1, "minor": 2, "major": 4, "critical": 6, "blocker": 8}
-        base_score = severity_scores.get(self.severity.value, 2)
+        base_score = _SEVERITY_SCORES[self.severity.ordinal]
         affected_multiplier = max(1, len(self.affected_features))
         return base_score * affected_multiplier
 
 
-@dataclass
+@dataclass(slots=True)
 class CodeChange:
     """Code change tracking entity"""
     id: str
     change_type: ChangeType
     title: str
     description: str
-    file_paths: List[str] = field(default_factory=list)
+    file_paths: Sequence[str] = _EMPTY
     lines_added: int = 0
     lines_removed: int = 0
     complexity_delta: int = 0
@@ -181,10 +299,12 @@ class CodeChange:
     security_impact: str = "none"
     breaking_changes: bool = False
     rollback_plan: str = ""
-    created_at: datetime = field(default_factory=datetime.now)
+    created_at_ns: int = field(default_factory=time.time_ns)
     author: str = ""
     reviewer: str = ""
     
+    created_at = _datetime_view("created_at_ns")
+    
     def get_risk_score(self) -> int:
         """Calculate change risk based on size và impact"""
         size_score = (self.lines_added + self.lines_removed) // 10
@@ -193,7 +313,7 @@ class CodeChange:
         return min(10, size_score + complexity_score + breaking_score)
 
 
-@dataclass
+@dataclass(slots=True)
 class Test:
     """Test case entity"""
     id: str
@@ -208,20 +328,22 @@ class Test:
     last_result: str = "unknown"
     flaky_score: float = 0.0
     coverage_percentage: float = 0.0
-    dependencies: List[str] = field(default_factory=list)
-    data_requirements: List[str] = field(default_factory=list)
-    created_at: datetime = field(default_factory=datetime.now)
-    updated_at: datetime = field(default_factory=datetime.now)
+    dependencies: Sequence[str] = _EMPTY
+    data_requirements: Sequence[str] = _EMPTY
+    created_at_ns: int = field(default_factory=time.time_ns)
+    updated_at_ns: int = field(default_factory=time.time_ns)
+    
+    created_at = _datetime_view("created_at_ns")
+    updated_at = _datetime_view("updated_at_ns")
     
     def is_critical(self) -> bool:
         """Check if test is critical based on type và coverage"""
-        critical_types = [TestType.INTEGRATION, TestType.E2E, TestType.SECURITY]
-        return self.test_type in critical_types or self.coverage_percentage > 80
+        return self.test_type in _CRITICAL_TEST_TYPES or self.coverage_percentage > 80
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TestResult:
-    """Test execution result entity"""
+    """Test execution result entity - immutable (kết quả một lần chạy), dùng evolve() để tạo bản sửa"""
     id: str
     test_id: str
     execution_date: datetime
@@ -233,11 +355,18 @@ class TestResult:
     code_version: str = ""
     data_snapshot: str = ""
     
+    def __hash__(self) -> int:
+        return hash(self.id)
+    
+    def evolve(self, **changes) -> "TestResult":
+        """Copy với các fields thay đổi"""
+        return replace(self, **changes)
+    
     def is_failure(self) -> bool:
         return self.result in ["failed", "error"]
 
 
-@dataclass
+@dataclass(slots=True)
 class UserFeedback:
     """User feedback entity"""
     id: str
@@ -246,32 +375,27 @@ class UserFeedback:
     description: str
     priority: Priority
     status: Status
-    related_features: List[str] = field(default_factory=list)
-    related_bugs: List[str] = field(default_factory=list)
+    related_features: Sequence[str] = _EMPTY
+    related_bugs: Sequence[str] = _EMPTY
     user_type: str = "end_user"  # end_user, developer, stakeholder
     business_impact: str = ""
     technical_feasibility: str = ""
     effort_estimate: str = ""
-    created_at: datetime = field(default_factory=datetime.now)
+    created_at_ns: int = field(default_factory=time.time_ns)
     created_by: str = ""
     
+    created_at = _datetime_view("created_at_ns")
+    
     def get_value_score(self) -> int:
         """Calculate feedback value based on type và business impact"""
-        type_scores = {
-            "bug_report": 5,
-            "feature_request": 3,
-            "improvement": 2,
-            "question": 1,
-            "compliment": 1
-        }
-        base_score = type_scores.get(self.feedback_type.value, 1)
+        base_score = _FEEDBACK_TYPE_SCORES[self.feedback_type.ordinal]
         impact_multiplier = len(self.related_features) + len(self.related_bugs)
         return base_score * max(1, impact_multiplier)
 
 
 # =================== DOCUMENTATION & CODE ENTITIES ===================
 
-@dataclass
+@dataclass(slots=True)
 class DocumentEntity:
     """Documentation entity - crucial for auto-updates"""
     id: str
@@ -279,30 +403,47 @@ class DocumentEntity:
     file_path: str
     document_type: str  # README, API_DOC, USER_GUIDE, TECHNICAL_SPEC, CHANGELOG
     content_summary: str = ""
-    related_features: List[str] = field(default_factory=list)
-    related_code_files: List[str] = field(default_factory=list)
-    last_updated: datetime = field(default_factory=datetime.now)
+    related_features: Sequence[str] = _EMPTY
+    related_code_files: Sequence[str] = _EMPTY
+    last_updated_ns: int = field(default_factory=time.time_ns)
     update_frequency: str = "on_change"  # on_change, weekly, monthly
     maintainer: str = ""
     review_required: bool = True
     template_used: str = ""
+    _related_features_set: Optional[frozenset] = field(default=None, init=False, repr=False, compare=False)
+    
+    last_updated = _datetime_view("last_updated_ns")
     
     def needs_update_for_feature(self, feature_id: str) -> bool:
         """Check if document needs update when feature changes"""
-        return feature_id in self.related_features
+        # Set build lazily lần đầu, các lần sau O(1) - sửa related_features qua add_related_feature
+        features = self._related_features_set
+        if features is None:
+            features = self._related_features_set = frozenset(self.related_features)
+        return feature_id in features
+    
+    def add_related_feature(self, feature_id: str) -> None:
+        """Append feature và invalidate cached set"""
+        self.related_features = _as_list(self.related_features)
+        self.related_features.append(feature_id)
+        self._related_features_set = None
     
-    def get_staleness_score(self) -> float:
-        """Calculate how stale the document is"""
-        days_since_update = (datetime.now() - self.last_updated).days
-        if self.update_frequency == "on_change":
-            return min(10.0, days_since_update / 7.0)  # Stale after 1 week
-        elif self.update_frequency == "weekly":
-            return min(10.0, days_since_update / 7.0)
-        else:  # monthly
-            return min(10.0, days_since_update / 30.0)
+    def add_related_code_file(self, file_path: str) -> None:
+        """Append code file"""
+        self.related_code_files = _as_list(self.related_code_files)
+        self.related_code_files.append(file_path)
+    
+    def get_staleness_score(self, now_ns: Optional[int] = None) -> float:
+        """
+        Calculate how stale the document is
+        now_ns: reference time (epoch ns) - truyền vào khi score nhiều docs trong cùng một analysis
+        """
+        days_since_update = ((now_ns or time.time_ns()) - self.last_updated_ns) // _NS_PER_DAY
+        period_days = _STALENESS_PERIOD_DAYS.get(self.update_frequency, _DEFAULT_STALENESS_PERIOD_DAYS)
+        return min(10.0, days_since_update / period_days)
 
 
-@dataclass
+@dataclass(slots=True)
 class CodeFileEntity:
     """Code file entity - crucial for impact analysis"""
     id: str
@@ -310,17 +451,26 @@ class CodeFileEntity:
     file_type: str  # SOURCE, TEST, CONFIG, SCRIPT, SCHEMA
     language: str = "python"
     module_name: str = ""
-    classes: List[str] = field(default_factory=list)
-    functions: List[str] = field(default_factory=list)
-    dependencies: List[str] = field(default_factory=list)  # Other files this depends on
-    dependents: List[str] = field(default_factory=list)   # Files that depend on this
-    test_files: List[str] = field(default_factory=list)   # Tests that cover this file
-    documentation_files: List[str] = field(default_factory=list)  # Docs that describe this
+    classes: Sequence[str] = _EMPTY
+    functions: Sequence[str] = _EMPTY
+    dependencies: Sequence[str] = _EMPTY  # Other files this depends on
+    dependents: Sequence[str] = _EMPTY   # Files that depend on this
+    test_files: Sequence[str] = _EMPTY   # Tests that cover this file
+    documentation_files: Sequence[str] = _EMPTY  # Docs that describe this
     complexity_score: int = 0
     lines_of_code: int = 0
     test_coverage: float = 0.0
-    last_modified: datetime = field(default_factory=datetime.now)
-    last_tested: Optional[datetime] = None
+    last_modified_ns: int = field(default_factory=time.time_ns)
+    last_tested_ns: Optional[int] = None
+    
+    last_modified = _datetime_view("last_modified_ns")
+    last_tested = _datetime_view("last_tested_ns")
+    
+    def __post_init__(self):
+        self.file_path = _intern(self.file_path)
+        self.dependencies = _intern_all(self.dependencies)
+        self.dependents = _intern_all(self.dependents)
+        self.test_files = _intern_all(self.test_files)
     
     def get_impact_score(self) -> int:
         """Calculate impact score based on dependencies"""
@@ -330,146 +480,400 @@ class CodeFileEntity:
     
     def needs_testing(self) -> bool:
         """Check if file needs testing based on changes"""
-        if not self.last_tested:
+        if self.last_tested_ns is None:
             return True
-        return self.last_modified > self.last_tested
+        return self.last_modified_ns > self.last_tested_ns
 
 
-@dataclass
+@dataclass(slots=True)
 class TestCoverage:
     """Test coverage mapping entity"""
     id: str
     test_file: str
-    covered_files: List[str] = field(default_factory=list)
-    covered_functions: List[str] = field(default_factory=list)
-    covered_features: List[str] = field(default_factory=list)
+    covered_files: Sequence[str] = _EMPTY
+    covered_functions: Sequence[str] = _EMPTY
+    covered_features: Sequence[str] = _EMPTY
     coverage_percentage: float = 0.0
-    test_types: List[TestType] = field(default_factory=list)
+    test_types: Sequence[TestType] = _EMPTY
     execution_time: float = 0.0
     last_run: Optional[datetime] = None
     success_rate: float = 100.0
+    _covered_files_set: Optional[frozenset] = field(default=None, init=False, repr=False, compare=False)
+    _covered_features_set: Optional[frozenset] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.test_file = _intern(self.test_file)
+        self.covered_files = _intern_all(self.covered_files)
+        self.covered_features = _intern_all(self.covered_features)
     
     def covers_file(self, file_path: str) -> bool:
         """Check if this test covers a specific file"""
-        return file_path in self.covered_files
+        files = self._covered_files_set
+        if files is None:
+            files = self._covered_files_set = frozenset(self.covered_files)
+        return file_path in files
     
     def covers_feature(self, feature_id: str) -> bool:
         """Check if this test covers a specific feature"""
-        return feature_id in self.covered_features
+        features = self._covered_features_set
+        if features is None:
+            features = self._covered_features_set = frozenset(self.covered_features)
+        return feature_id in features
+    
+    def add_covered_file(self, file_path: str) -> None:
+        """Append covered file và invalidate cached set"""
+        self.covered_files = _as_list(self.covered_files)
+        self.covered_files.append(_intern(file_path))
+        self._covered_files_set = None
+    
+    def add_covered_feature(self, feature_id: str) -> None:
+        """Append covered feature và invalidate cached set"""
+        self.covered_features = _as_list(self.covered_features)
+        self.covered_features.append(_intern(feature_id))
+        self._covered_features_set = None
 
 
 # =================== RELATIONSHIP ENTITIES ===================
 
-@dataclass
+@dataclass(slots=True)
 class EntityRelationship:
-    """Generic relationship between any two entities"""
-    id: str
+    """
+    Generic relationship between any two entities
+    id: string hoặc tuple key (factories dùng tuple - hash trên parts có sẵn, không build string);
+    id_str cho storage boundaries cần string id
+    """
+    id: Union[str, Tuple[str, ...]]
     source_entity_type: str
     source_entity_id: str
     target_entity_type: str
     target_entity_id: str
-    relationship_type: RelationshipType
+    relationship_type: RelType
     strength: float = 1.0  # 0.0 to 1.0
     confidence: float = 1.0  # 0.0 to 1.0
     bidirectional: bool = False
     metadata: Dict[str, Any] = field(default_factory=dict)
-    created_at: datetime = field(default_factory=datetime.now)
+    created_at_ns: int = field(default_factory=time.time_ns)
     created_by: str = "system"
+    _id_str: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    
+    created_at = _datetime_view("created_at_ns")
+    
+    @property
+    def id_str(self) -> str:
+        """String form của id (tuple parts nối bằng "_"), build lazily và cache"""
+        id_str = self._id_str
+        if id_str is None:
+            id_str = self._id_str = self.id if isinstance(self.id, str) else "_".join(self.id)
+        return id_str
+    
+    @classmethod
+    def _fast_new(cls, rel_id: Tuple[str, ...], source_type: str, source_id: str,
+                  target_type: str, target_id: str, rel_type: RelType,
+                  strength: float = 1.0, metadata: Optional[Dict[str, Any]] = None) -> "EntityRelationship":
+        """
+        Constructor nhanh cho relationship factories: object.__new__ + gán slots trực tiếp,
+        bỏ qua dataclass __init__ (kwargs + default_factory calls)
+        Phải gán đủ mọi field - thêm field mới thì update ở đây
+        """
+        rel = object.__new__(cls)
+        rel.id = rel_id
+        rel.source_entity_type = source_type
+        rel.source_entity_id = source_id
+        rel.target_entity_type = target_type
+        rel.target_entity_id = target_id
+        rel.relationship_type = rel_type
+        rel.strength = strength
+        rel.confidence = 1.0
+        rel.bidirectional = False
+        rel.metadata = {} if metadata is None else metadata
+        rel.created_at_ns = time.time_ns()
+        rel.created_by = "system"
+        rel._id_str = None
+        return rel
     
     def get_weight(self) -> float:
         """Calculate relationship weight for graph algorithms"""
         return self.strength * self.confidence
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ImpactAnalysis:
-    """Impact analysis result entity"""
+    """Impact analysis result entity - immutable, dùng evolve() để tạo bản sửa"""
     id: str
     source_change_id: str
     source_change_type: str
-    affected_entities: List[Dict[str, Any]] = field(default_factory=list)
+    affected_entities: Sequence[Dict[str, Any]] = _EMPTY
     risk_level: str = "medium"
-    recommended_tests: List[str] = field(default_factory=list)
+    recommended_tests: Sequence[str] = _EMPTY
     estimated_effort: str = ""
     confidence_score: float = 0.8
-    analysis_date: datetime = field(default_factory=datetime.now)
+    analysis_date_ns: int = field(default_factory=time.time_ns)
+    
+    analysis_date = _datetime_view("analysis_date_ns")
+    
+    def __hash__(self) -> int:
+        return hash(self.id)
+    
+    def evolve(self, **changes) -> "ImpactAnalysis":
+        """Copy với các fields thay đổi"""
+        return replace(self, **changes)
     
     def get_total_impact_score(self) -> int:
         """Calculate total impact score"""
         return len(self.affected_entities) * len(self.recommended_tests)
 
 
-# =================== ENHANCED RELATIONSHIP TYPES ===================
+# =================== ADJACENCY INDEX ===================
 
-class ExtendedRelationshipType(Enum):
-    # Original relationships
-    DEPENDS_ON = "depends_on"
-    CONFLICTS_WITH = "conflicts_with"
-    ENHANCES = "enhances"
-    BLOCKS = "blocks"
-    RELATED_TO = "related_to"
-    IMPLEMENTS = "implements"
-    TESTS = "tests"
-    FIXES = "fixes"
-    CAUSED_BY = "caused_by"
-    
-    # New relationships for docs and code
-    DOCUMENTS = "documents"           # Doc documents Feature/Code
-    DESCRIBED_BY = "described_by"     # Feature described by Doc
-    COVERS = "covers"                 # Test covers Code/Feature
-    COVERED_BY = "covered_by"         # Code covered by Test
-    IMPORTS = "imports"               # Code imports Code
-    IMPORTED_BY = "imported_by"       # Code imported by Code
-    REFERENCES = "references"         # Doc references Code/Feature
-    REFERENCED_BY = "referenced_by"   # Code/Feature referenced by Doc
+class AdjacencyIndex:
+    """
+    Read-only adjacency index dạng CSR (compressed sparse row)
+    Node keys map sang int ids một lần; neighbors của tất cả nodes nằm liên tục trong một
+    array('i'), offsets[i]:offsets[i + 1] là slice của node i - không cần list object per node
+    """
+    
+    __slots__ = ("_node_ids", "_nodes", "_offsets", "_neighbors")
+    
+    def __init__(self, edges: Iterable[Tuple[str, str]]):
+        """Build index từ (source, target) edges"""
+        self._node_ids: Dict[str, int] = {}
+        self._nodes: List[str] = []
+        
+        sources = array("i")
+        targets = array("i")
+        for source, target in edges:
+            sources.append(self._node_id(source))
+            targets.append(self._node_id(target))
+        
+        # Counting sort theo source: đếm out-degree -> prefix sums -> đặt targets vào slot
+        counts = [0] * (len(self._nodes) + 1)
+        for source in sources:
+            counts[source + 1] += 1
+        self._offsets = array("i", accumulate(counts))
+        
+        self._neighbors = array("i", bytes(targets.itemsize * len(targets)))
+        cursor = self._offsets.tolist()
+        for source, target in zip(sources, targets):
+            self._neighbors[cursor[source]] = target
+            cursor[source] += 1
+    
+    def _node_id(self, key: str) -> int:
+        node_id = self._node_ids.get(key)
+        if node_id is None:
+            node_id = self._node_ids[key] = len(self._nodes)
+            self._nodes.append(_intern(key))
+        return node_id
+    
+    def neighbors(self, key: str) -> Tuple[str, ...]:
+        """Neighbors của node theo thứ tự insert (empty nếu node không có trong index)"""
+        node_id = self._node_ids.get(key)
+        if node_id is None:
+            return ()
+        nodes = self._nodes
+        offsets = self._offsets
+        return tuple(nodes[i] for i in self._neighbors[offsets[node_id]:offsets[node_id + 1]])
+    
+    def __len__(self) -> int:
+        """Số edges"""
+        return len(self._neighbors)
+
+
+def build_coverage_indexes(all_test_coverage: List[TestCoverage]) -> Tuple[AdjacencyIndex, AdjacencyIndex]:
+    """
+    Build (file -> test files, feature -> test files) indexes từ coverage mappings
+    Build một lần và truyền vào get_tests_to_run khi query nhiều lần trên cùng coverage data
+    """
+    files_index = AdjacencyIndex(
+        (file_path, coverage.test_file)
+        for coverage in all_test_coverage for file_path in coverage.covered_files
+    )
+    features_index = AdjacencyIndex(
+        (feature_id, coverage.test_file)
+        for coverage in all_test_coverage for feature_id in coverage.covered_features
+    )
+    return files_index, features_index
+
+
+class MemoryGraphIndex:
+    """
+    Reverse indexes feature id / code file path -> documents
+    Build một lần cho cả session, update incremental khi documents hoặc relations thay đổi
+    """
+    
+    __slots__ = ("feature_to_docs", "codefile_to_docs")
+    
+    def __init__(self, docs: Iterable[DocumentEntity] = ()):
+        self.feature_to_docs: Dict[str, List[DocumentEntity]] = defaultdict(list)
+        self.codefile_to_docs: Dict[str, List[DocumentEntity]] = defaultdict(list)
+        for doc in docs:
+            self.add_document(doc)
+    
+    def add_document(self, doc: DocumentEntity) -> None:
+        """Index document mới theo related features/code files hiện có"""
+        for feature_id in doc.related_features:
+            self.feature_to_docs[feature_id].append(doc)
+        for file_path in doc.related_code_files:
+            self.codefile_to_docs[file_path].append(doc)
+    
+    def add_related_feature(self, doc: DocumentEntity, feature_id: str) -> None:
+        """Thêm feature vào doc.related_features và update index"""
+        doc.add_related_feature(feature_id)
+        self.feature_to_docs[feature_id].append(doc)
+    
+    def add_related_code_file(self, doc: DocumentEntity, file_path: str) -> None:
+        """Thêm code file vào doc.related_code_files và update index"""
+        doc.add_related_code_file(file_path)
+        self.codefile_to_docs[file_path].append(doc)
+    
+    def documents_for(self, feature_ids: Iterable[str], file_paths: Iterable[str]) -> List[DocumentEntity]:
+        """Documents liên quan đến bất kỳ feature/file nào (mỗi doc một lần, theo thứ tự gặp)"""
+        # Key theo object identity - dataclass eq=True nên documents không hashable
+        found: Dict[int, DocumentEntity] = {}
+        for feature_id in feature_ids:
+            for doc in self.feature_to_docs.get(feature_id, ()):
+                found.setdefault(id(doc), doc)
+        for file_path in file_paths:
+            for doc in self.codefile_to_docs.get(file_path, ()):
+                found.setdefault(id(doc), doc)
+        return list(found.values())
+
+
+# =================== RELATIONSHIP TABLE ===================
+
+class _KeyRegistry:
+    """Map string keys sang dense int ids (0, 1, 2...) và ngược lại"""
+    
+    __slots__ = ("_ids", "keys")
+    
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self.keys: List[str] = []
+    
+    def id_for(self, key: str) -> int:
+        key_id = self._ids.get(key)
+        if key_id is None:
+            key_id = self._ids[key] = len(self.keys)
+            self.keys.append(_intern(key))
+        return key_id
+
+
+class RelationshipTable:
+    """
+    Columnar (SoA) edge storage cho graph algorithms
+    Mỗi field là một array.array liên tục; entity types và entity ids map sang ints qua registries,
+    relationship type lưu thẳng RelType int. EntityRelationship vẫn là API chính - table là view cho bulk compute
+    """
+    
+    __slots__ = (
+        "entity_types", "entity_ids",
+        "_src_type", "_src_id", "_dst_type", "_dst_id", "_rel", "_strength", "_confidence"
+    )
+    
+    # (column, numpy dtype) - thứ tự field của structured array trong as_arrays()
+    _DTYPE = (
+        ("src_type", "u1"), ("src_id", "i8"), ("dst_type", "u1"), ("dst_id", "i8"),
+        ("rel", "u1"), ("strength", "f4"), ("confidence", "f4"),
+    )
+    
+    def __init__(self):
+        self.entity_types = _KeyRegistry()
+        self.entity_ids = _KeyRegistry()
+        self._src_type = array("B")
+        self._src_id = array("q")
+        self._dst_type = array("B")
+        self._dst_id = array("q")
+        self._rel = array("B")
+        self._strength = array("f")
+        self._confidence = array("f")
+    
+    def add_edge(self, source_type: str, source_id: str, target_type: str, target_id: str,
+                 relationship_type: RelType, strength: float = 1.0, confidence: float = 1.0) -> int:
+        """Append một edge, returns row index"""
+        self._src_type.append(self.entity_types.id_for(source_type))
+        self._src_id.append(self.entity_ids.id_for(source_id))
+        self._dst_type.append(self.entity_types.id_for(target_type))
+        self._dst_id.append(self.entity_ids.id_for(target_id))
+        self._rel.append(relationship_type)
+        self._strength.append(strength)
+        self._confidence.append(confidence)
+        return len(self._rel) - 1
+    
+    def add_relationship(self, rel: EntityRelationship) -> int:
+        """Append edge từ EntityRelationship"""
+        return self.add_edge(
+            rel.source_entity_type, rel.source_entity_id,
+            rel.target_entity_type, rel.target_entity_id,
+            rel.relationship_type, rel.strength, rel.confidence
+        )
+    
+    def __len__(self) -> int:
+        return len(self._rel)
+    
+    def as_arrays(self):
+        """
+        Export thành numpy structured array (một record per edge)
+        numpy import lazy - chỉ cần khi export
+        """
+        import numpy as np
+        
+        table = np.empty(len(self), dtype=np.dtype(list(self._DTYPE)))
+        for column, dtype in self._DTYPE:
+            table[column] = np.frombuffer(getattr(self, "_" + column), dtype=dtype)
+        return table
+    
+    def weights(self):
+        """EntityRelationship.get_weight cho tất cả edges (numpy float32 array)"""
+        import numpy as np
+        
+        return np.frombuffer(self._strength, dtype="f4") * np.frombuffer(self._confidence, dtype="f4")
 
 
 # =================== HELPER FUNCTIONS ===================
 
 def create_relationship(source_type: str, source_id: str, 
                        target_type: str, target_id: str,
-                       rel_type: RelationshipType,
-                       strength: float = 1.0) -> EntityRelationship:
-    """Helper function to create relationships"""
-    return EntityRelationship(
-        id=f"{source_type}_{source_id}_{rel_type.value}_{target_type}_{target_id}",
-        source_entity_type=source_type,
-        source_entity_id=source_id,
-        target_entity_type=target_type,
-        target_entity_id=target_id,
-        relationship_type=rel_type,
-        strength=strength
+                       rel_type: RelType,
+                       strength: float = 1.0,
+                       table: Optional[RelationshipTable] = None) -> EntityRelationship:
+    """
+    Helper function to create relationships
+    table: nếu có, edge cũng được append vào RelationshipTable
+    """
+    rel = EntityRelationship._fast_new(
+        (source_type, source_id, _REL_STRING[rel_type], target_type, target_id),
+        source_type, source_id, target_type, target_id, rel_type, strength
     )
+    if table is not None:
+        table.add_relationship(rel)
+    return rel
 
 
 def create_doc_code_relationship(doc_id: str, code_file_id: str, 
-                               relationship_type: ExtendedRelationshipType) -> EntityRelationship:
+                               relationship_type: RelType,
+                               table: Optional[RelationshipTable] = None) -> EntityRelationship:
     """Helper to create document-code relationships"""
-    return EntityRelationship(
-        id=f"doc_{doc_id}_{relationship_type.value}_code_{code_file_id}",
-        source_entity_type="document",
-        source_entity_id=doc_id,
-        target_entity_type="code_file",
-        target_entity_id=code_file_id,
-        relationship_type=relationship_type,
-        strength=1.0,
+    rel = EntityRelationship._fast_new(
+        ("doc", doc_id, _REL_STRING[relationship_type], "code", code_file_id),
+        "document", doc_id, "code_file", code_file_id, relationship_type,
         metadata={"auto_update": True}
     )
+    if table is not None:
+        table.add_relationship(rel)
+    return rel
 
 
 def create_test_coverage_relationship(test_id: str, target_id: str, 
-                                    target_type: str) -> EntityRelationship:
+                                    target_type: str,
+                                    table: Optional[RelationshipTable] = None) -> EntityRelationship:
     """Helper to create test coverage relationships"""
-    return EntityRelationship(
-        id=f"test_{test_id}_covers_{target_type}_{target_id}",
-        source_entity_type="test",
-        source_entity_id=test_id,
-        target_entity_type=target_type,
-        target_entity_id=target_id,
-        relationship_type=ExtendedRelationshipType.COVERS,
-        strength=1.0,
+    rel = EntityRelationship._fast_new(
+        ("test", test_id, "covers", target_type, target_id),
+        "test", test_id, target_type, target_id, RelType.COVERS,
         metadata={"coverage_type": "automated"}
     )
+    if table is not None:
+        table.add_relationship(rel)
+    return rel
 
 
 def calculate_comprehensive_change_impact(change: CodeChange, 
@@ -479,34 +883,42 @@ def calculate_comprehensive_change_impact(change: CodeChange,
                                         related_code_files: List[CodeFileEntity]) -> ImpactAnalysis:
     """Calculate comprehensive impact including docs and code files"""
     affected_entities = []
+    add_entity = affected_entities.append
+    change_paths = frozenset(change.file_paths)
+    now_ns = time.time_ns()  # Một reference time cho cả analysis
     
     # Add affected features
     for feature in related_features:
-        affected_entities.append({
+        add_entity({
             "type": "feature",
             "id": feature.id,
             "name": feature.name,
-            "impact_level": "high" if any(path in change.file_paths for path in feature.file_paths) else "medium",
+            "impact_level": "medium" if change_paths.isdisjoint(feature.file_paths) else "high",
             "action_required": "update_implementation"
         })
     
     # Add affected documents - CRUCIAL for auto-updates
+    # doc_count/code_count đếm ngay khi append - không cần scan lại affected_entities để tính risk
+    doc_count = 0
     for doc in related_docs:
         if doc.needs_update_for_feature(change.id):
-            affected_entities.append({
+            doc_count += 1
+            add_entity({
                 "type": "document",
                 "id": doc.id,
                 "name": doc.title,
                 "file_path": doc.file_path,
                 "impact_level": "high" if doc.update_frequency == "on_change" else "medium",
                 "action_required": "update_documentation",
-                "staleness_score": doc.get_staleness_score()
+                "staleness_score": doc.get_staleness_score(now_ns)
             })
     
     # Add affected code files - CRUCIAL for dependency tracking
+    code_count = 0
     for code_file in related_code_files:
         if code_file.needs_testing():
-            affected_entities.append({
+            code_count += 1
+            add_entity({
                 "type": "code_file",
                 "id": code_file.id,
                 "name": code_file.file_path,
@@ -516,74 +928,96 @@ def calculate_comprehensive_change_impact(change: CodeChange,
                 "dependencies": code_file.dependencies
             })
     
-    # Add recommended tests - Enhanced with coverage info
-    recommended_tests = []
-    for test in related_tests:
-        if test.is_critical():
-            recommended_tests.append({
-                "test_id": test.id,
-                "test_file": test.file_path,
-                "priority": "high" if test.test_type in [TestType.INTEGRATION, TestType.E2E] else "medium",
-                "estimated_time": test.execution_time
-            })
+    # Add recommended tests - chỉ critical tests (result chỉ giữ test ids)
+    recommended_tests = [test.id for test in related_tests if test.is_critical()]
     
     # Calculate comprehensive risk level
-    base_risk = change.get_risk_score()
-    doc_risk = len([e for e in affected_entities if e["type"] == "document"])
-    code_risk = len([e for e in affected_entities if e["type"] == "code_file"]) * 2
-    total_risk = base_risk + doc_risk + code_risk
+    total_risk = change.get_risk_score() + doc_count + code_count * 2
     
     risk_level = "critical" if total_risk > 15 else "high" if total_risk > 10 else "medium" if total_risk > 5 else "low"
     
     return ImpactAnalysis(
-        id=f"impact_{change.id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+        id=f"impact_{change.id}_{_ns_to_datetime(now_ns).strftime('%Y%m%d_%H%M%S')}",
         source_change_id=change.id,
         source_change_type=change.change_type.value,
         affected_entities=affected_entities,
         risk_level=risk_level,
-        recommended_tests=[t["test_id"] for t in recommended_tests],
+        recommended_tests=recommended_tests,
         estimated_effort=f"{len(affected_entities) * 1.5} hours",
         confidence_score=0.9,
-        analysis_date=datetime.now()
+        analysis_date_ns=now_ns
     )
 
 
+# =================== BATCH SCORING ===================
+# Vectorized versions của per-entity scores khi score cả project một lần
+# numpy import lazy - chỉ cần khi gọi batch APIs
+
+def batch_impact_scores(code_files: List[CodeFileEntity]):
+    """
+    CodeFileEntity.get_impact_score cho nhiều files một lần
+    Returns numpy int array, cùng thứ tự với code_files
+    """
+    import numpy as np
+    
+    count = len(code_files)
+    dependents = np.fromiter((len(cf.dependents) for cf in code_files), dtype=np.int64, count=count)
+    complexity = np.fromiter((cf.complexity_score for cf in code_files), dtype=np.int64, count=count)
+    return dependents * 2 + np.minimum(5, complexity // 10)
+
+
+def batch_risk_scores(changes: List[CodeChange]):
+    """
+    CodeChange.get_risk_score cho nhiều changes một lần
+    Returns numpy int array, cùng thứ tự với changes
+    """
+    import numpy as np
+    
+    count = len(changes)
+    lines = np.fromiter((c.lines_added + c.lines_removed for c in changes), dtype=np.int64, count=count)
+    complexity = np.fromiter((c.complexity_delta for c in changes), dtype=np.int64, count=count)
+    breaking = np.fromiter((c.breaking_changes for c in changes), dtype=np.int64, count=count)
+    return np.minimum(10, lines // 10 + np.abs(complexity) + breaking * 10)
+
+
 def get_documents_to_update(feature_changes: List[str], 
                           code_changes: List[str],
-                          all_docs: List[DocumentEntity]) -> List[DocumentEntity]:
-    """Get documents that need updating based on changes"""
-    docs_to_update = []
-    
-    for doc in all_docs:
-        # Check if any changed features are related to this doc
-        if any(feature_id in doc.related_features for feature_id in feature_changes):
-            docs_to_update.append(doc)
-        
-        # Check if any changed code files are related to this doc
-        if any(code_file in doc.related_code_files for code_file in code_changes):
-            docs_to_update.append(doc)
-    
-    return docs_to_update
+                          all_docs: List[DocumentEntity],
+                          index: Optional[MemoryGraphIndex] = None) -> List[DocumentEntity]:
+    """
+    Get documents that need updating based on changes
+    index: MemoryGraphIndex đã build sẵn trên all_docs - lookup theo changes thay vì scan all docs
+    """
+    if index is None:
+        index = MemoryGraphIndex(all_docs)
+    return index.documents_for(feature_changes, code_changes)
 
 
 def get_tests_to_run(code_changes: List[str],
                     feature_changes: List[str],
                     all_code_files: List[CodeFileEntity],
-                    all_test_coverage: List[TestCoverage]) -> List[str]:
-    """Get comprehensive list of tests to run based on changes"""
+                    all_test_coverage: List[TestCoverage],
+                    coverage_indexes: Optional[Tuple[AdjacencyIndex, AdjacencyIndex]] = None) -> List[str]:
+    """
+    Get comprehensive list of tests to run based on changes
+    coverage_indexes: kết quả build_coverage_indexes(all_test_coverage) nếu đã build sẵn
+    """
     tests_to_run = set()
     
+    # Build sets một lần - mỗi membership test là O(1) thay vì scan list
+    changed_files = frozenset(code_changes)
+    changed_features = frozenset(feature_changes)
+    
     # Get tests for changed code files
     for code_file in all_code_files:
-        if code_file.file_path in code_changes and code_file.needs_testing():
+        if code_file.file_path in changed_files and code_file.needs_testing():
             tests_to_run.update(code_file.test_files)
     
-    # Get tests that cover changed features
-    for coverage in all_test_coverage:
-        if any(feature_id in coverage.covered_features for feature_id in feature_changes):
-            tests_to_run.add(coverage.test_file)
-        
-        if any(file_path in coverage.covered_files for file_path in code_changes):
-            tests_to_run.add(coverage.test_file)
+    # Get tests that cover changed features/files - lookup theo changed items thay vì scan coverage
+    files_index, features_index = coverage_indexes or build_coverage_indexes(all_test_coverage)
+    for file_path in changed_files:
+        tests_to_run.update(files_index.neighbors(file_path))
+    for feature_id in changed_features:
+        tests_to_run.update(features_index.neighbors(feature_id))
     
     return list(tests_to_run)
@@ -4,21 +4,50 @@ SRP: Core logic cho automatic impact analysis, dependency tracking, intelligent
 Capabilities: Auto-analyze changes → Track dependencies → Recommend tests → Ensure code quality
 """
 
+import asyncio
+import copy
+import itertools
 import logging
-from typing import Dict, Any, List, Optional
-from datetime import datetime
-import uuid
+import re
+import secrets
+import time
+from collections import OrderedDict
+from typing import AbstractSet, Awaitable, Callable, Dict, Any, Iterable, List, Optional, Set, Tuple
 
 from ..models.memory_models import (
     ProjectRequirement, Feature, Bug, CodeChange, Test, UserFeedback,
     DocumentEntity, CodeFileEntity, TestCoverage, Priority, Status, 
     BugSeverity, ChangeType, FeedbackType, TestType,
+    AdjacencyIndex, MemoryGraphIndex, build_coverage_indexes,
     calculate_comprehensive_change_impact, get_documents_to_update, get_tests_to_run
 )
-from ..models.gemini_client import GeminiClient
+from ..models.gemini_client import GeminiAnalysisError, GeminiClient
 from ..utils.logger import get_logger
 
 
+# Entity IDs: random prefix một lần mỗi process + monotonic counter
+# (không cần uuid4/os.urandom mỗi lần store - IDs chỉ cần unique trong process)
+_id_prefix = secrets.token_hex(3)
+_id_counter = itertools.count()
+
+
+def _new_id(kind: str) -> str:
+    """Generate entity ID dạng '{kind}_{prefix}{counter}'"""
+    return f"{kind}_{_id_prefix}{next(_id_counter):05x}"
+
+
+# Search: tokenize lowercase text, queries ngắn hơn ngưỡng này scan toàn bộ
+_SEARCH_TOKEN_RE = re.compile(r"\w+")
+_SEARCH_MIN_QUERY_LEN = 3
+
+# Timeout cho Gemini analysis chạy nền trong store_* (quá hạn thì lưu entity không kèm analysis)
+_ANALYSIS_TIMEOUT_S = 30.0
+
+# Số Gemini analyses (requirement/dependency) giữ trong LRU cache, và thời gian mỗi entry còn hiệu lực
+_ANALYSIS_CACHE_SIZE = 512
+_ANALYSIS_CACHE_TTL_S = 3600.0
+
+
 class MemoryService:
     """
     Core business logic cho memory management - SOLID compliant
@@ -45,6 +74,36 @@ class MemoryService:
         self._code_files: Dict[str, CodeFileEntity] = {}
         self._test_coverage: Dict[str, TestCoverage] = {}
         self._user_feedback: Dict[str, UserFeedback] = {}
+        
+        # Test categories materialize lúc register (_register_test) - test plan không phải filter toàn bộ tests
+        self._critical_test_ids: Set[str] = set()
+        self._test_ids_by_type: Dict[TestType, Set[str]] = {test_type: set() for test_type in TestType}
+        self._total_test_time = 0.0
+        
+        # Coverage indexes snapshot theo version - _test_coverage chỉ mutate qua _register_test_coverage
+        self._test_coverage_version = 0
+        self._coverage_snapshot: Optional[Tuple[int, Tuple[AdjacencyIndex, AdjacencyIndex]]] = None
+        
+        # Reverse index feature/code file -> documents (documents add qua _register_document)
+        self._doc_index = MemoryGraphIndex(self._documents.values())
+        
+        # Inverted search index: kind -> token -> entity ids, + thứ tự index để giữ result order
+        self._search_index: Dict[str, Dict[str, Set[str]]] = {"requirement": {}, "feature": {}, "bug": {}}
+        self._search_order: Dict[str, int] = {}
+        # Số entities đã index theo kind - store lớn hơn nghĩa là có entity ghi thẳng vào store
+        self._search_indexed_count: Dict[str, int] = {"requirement": 0, "feature": 0, "bug": 0}
+        # Lowercased (title, description) cache theo entity id - entities là slotted dataclasses
+        # nên cache nằm ở service thay vì attribute trên object
+        self._search_text: Dict[str, Tuple[str, str]] = {}
+        
+        # Gemini analysis LRU + in-flight requests (concurrent calls cùng key share một request)
+        # Cache values: (expires_at theo time.monotonic, analysis)
+        self._analysis_cache: "OrderedDict[Tuple[str, ...], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._analysis_inflight: Dict[Tuple[str, ...], "asyncio.Future[Dict[str, Any]]"] = {}
+        
+        # Feature dependency graph (undirected adjacency) + DFS traversal cache
+        self._feature_graph: Dict[str, Set[str]] = {}
+        self._traversal_cache: Dict[Tuple[str, int], Tuple[str, ...]] = {}
     
     # =================== CORE STORAGE METHODS ===================
     
@@ -56,7 +115,7 @@ class MemoryService:
         """
         try:
             # Generate unique ID
-            req_id = f"req_{uuid.uuid4().hex[:8]}"
+            req_id = _new_id("req")
             
             # Analyze với Gemini (SRP: delegate analysis)
             analysis = await self._analyze_requirement(requirement, project_name)
@@ -68,6 +127,7 @@ class MemoryService:
             
             # Store in repository
             self._requirements[req_id] = req_obj
+            self._index_for_search("requirement", req_id, req_obj.title, req_obj.description)
             
             self.logger.info(f"✅ Stored requirement: {req_id}")
             return f"✅ Lưu requirement thành công: {req_id}\n\n**Thông tin:**\n- Priority: {priority}\n- Category: {analysis.get('category', 'functional')}\n- Complexity: {analysis.get('complexity', 'medium')}"
@@ -89,7 +149,8 @@ class MemoryService:
             )
             
             # Store dependency info
-            dependency_id = f"dep_{uuid.uuid4().hex[:8]}"
+            dependency_id = _new_id("dep")
+            self._add_feature_edge(feature_a, feature_b)
             
             self.logger.info(f"✅ Stored dependency: {feature_a} -> {feature_b}")
             return f"✅ Lưu dependency thành công: {feature_a} {relationship_type} {feature_b}\n\n**Impact Analysis:**\n- Risk Score: {analysis.get('risk_score', 5)}/10\n- Impact Areas: {', '.join(analysis.get('impact_areas', []))}\n- Mitigation: {', '.join(analysis.get('mitigation_strategies', []))}"
@@ -105,7 +166,7 @@ class MemoryService:
         NEW: Enhanced với doc/code tracking
         """
         try:
-            bug_id = f"bug_{uuid.uuid4().hex[:8]}"
+            bug_id = _new_id("bug")
             affected_features = affected_features or []
             
             # Create bug object
@@ -117,11 +178,11 @@ class MemoryService:
                 priority=Priority.HIGH if severity in ["critical", "blocker"] else Priority.MEDIUM,
                 status=Status.OPEN,
                 affected_features=affected_features,
-                created_at=datetime.now(),
                 reported_by="user"
             )
             
             self._bugs[bug_id] = bug
+            self._index_for_search("bug", bug_id, title, description)
             
             # Analyze impact
             impact_score = bug.get_impact_score()
@@ -140,40 +201,80 @@ class MemoryService:
         NEW: Enhanced với doc/code tracking
         """
         try:
-            change_id = f"change_{uuid.uuid4().hex[:8]}"
-            
             # Create code change object
-            change = CodeChange(
-                id=change_id,
-                change_type=ChangeType(change_type),
-                title=title,
-                description=title,
-                file_paths=file_paths,
-                lines_added=lines_added,
-                lines_removed=lines_removed,
-                created_at=datetime.now(),
-                author="user"
-            )
+            change = self._create_code_change_object(title, change_type, file_paths, lines_added, lines_removed)
+            change_id = change.id
+            
+            # Start Gemini analysis ngay - network call chạy song song với local work bên dưới
+            impact_task = asyncio.create_task(self._analyze_code_change_comprehensive_impact(change))
             
             self._code_changes[change_id] = change
+            risk_score = change.get_risk_score()
             
             # Analyze comprehensive impact
-            impact_analysis = await self._analyze_code_change_comprehensive_impact(change)
+            try:
+                impact_analysis = await asyncio.wait_for(impact_task, _ANALYSIS_TIMEOUT_S)
+            except asyncio.TimeoutError:
+                self.logger.warning(f"Impact analysis timed out for code change: {change_id}")
+                impact_analysis = {}
             
             self.logger.info(f"✅ Stored code change: {change_id}")
-            return f"✅ Lưu code change thành công: {change_id}\n\n**Impact Analysis:**\n- Risk Score: {change.get_risk_score()}/10\n- Files Changed: {len(file_paths)}\n- Lines: +{lines_added}/-{lines_removed}\n- Affected Entities: {len(impact_analysis.get('affected_entities', []))}"
+            return f"✅ Lưu code change thành công: {change_id}\n\n**Impact Analysis:**\n- Risk Score: {risk_score}/10\n- Files Changed: {len(file_paths)}\n- Lines: +{lines_added}/-{lines_removed}\n- Affected Entities: {len(impact_analysis.get('affected_entities', []))}"
             
         except Exception as e:
             self.logger.error(f"Failed to store code change: {e}")
             return f"❌ Lỗi lưu code change: {str(e)}"
     
+    async def store_code_changes(self, changes: List[Dict[str, Any]]) -> str:
+        """
+        Store nhiều code changes (vd. các files của một commit) với một batched Gemini analysis
+        Mỗi item có cùng fields với store_code_change
+        """
+        try:
+            change_objects = [
+                self._create_code_change_object(
+                    item["title"], item["change_type"], item["file_paths"],
+                    item.get("lines_added", 0), item.get("lines_removed", 0)
+                )
+                for item in changes
+            ]
+            
+            # Một Gemini request cho cả batch thay vì một round-trip mỗi change
+            impact_task = asyncio.create_task(self.gemini.analyze_code_changes_batch(
+                [(change.file_paths, change.change_type.value) for change in change_objects]
+            ))
+            
+            for change in change_objects:
+                self._code_changes[change.id] = change
+            
+            try:
+                impact_analyses = await asyncio.wait_for(impact_task, _ANALYSIS_TIMEOUT_S)
+            except asyncio.TimeoutError:
+                self.logger.warning(f"Batch impact analysis timed out for {len(change_objects)} code changes")
+                impact_analyses = [{}] * len(change_objects)
+            
+            parts = [f"✅ Lưu {len(change_objects)} code changes thành công\n\n**Impact Analysis:**\n"]
+            for change, impact_analysis in zip(change_objects, impact_analyses):
+                parts.append(
+                    f"- {change.id}: Risk Score {change.get_risk_score()}/10, "
+                    f"Files {len(change.file_paths)}, Lines +{change.lines_added}/-{change.lines_removed}, "
+                    f"Affected Entities {len(impact_analysis.get('affected_entities', []))}\n"
+                )
+            
+            self.logger.info(f"✅ Stored {len(change_objects)} code changes")
+            return "".join(parts)
+            
+        except Exception as e:
+            self.logger.error(f"Failed to store code changes: {e}")
+            return f"❌ Lỗi lưu code changes: {str(e)}"
+    
     async def store_user_feedback(self, feedback_type: str, title: str, description: str,
                                 priority: str = "medium") -> str:
         """
         Store user feedback với automatic categorization
         """
         try:
-            feedback_id = f"feedback_{uuid.uuid4().hex[:8]}"
+            feedback_id = _new_id("feedback")
             
             # Create feedback object
             feedback = UserFeedback(
@@ -183,7 +284,6 @@ class MemoryService:
                 description=description,
                 priority=Priority(priority),
                 status=Status.OPEN,
-                created_at=datetime.now(),
                 created_by="user"
             )
             
@@ -210,14 +310,14 @@ class MemoryService:
             # Find related entities
             related_code_files = self._find_related_code_files(modified_features)
             related_tests = self._find_related_tests(modified_features)
-            related_coverage = list(self._test_coverage.values())
             
             # Get comprehensive test plan
             tests_to_run = get_tests_to_run(
                 code_changes=[cf.file_path for cf in related_code_files],
                 feature_changes=modified_features,
                 all_code_files=list(self._code_files.values()),
-                all_test_coverage=related_coverage
+                all_test_coverage=(),
+                coverage_indexes=self._coverage_indexes()
             )
             
             # Format comprehensive response
@@ -234,8 +334,7 @@ class MemoryService:
         Find related features - Enhanced với comprehensive relationships
         """
         try:
-            # Find related features (placeholder implementation)
-            related = [f for f in self._features.keys() if f != feature][:5]
+            related = list(self._find_related_feature_ids(feature, max_depth))
             
             return self._format_related_features(feature, related)
         except Exception as e:
@@ -248,21 +347,27 @@ class MemoryService:
         """
         try:
             results = []
+            query_lower = query.lower()
             
-            # Search requirements
-            for req in self._requirements.values():
-                if query.lower() in req.title.lower() or query.lower() in req.description.lower():
-                    results.append({"type": "requirement", "id": req.id, "title": req.title})
-            
-            # Search features
-            for feature in self._features.values():
-                if query.lower() in feature.name.lower() or query.lower() in feature.description.lower():
-                    results.append({"type": "feature", "id": feature.id, "title": feature.name})
+            # Query đủ dài: lấy candidates từ inverted index, ngắn: scan toàn bộ
+            query_tokens = (
+                _SEARCH_TOKEN_RE.findall(query_lower)
+                if len(query_lower.strip()) >= _SEARCH_MIN_QUERY_LEN else None
+            )
             
-            # Search bugs
-            for bug in self._bugs.values():
-                if query.lower() in bug.title.lower() or query.lower() in bug.description.lower():
-                    results.append({"type": "bug", "id": bug.id, "title": bug.title})
+            # Search requirements, features, bugs (substring match trên title/description)
+            search_text = self._search_text
+            for kind, store, title_attr in (("requirement", self._requirements, "title"),
+                                            ("feature", self._features, "name"),
+                                            ("bug", self._bugs, "title")):
+                for entity in self._search_candidates(kind, store, query_tokens):
+                    title = getattr(entity, title_attr)
+                    texts = search_text.get(entity.id)
+                    if texts is None:
+                        # Entity chưa qua _index_for_search (_search_candidates vẫn trả về nó)
+                        texts = (title.lower(), entity.description.lower())
+                    if query_lower in texts[0] or query_lower in texts[1]:
+                        results.append({"type": kind, "id": entity.id, "title": title})
             
             return self._format_search_results(query, results[:limit])
         except Exception as e:
@@ -317,26 +422,28 @@ class MemoryService:
         """
         try:
             docs_to_update = get_documents_to_update(
-                feature_changes, code_changes, list(self._documents.values())
+                feature_changes, code_changes, list(self._documents.values()), self._doc_index
             )
             
             if not docs_to_update:
                 return "✅ Không có documents nào cần update."
             
-            result = f"📝 **Documents cần update ({len(docs_to_update)}):**\n\n"
+            parts = [f"📝 **Documents cần update ({len(docs_to_update)}):**\n\n"]
             
             for doc in docs_to_update:
                 staleness = doc.get_staleness_score()
                 priority = "HIGH" if doc.update_frequency == "on_change" else "MEDIUM"
                 
-                result += f"**{doc.title}**\n"
-                result += f"- File: `{doc.file_path}`\n"
-                result += f"- Type: {doc.document_type}\n"
-                result += f"- Priority: {priority}\n"
-                result += f"- Staleness: {staleness:.1f}/10\n"
-                result += f"- Last Updated: {doc.last_updated.strftime('%Y-%m-%d')}\n\n"
+                parts.append(
+                    f"**{doc.title}**\n"
+                    f"- File: `{doc.file_path}`\n"
+                    f"- Type: {doc.document_type}\n"
+                    f"- Priority: {priority}\n"
+                    f"- Staleness: {staleness:.1f}/10\n"
+                    f"- Last Updated: {doc.last_updated.strftime('%Y-%m-%d')}\n\n"
+                )
             
-            return result
+            return "".join(parts)
             
         except Exception as e:
             self.logger.error(f"Failed to get documents to update: {e}")
@@ -352,45 +459,48 @@ class MemoryService:
             # Find all related entities
             related_code_files = self._find_code_files_by_paths(code_changes)
             related_features = [self._features.get(f) for f in feature_changes if f in self._features]
-            related_tests = self._find_tests_for_changes(code_changes, feature_changes)
-            
-            # Categorize tests by priority
-            critical_tests = [t for t in related_tests if t.is_critical()]
-            regression_tests = [t for t in related_tests if t.test_type == TestType.REGRESSION]
-            unit_tests = [t for t in related_tests if t.test_type == TestType.UNIT]
+            related_test_ids = self._find_test_ids_for_changes(code_changes, feature_changes)
             
-            # Calculate effort
-            total_time = sum(t.execution_time for t in related_tests)
+            # Categorize tests by priority + calculate effort (từ pre-bucketed sets)
+            critical_count, regression_count, unit_count, total_time = self._summarize_tests(related_test_ids)
             
-            result = f"🧪 **Comprehensive Test Plan**\n\n"
-            result += f"**Scope:**\n"
-            result += f"- Code Files: {len(code_changes)}\n"
-            result += f"- Features: {len(feature_changes)}\n"
-            result += f"- Risk Level: {risk_level.upper()}\n\n"
-            
-            result += f"**Test Categories:**\n"
-            result += f"- Critical Tests: {len(critical_tests)} (must run)\n"
-            result += f"- Regression Tests: {len(regression_tests)} (recommended)\n"
-            result += f"- Unit Tests: {len(unit_tests)} (if time permits)\n\n"
-            
-            result += f"**Execution Plan:**\n"
-            result += f"- Total Tests: {len(related_tests)}\n"
-            result += f"- Estimated Time: {total_time:.1f} minutes\n"
-            result += f"- Recommended Order: Critical → Regression → Unit\n\n"
-            
-            result += f"**Risk Mitigation:**\n"
+            parts = [
+                "🧪 **Comprehensive Test Plan**\n\n"
+                "**Scope:**\n"
+                f"- Code Files: {len(code_changes)}\n"
+                f"- Features: {len(feature_changes)}\n"
+                f"- Risk Level: {risk_level.upper()}\n\n",
+                
+                "**Test Categories:**\n"
+                f"- Critical Tests: {critical_count} (must run)\n"
+                f"- Regression Tests: {regression_count} (recommended)\n"
+                f"- Unit Tests: {unit_count} (if time permits)\n\n",
+                
+                "**Execution Plan:**\n"
+                f"- Total Tests: {len(related_test_ids)}\n"
+                f"- Estimated Time: {total_time:.1f} minutes\n"
+                "- Recommended Order: Critical → Regression → Unit\n\n",
+                
+                "**Risk Mitigation:**\n",
+            ]
             if risk_level == "high":
-                result += "- Run ALL tests before deployment\n"
-                result += "- Manual testing for critical paths\n"
-                result += "- Staged rollout recommended\n"
+                parts.append(
+                    "- Run ALL tests before deployment\n"
+                    "- Manual testing for critical paths\n"
+                    "- Staged rollout recommended\n"
+                )
             elif risk_level == "medium":
-                result += "- Run critical and regression tests\n"
-                result += "- Monitor key metrics post-deployment\n"
+                parts.append(
+                    "- Run critical and regression tests\n"
+                    "- Monitor key metrics post-deployment\n"
+                )
             else:
-                result += "- Run critical tests minimum\n"
-                result += "- Standard deployment process\n"
+                parts.append(
+                    "- Run critical tests minimum\n"
+                    "- Standard deployment process\n"
+                )
             
-            return result
+            return "".join(parts)
             
         except Exception as e:
             self.logger.error(f"Failed to create comprehensive test plan: {e}")
@@ -400,17 +510,75 @@ class MemoryService:
     
     async def _analyze_requirement(self, requirement: str, project_name: str) -> Dict[str, Any]:
         """SRP: Only analyze requirements"""
-        return await self.gemini.analyze_requirement(requirement, project_name)
+        # Key normalize whitespace/case - cùng requirement viết khác nhau vẫn hit cache
+        key = ("requirement", " ".join(requirement.split()).lower(), project_name)
+        return await self._cached_analysis(
+            key, lambda: self.gemini.analyze_requirement(requirement, project_name, raise_on_error=True)
+        )
     
     async def _analyze_dependency_impact(self, feature_a: str, feature_b: str, 
                                        relationship_type: str) -> Dict[str, Any]:
         """SRP: Only analyze dependency impact"""
-        return await self.gemini.analyze_feature_dependency(feature_a, feature_b, relationship_type)
+        key = ("dependency", feature_a, feature_b, relationship_type)
+        return await self._cached_analysis(
+            key, lambda: self.gemini.analyze_feature_dependency(
+                feature_a, feature_b, relationship_type, raise_on_error=True
+            )
+        )
+    
+    async def _cached_analysis(self, key: Tuple[str, ...],
+                               analyze: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        """
+        LRU + TTL cache cho Gemini analyses với singleflight: request đang chạy cho cùng key được share
+        analyze() phải raise khi Gemini fail - GeminiAnalysisError trả fallback nhưng không được cache
+        Returns deep copy để caller không sửa được cached dict (kể cả nested lists)
+        """
+        cached = self._analysis_cache.get(key)
+        if cached is not None:
+            if cached[0] > time.monotonic():
+                self._analysis_cache.move_to_end(key)
+                return copy.deepcopy(cached[1])
+            del self._analysis_cache[key]
+        
+        future = self._analysis_inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(analyze())
+            self._analysis_inflight[key] = future
+            future.add_done_callback(lambda done: self._finish_analysis(key, done))
+        
+        # shield: một caller bị cancel không cancel request đang share với callers khác
+        try:
+            return copy.deepcopy(await asyncio.shield(future))
+        except GeminiAnalysisError as e:
+            return copy.deepcopy(e.fallback)
+    
+    def _finish_analysis(self, key: Tuple[str, ...], future: "asyncio.Future[Dict[str, Any]]") -> None:
+        """Done callback: bỏ in-flight entry, cache result nếu request thành công (fallbacks không cache)"""
+        self._analysis_inflight.pop(key, None)
+        if future.cancelled() or future.exception() is not None:
+            return
+        self._analysis_cache[key] = (time.monotonic() + _ANALYSIS_CACHE_TTL_S, future.result())
+        if len(self._analysis_cache) > _ANALYSIS_CACHE_SIZE:
+            self._analysis_cache.popitem(last=False)
     
     async def _analyze_code_change_comprehensive_impact(self, change: CodeChange) -> Dict[str, Any]:
         """NEW: Analyze comprehensive impact including docs and code"""
         return await self.gemini.analyze_code_change_impact(change.file_paths, change.change_type.value)
     
+    def _create_code_change_object(self, title: str, change_type: str, file_paths: List[str],
+                                   lines_added: int, lines_removed: int) -> CodeChange:
+        """SRP: Only create code change objects"""
+        return CodeChange(
+            id=_new_id("change"),
+            change_type=ChangeType(change_type),
+            title=title,
+            description=title,
+            file_paths=file_paths,
+            lines_added=lines_added,
+            lines_removed=lines_removed,
+            author="user"
+        )
+    
     def _create_requirement_object(self, req_id: str, requirement: str, 
                                  project_name: str, priority: str, analysis: Dict[str, Any]) -> ProjectRequirement:
         """SRP: Only create requirement objects"""
@@ -425,39 +593,162 @@ class MemoryService:
             estimated_effort=analysis.get("complexity", "medium")
         )
     
+    def _index_for_search(self, kind: str, entity_id: str, title: str, description: str) -> None:
+        """Add entity tokens vào inverted search index, cache lowercased texts"""
+        title_lower = title.lower()
+        description_lower = description.lower()
+        if entity_id not in self._search_text:
+            self._search_indexed_count[kind] += 1
+        self._search_text[entity_id] = (title_lower, description_lower)
+        
+        postings = self._search_index[kind]
+        for text in (title_lower, description_lower):
+            for token in _SEARCH_TOKEN_RE.findall(text):
+                postings.setdefault(token, set()).add(entity_id)
+        self._search_order[entity_id] = len(self._search_order)
+    
+    def _search_candidates(self, kind: str, store: Dict[str, Any],
+                           query_tokens: Optional[List[str]]) -> Iterable[Any]:
+        """
+        Entities có thể match query (theo thứ tự store) - superset, caller vẫn check substring
+        Mỗi query token phải nằm trong một indexed token (substring match của cả query kéo theo điều này),
+        nên chỉ scan vocabulary thay vì toàn bộ text của mọi entity
+        Entities chưa qua _index_for_search (ghi thẳng vào store) luôn là candidates
+        """
+        if not query_tokens:
+            return store.values()
+        
+        postings = self._search_index[kind]
+        candidates: Optional[Set[str]] = None
+        for query_token in query_tokens:
+            matched: Set[str] = set()
+            for token, entity_ids in postings.items():
+                if query_token in token:
+                    matched |= entity_ids
+            candidates = matched if candidates is None else candidates & matched
+            if not candidates:
+                break
+        
+        if len(store) > self._search_indexed_count[kind]:
+            # Có entity chưa index: scan store theo thứ tự, giữ candidates + entities chưa index
+            search_order = self._search_order
+            return [
+                entity for entity_id, entity in store.items()
+                if entity_id in candidates or entity_id not in search_order
+            ]
+        if not candidates:
+            return ()
+        return [store[entity_id] for entity_id in sorted(candidates, key=self._search_order.__getitem__)]
+    
+    def _add_feature_edge(self, feature_a: str, feature_b: str) -> None:
+        """Record dependency edge và invalidate cached traversals"""
+        self._feature_graph.setdefault(feature_a, set()).add(feature_b)
+        self._feature_graph.setdefault(feature_b, set()).add(feature_a)
+        self._traversal_cache.clear()
+    
+    def _find_related_feature_ids(self, feature: str, max_depth: int) -> Tuple[str, ...]:
+        """
+        Depth-limited DFS trên feature graph, cached theo (feature, max_depth)
+        Stack explicit nên memory bị chặn bởi max_depth thay vì breadth của graph
+        """
+        cache_key = (feature, max_depth)
+        cached = self._traversal_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        depths = {feature: 0}
+        stack = [(feature, 0)]
+        while stack:
+            node, depth = stack.pop()
+            if depth >= max_depth:
+                continue
+            for neighbor in self._feature_graph.get(node, ()):
+                # Revisit nếu tìm được đường ngắn hơn để không cắt nhầm nhánh sâu hơn
+                if depths.get(neighbor, max_depth + 1) > depth + 1:
+                    depths[neighbor] = depth + 1
+                    stack.append((neighbor, depth + 1))
+        
+        del depths[feature]
+        related = tuple(sorted(depths, key=depths.__getitem__))
+        self._traversal_cache[cache_key] = related
+        return related
+    
     def _find_related_code_files(self, feature_ids: List[str]) -> List[CodeFileEntity]:
         """Find code files related to features"""
         # Placeholder implementation
-        return list(self._code_files.values())[:3]
+        return list(itertools.islice(self._code_files.values(), 3))
     
     def _find_related_tests(self, feature_ids: List[str]) -> List[Test]:
         """Find tests related to features"""
         # Placeholder implementation
-        return list(self._tests.values())[:3]
+        return list(itertools.islice(self._tests.values(), 3))
+    
+    def _register_document(self, doc: DocumentEntity) -> None:
+        """Store document và index theo related features/code files"""
+        self._documents[doc.id] = doc
+        self._doc_index.add_document(doc)
+    
+    def _register_test_coverage(self, coverage: TestCoverage) -> None:
+        """Store coverage mapping và invalidate coverage indexes snapshot"""
+        self._test_coverage[coverage.id] = coverage
+        self._test_coverage_version += 1
+    
+    def _coverage_indexes(self) -> Tuple[AdjacencyIndex, AdjacencyIndex]:
+        """Coverage indexes cho version hiện tại - chỉ rebuild khi coverage thay đổi"""
+        snapshot = self._coverage_snapshot
+        if snapshot is None or snapshot[0] != self._test_coverage_version:
+            snapshot = (self._test_coverage_version, build_coverage_indexes(self._test_coverage.values()))
+            self._coverage_snapshot = snapshot
+        return snapshot[1]
     
     def _find_related_documents(self, feature_ids: List[str], file_paths: List[str]) -> List[DocumentEntity]:
         """Find documents related to features and files"""
-        related = []
-        for doc in self._documents.values():
-            if any(fid in doc.related_features for fid in feature_ids):
-                related.append(doc)
-            if any(fp in doc.related_code_files for fp in file_paths):
-                related.append(doc)
-        return related
+        return self._doc_index.documents_for(feature_ids, file_paths)
     
     def _find_tests_for_files(self, file_paths: List[str]) -> List[Test]:
         """Find tests that cover specific files"""
         # Placeholder implementation
-        return list(self._tests.values())[:2]
+        return list(itertools.islice(self._tests.values(), 2))
     
     def _find_code_files_by_paths(self, paths: List[str]) -> List[CodeFileEntity]:
         """Find code files by their paths"""
         return [cf for cf in self._code_files.values() if cf.file_path in paths]
     
-    def _find_tests_for_changes(self, code_changes: List[str], feature_changes: List[str]) -> List[Test]:
-        """Find tests for code and feature changes"""
+    def _find_test_ids_for_changes(self, code_changes: List[str], feature_changes: List[str]) -> AbstractSet[str]:
+        """Find ids of tests for code and feature changes"""
         # Placeholder implementation
-        return list(self._tests.values())
+        return self._tests.keys()
+    
+    def _register_test(self, test: Test) -> None:
+        """Store test và update category buckets + total execution time"""
+        previous = self._tests.get(test.id)
+        if previous is not None:
+            self._critical_test_ids.discard(previous.id)
+            self._test_ids_by_type[previous.test_type].discard(previous.id)
+            self._total_test_time -= previous.execution_time
+        
+        self._tests[test.id] = test
+        if test.is_critical():
+            self._critical_test_ids.add(test.id)
+        self._test_ids_by_type[test.test_type].add(test.id)
+        self._total_test_time += test.execution_time
+    
+    def _summarize_tests(self, test_ids: AbstractSet[str]) -> Tuple[int, int, int, float]:
+        """(critical, regression, unit, total execution time) cho registered test ids"""
+        regression_ids = self._test_ids_by_type[TestType.REGRESSION]
+        unit_ids = self._test_ids_by_type[TestType.UNIT]
+        
+        # Tất cả tests: đọc thẳng bucket sizes + running total
+        if len(test_ids) == len(self._tests):
+            return len(self._critical_test_ids), len(regression_ids), len(unit_ids), self._total_test_time
+        
+        tests = self._tests
+        return (
+            len(self._critical_test_ids & test_ids),
+            len(regression_ids & test_ids),
+            len(unit_ids & test_ids),
+            sum(tests[test_id].execution_time for test_id in test_ids),
+        )
     
     def _estimate_fix_time(self, bug: Bug) -> str:
         """Estimate bug fix time based on complexity"""
@@ -476,45 +767,46 @@ class MemoryService:
                                                  tests: List[Test], 
                                                  test_files: List[str]) -> str:
         """Format comprehensive test recommendations"""
-        result = f"📋 **Comprehensive Test Recommendations**\n\n"
-        result += f"**Modified Features:** {', '.join(modified)}\n"
-        result += f"**Affected Code Files:** {len(code_files)}\n"
-        result += f"**Recommended Tests:** {len(test_files)}\n\n"
+        parts = [
+            "📋 **Comprehensive Test Recommendations**\n\n"
+            f"**Modified Features:** {', '.join(modified)}\n"
+            f"**Affected Code Files:** {len(code_files)}\n"
+            f"**Recommended Tests:** {len(test_files)}\n\n"
+        ]
         
         if test_files:
-            result += "**Tests to Run:**\n"
-            for i, test_file in enumerate(test_files[:10], 1):
-                result += f"{i}. `{test_file}`\n"
+            parts.append("**Tests to Run:**\n")
+            parts.extend(f"{i}. `{test_file}`\n" for i, test_file in enumerate(test_files[:10], 1))
             if len(test_files) > 10:
-                result += f"... and {len(test_files) - 10} more\n"
+                parts.append(f"... and {len(test_files) - 10} more\n")
         
         # Add execution estimate
         total_time = sum(t.execution_time for t in tests)
-        result += f"\n**Estimated Execution Time:** {total_time:.1f} minutes"
+        parts.append(f"\n**Estimated Execution Time:** {total_time:.1f} minutes")
         
-        return result
+        return "".join(parts)
     
     def _format_related_features(self, feature: str, related: List[str]) -> str:
         """Format related features for display"""
-        result = f"🔗 **Related Features for '{feature}'**\n\n"
+        parts = [f"🔗 **Related Features for '{feature}'**\n\n"]
         if related:
-            for i, rel in enumerate(related[:10], 1):
-                result += f"{i}. {rel}\n"
+            parts.extend(f"{i}. {rel}\n" for i, rel in enumerate(related[:10], 1))
             if len(related) > 10:
-                result += f"... and {len(related) - 10} more\n"
+                parts.append(f"... and {len(related) - 10} more\n")
         else:
-            result += "No related features found."
-        return result
+            parts.append("No related features found.")
+        return "".join(parts)
     
     def _format_search_results(self, query: str, results: List[Dict[str, Any]]) -> str:
         """Format search results for display"""
-        result = f"🔍 **Search Results for '{query}' ({len(results)} found)**\n\n"
+        parts = [f"🔍 **Search Results for '{query}' ({len(results)} found)**\n\n"]
         
         if results:
-            for i, item in enumerate(results, 1):
-                result += f"{i}. **{item['title']}** ({item['type']})\n"
-                result += f"   ID: `{item['id']}`\n\n"
+            parts.extend(
+                f"{i}. **{item['title']}** ({item['type']})\n   ID: `{item['id']}`\n\n"
+                for i, item in enumerate(results, 1)
+            )
         else:
-            result += "No results found. Try different keywords."
+            parts.append("No results found. Try different keywords.")
         
-        return result
+        return "".join(parts)
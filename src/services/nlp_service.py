@@ -4,11 +4,63 @@ Mục đích: Xử lý natural language messages từ user
 """
 
 import logging
+import re
 from typing import Dict, Any, Optional
 from ..models.gemini_client import GeminiClient
 from ..utils.logger import get_logger
 
 
+# Intent keywords theo thứ tự ưu tiên - intent đầu tiên có keyword xuất hiện trong message được chọn
+_INTENT_KEYWORDS = (
+    ("store_requirement", ("requirement", "yêu cầu", "tính năng", "feature", "lưu", "thêm")),
+    ("store_bug", ("bug", "lỗi", "error", "sự cố", "problem", "issue")),
+    ("get_tests", ("test", "kiểm tra", "chạy", "run", "testing")),
+    ("search", ("tìm", "search", "find", "lookup", "query")),
+    ("analyze", ("phân tích", "analyze", "impact", "tác động")),
+    ("help", ("help", "giúp", "hướng dẫn", "cách", "how")),
+)
+
+# Mỗi intent một alternation regex compile sẵn: một pass qua message thay vì một substring scan per keyword
+# (substring match như trước - không thêm word boundaries)
+_INTENT_PATTERNS = tuple(
+    (intent, re.compile("|".join(map(re.escape, keywords))))
+    for intent, keywords in _INTENT_KEYWORDS
+)
+
+# Tool suggestions theo intent
+_INTENT_SUGGESTIONS = {
+    "store_requirement": """
+- `store_project_requirement`: Lưu requirement mới
+- `store_feature_dependency`: Lưu dependency giữa features
+- `store_user_feedback`: Lưu feedback từ user""",
+
+    "store_bug": """
+- `store_bug_report`: Lưu bug report chi tiết
+- `get_bug_impact_analysis`: Phân tích tác động của bug
+- `store_code_change`: Lưu code changes liên quan""",
+
+    "get_tests": """
+- `get_tests_to_run`: Lấy danh sách tests cần chạy
+- `get_comprehensive_test_plan`: Tạo test plan chi tiết
+- `get_regression_risk`: Đánh giá rủi ro regression""",
+
+    "search": """
+- `search_memory`: Tìm kiếm trong memory system
+- `get_related_features`: Tìm features liên quan
+- `get_documents_to_update`: Tìm docs cần update""",
+
+    "analyze": """
+- `get_change_impact_analysis`: Phân tích tác động thay đổi
+- `get_bug_impact_analysis`: Phân tích tác động bug
+- `get_regression_risk`: Đánh giá rủi ro regression""",
+
+    "help": """
+- `natural_language_handler`: Chat với AI assistant
+- `search_memory`: Tìm kiếm thông tin
+- Kiểm tra các tools khác trong MCP server"""
+}
+
+
 class NLPService:
     """
     Natural Language Processing Service
@@ -49,19 +101,9 @@ class NLPService:
         """
         message_lower = message.lower()
         
-        # Intent keywords mapping
-        intent_keywords = {
-            "store_requirement": ["requirement", "yêu cầu", "tính năng", "feature", "lưu", "thêm"],
-            "store_bug": ["bug", "lỗi", "error", "sự cố", "problem", "issue"],
-            "get_tests": ["test", "kiểm tra", "chạy", "run", "testing"],
-            "search": ["tìm", "search", "find", "lookup", "query"],
-            "analyze": ["phân tích", "analyze", "impact", "tác động"],
-            "help": ["help", "giúp", "hướng dẫn", "cách", "how"]
-        }
-        
         # Find matching intent
-        for intent, keywords in intent_keywords.items():
-            if any(keyword in message_lower for keyword in keywords):
+        for intent, pattern in _INTENT_PATTERNS:
+            if pattern.search(message_lower):
                 return intent
         
         return "general"
@@ -85,39 +127,7 @@ class NLPService:
         """
         Lấy suggestions dựa trên intent
         """
-        suggestions_map = {
-            "store_requirement": """
-- `store_project_requirement`: Lưu requirement mới
-- `store_feature_dependency`: Lưu dependency giữa features
-- `store_user_feedback`: Lưu feedback từ user""",
-            
-            "store_bug": """
-- `store_bug_report`: Lưu bug report chi tiết
-- `get_bug_impact_analysis`: Phân tích tác động của bug
-- `store_code_change`: Lưu code changes liên quan""",
-            
-            "get_tests": """
-- `get_tests_to_run`: Lấy danh sách tests cần chạy
-- `get_comprehensive_test_plan`: Tạo test plan chi tiết
-- `get_regression_risk`: Đánh giá rủi ro regression""",
-            
-            "search": """
-- `search_memory`: Tìm kiếm trong memory system
-- `get_related_features`: Tìm features liên quan
-- `get_documents_to_update`: Tìm docs cần update""",
-            
-            "analyze": """
-- `get_change_impact_analysis`: Phân tích tác động thay đổi
-- `get_bug_impact_analysis`: Phân tích tác động bug
-- `get_regression_risk`: Đánh giá rủi ro regression""",
-            
-            "help": """
-- `natural_language_handler`: Chat với AI assistant
-- `search_memory`: Tìm kiếm thông tin
-- Kiểm tra các tools khác trong MCP server"""
-        }
-        
-        return suggestions_map.get(intent, "")
+        return _INTENT_SUGGESTIONS.get(intent, "")
     
     async def analyze_user_intent_advanced(self, message: str) -> Dict[str, Any]:
         """
@@ -3,9 +3,13 @@ Base MCP Tool Classes - Abstract Foundation
 Mục đích: SOLID principles foundation cho all MCP tools
 """
 
+import asyncio
+import sys
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Dict, Any, Callable, FrozenSet, List, Mapping, Optional, Tuple
 from ..utils.logger import get_logger
+from ..utils.schema_cache import thaw_schema
 
 
 class MCPToolBase(ABC):
@@ -16,14 +20,23 @@ class MCPToolBase(ABC):
     LSP: Subclasses phải implement consistent interface
     """
     
+    # Subclasses không khai báo __slots__ vẫn có __dict__ như bình thường
+    __slots__ = ("logger", "_schema", "_required")
+    
     # Class attributes - sẽ được set bởi subclasses
     name: str = ""
     description: str = ""
     input_schema: Dict[str, Any] = {}
+    # True nếu tool chạy song song được với tools concurrency-safe khác (read-only)
+    is_concurrency_safe: bool = False
     
     def __init__(self):
         """Initialize base tool"""
         self.logger = get_logger(self.__class__.__name__)
+        
+        # Build lazily lần đầu dùng - subclasses set name/description/input_schema sau super().__init__()
+        self._schema: Optional[Dict[str, Any]] = None
+        self._required: Optional[FrozenSet[str]] = None
     
     @abstractmethod
     async def execute(self, arguments: Dict[str, Any]) -> str:
@@ -36,31 +49,46 @@ class MCPToolBase(ABC):
     def get_schema(self) -> Dict[str, Any]:
         """
         Get tool schema for MCP registration
-        Template method pattern
+        Template method pattern - thaw frozen schema thành plain JSON types một lần rồi share
+        Caller không được sửa dict trả về
         """
-        return {
-            "name": self.name,
-            "description": self.description,
-            "inputSchema": {
-                "type": "object",
-                "properties": self.input_schema.get("properties", {}),
-                "required": self.input_schema.get("required", [])
+        if self._schema is None:
+            self._schema = {
+                "name": self.name,
+                "description": self.description,
+                "inputSchema": {
+                    "type": "object",
+                    "properties": thaw_schema(self.input_schema.get("properties", {})),
+                    "required": thaw_schema(self.input_schema.get("required", []))
+                }
             }
-        }
+        return self._schema
     
     def validate_arguments(self, arguments: Dict[str, Any]) -> bool:
         """
         Validate tool arguments against schema
         Template method pattern - common validation logic
         """
-        required_fields = self.input_schema.get("required", [])
+        required_fields = self._required
+        if required_fields is None:
+            required_fields = self._required = frozenset(self.input_schema.get("required", ()))
+        if not required_fields:
+            return True
         
-        for field in required_fields:
-            if field not in arguments:
-                raise ValueError(f"Missing required field: {field}")
+        # Set difference chạy trong C; sorted để message deterministic
+        missing = required_fields - arguments.keys()
+        if missing:
+            raise ValueError(f"Missing required field: {', '.join(sorted(missing))}")
         
         return True
     
+    def format_error(self, error: Exception) -> str:
+        """
+        Format exception từ execute() thành tool response
+        Hook cho subclasses - default là generic executor message
+        """
+        return f"❌ Error executing tool '{self.name}': {str(error)}"
+    
     def __str__(self) -> str:
         """String representation for debugging"""
         return f"{self.__class__.__name__}(name='{self.name}')"
@@ -75,8 +103,18 @@ class MCPToolRegistry:
     def __init__(self):
         """Initialize empty registry"""
         self._tools: Dict[str, MCPToolBase] = {}
+        # Live read-only view - get_all_tools không cần copy dict mỗi call
+        self._tools_view: Mapping[str, MCPToolBase] = MappingProxyType(self._tools)
+        self._change_listeners: List[Callable[[], None]] = []
         self.logger = get_logger(__name__)
     
+    def add_change_listener(self, listener: Callable[[], None]) -> None:
+        """
+        Subscribe to registry changes (dùng để invalidate cached views)
+        Observer pattern
+        """
+        self._change_listeners.append(listener)
+    
     def register_tool(self, tool: MCPToolBase) -> None:
         """
         Register a tool in the registry
@@ -88,22 +126,28 @@ class MCPToolRegistry:
         if not tool.name:
             raise ValueError(f"Tool {tool.__class__.__name__} must have a name")
         
-        self._tools[tool.name] = tool
-        self.logger.info(f"Registered tool: {tool.name}")
+        # Interned key: lookups bằng literal/interned names hit identity fast path
+        self._tools[sys.intern(tool.name)] = tool
+        self.logger.info("Registered tool: %s", tool.name)
+        
+        for listener in self._change_listeners:
+            listener()
     
     def get_tool(self, name: str) -> MCPToolBase:
         """
         Get tool by name
         """
-        if name not in self._tools:
-            raise KeyError(f"Tool '{name}' not found in registry")
-        return self._tools[name]
+        # Một dict lookup trên hot path (execute_tool) thay vì membership check + lookup
+        try:
+            return self._tools[name]
+        except KeyError:
+            raise KeyError(f"Tool '{name}' not found in registry") from None
     
-    def get_all_tools(self) -> Dict[str, MCPToolBase]:
+    def get_all_tools(self) -> Mapping[str, MCPToolBase]:
         """
-        Get all registered tools
+        Get all registered tools (read-only live view)
         """
-        return self._tools.copy()
+        return self._tools_view
     
     def get_tool_schemas(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -141,17 +185,6 @@ class MCPToolExecutor:
             # Validate arguments
             tool.validate_arguments(arguments)
             
-            # Execute tool
-            self.logger.info(f"Executing tool: {tool_name} with args: {list(arguments.keys())}")
-            result = await tool.execute(arguments)
-            
-            # Ensure result is string
-            if not isinstance(result, str):
-                result = str(result)
-            
-            self.logger.info(f"Tool {tool_name} executed successfully")
-            return result
-            
         except KeyError as e:
             error_msg = f"❌ Tool '{tool_name}' not found: {str(e)}"
             self.logger.error(error_msg)
@@ -166,6 +199,52 @@ class MCPToolExecutor:
             error_msg = f"❌ Error executing tool '{tool_name}': {str(e)}"
             self.logger.error(error_msg, exc_info=True)
             return error_msg
+        
+        try:
+            # Execute tool (per-call logs ở DEBUG, lazy %-args - không format gì khi level bị filter)
+            self.logger.debug("Executing tool: %s with args: %s", tool_name, arguments.keys())
+            result = await tool.execute(arguments)
+            
+        except Exception as e:
+            # Tools không tự catch - một exception layer duy nhất, message theo từng tool
+            self.logger.error("Error executing tool '%s': %s", tool_name, e, exc_info=True)
+            return tool.format_error(e)
+        
+        # Ensure result is string (custom tools có thể trả non-str)
+        if not isinstance(result, str):
+            result = str(result)
+        
+        self.logger.debug("Tool %s executed successfully", tool_name)
+        return result
+    
+    async def execute_many(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[str]:
+        """
+        Execute nhiều (tool_name, arguments) calls, results theo đúng thứ tự calls
+        Các concurrency-safe calls liền nhau chạy song song; call khác chạy một mình theo thứ tự
+        nên mỗi call vẫn thấy effects của mọi call đứng trước nó
+        """
+        results: List[str] = []
+        batch: List[Tuple[str, Dict[str, Any]]] = []
+        
+        for tool_name, arguments in calls:
+            if self._is_concurrency_safe(tool_name):
+                batch.append((tool_name, arguments))
+                continue
+            if batch:
+                results.extend(await asyncio.gather(*(self.execute_tool(*call) for call in batch)))
+                batch.clear()
+            results.append(await self.execute_tool(tool_name, arguments))
+        
+        if batch:
+            results.extend(await asyncio.gather(*(self.execute_tool(*call) for call in batch)))
+        return results
+    
+    def _is_concurrency_safe(self, tool_name: str) -> bool:
+        """Unknown tools coi như safe - execute_tool chỉ trả error message"""
+        try:
+            return self.registry.get_tool(tool_name).is_concurrency_safe
+        except KeyError:
+            return True
     
     def get_available_tools(self) -> Dict[str, str]:
         """
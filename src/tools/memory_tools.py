@@ -4,12 +4,17 @@ Factory pattern eliminates duplication và enables rapid tool expansion
 Supports: Auto-analysis, Smart recommendations, Dependency tracking, Test suggestions
 """
 
-from typing import Dict, Any, List
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from abc import ABC, abstractmethod
 from .base_mcp_tool import MCPToolBase
 from ..services.memory_service import MemoryService
 from ..services.nlp_service import NLPService
-from ..config.memory_tool_configs import MEMORY_TOOL_CONFIGS, ADVANCED_TOOL_CONFIGS
+from ..config.memory_tool_configs import (
+    MEMORY_TOOL_CONFIGS, ADVANCED_TOOL_CONFIGS, add_tool_config
+)
 from ..utils.logger import get_logger
 
 
@@ -22,6 +27,9 @@ class BaseMemoryTool(MCPToolBase, ABC):
     Template method pattern for consistent behavior
     """
     
+    # Slots cho instance fields (shadow class defaults của MCPToolBase)
+    __slots__ = ("service", "config", "name", "description", "input_schema", "is_concurrency_safe")
+    
     def __init__(self, service: Any, tool_config: Dict[str, Any]):
         """Initialize base memory tool với service và config"""
         super().__init__()
@@ -32,34 +40,33 @@ class BaseMemoryTool(MCPToolBase, ABC):
         self.name = tool_config["name"]
         self.description = tool_config["description"]
         self.input_schema = tool_config["schema"]
+        self.is_concurrency_safe = tool_config.get("concurrency_safe", False)
         
         self.logger = get_logger(f"{__name__}.{self.name}")
     
     async def execute(self, arguments: Dict[str, Any]) -> str:
         """
-        Common execute logic với error handling
+        Common execute logic - exceptions propagate, MCPToolExecutor format qua format_error()
         Template method pattern - consistent across all tools
         """
-        try:
-            # Validate required fields (already done by base class)
-            self._validate_tool_specific_inputs(arguments)
-            
-            # Log execution start
-            self.logger.info(f"Executing {self.name} with arguments: {list(arguments.keys())}")
-            
-            # Execute specific tool logic
-            result = await self._execute_tool_logic(arguments)
-            
-            # Format result consistently
-            formatted_result = self._format_result(result, arguments)
-            
-            self.logger.info(f"Successfully executed {self.name}")
-            return formatted_result
-            
-        except Exception as e:
-            error_msg = self._format_error(str(e))
-            self.logger.error(f"Error in {self.name}: {str(e)}", exc_info=True)
-            return error_msg
+        # Validate required fields (already done by base class)
+        self._validate_tool_specific_inputs(arguments)
+        
+        # Log execution start
+        self.logger.debug("Executing %s with arguments: %s", self.name, arguments.keys())
+        
+        # Execute specific tool logic
+        result = await self._execute_tool_logic(arguments)
+        
+        # Format result consistently
+        formatted_result = self._format_result(result, arguments)
+        
+        self.logger.debug("Successfully executed %s", self.name)
+        return formatted_result
+    
+    def format_error(self, error: Exception) -> str:
+        """Error message theo operation name của tool"""
+        return self._format_error(str(error))
     
     def _validate_tool_specific_inputs(self, arguments: Dict[str, Any]) -> None:
         """
@@ -100,6 +107,27 @@ class BaseMemoryTool(MCPToolBase, ABC):
 
 # =================== SERVICE METHOD DELEGATOR ===================
 
+def _build_arg_adapter(arg_mapping: Dict[str, str]) -> Optional[Callable[[Dict[str, Any]], Dict[str, Any]]]:
+    """
+    Build adapter map tool args -> service args từ arg_mapping {service_arg: input_arg}
+    None khi không có mapping (direct mapping) - caller pass arguments thẳng, không tốn thêm call
+    Adapter pattern - adapts tool args to service args
+    """
+    if not arg_mapping:
+        return None
+    
+    pairs = tuple(arg_mapping.items())
+    
+    def adapt(arguments: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            service_arg: arguments[input_arg]
+            for service_arg, input_arg in pairs
+            if input_arg in arguments
+        }
+    
+    return adapt
+
+
 class ServiceMethodTool(BaseMemoryTool):
     """
     Generic tool that delegates to service methods
@@ -107,61 +135,58 @@ class ServiceMethodTool(BaseMemoryTool):
     Strategy pattern - delegates to different service methods
     """
     
+    __slots__ = ("_method", "_is_coro", "_arg_adapter")
+    
+    def __init__(self, service: Any, tool_config: Dict[str, Any]):
+        """Resolve service method một lần - binding là static theo config"""
+        super().__init__(service, tool_config)
+        
+        # Method không tồn tại vẫn tạo tool được, lỗi report lúc execute như trước
+        self._method = getattr(service, tool_config["service_method"], None)
+        self._is_coro = asyncio.iscoroutinefunction(self._method)
+        self._arg_adapter = _build_arg_adapter(tool_config.get("arg_mapping", {}))
+    
     async def _execute_tool_logic(self, arguments: Dict[str, Any]) -> Any:
         """
         Delegate to configured service method
         Strategy pattern - method determined by configuration
         """
-        method_name = self.config["service_method"]
+        method = self._method
+        if method is None:
+            raise AttributeError(f"Service does not have method: {self.config['service_method']}")
         
-        # Get method from service
-        if not hasattr(self.service, method_name):
-            raise AttributeError(f"Service does not have method: {method_name}")
+        # Extract method arguments từ config (không có arg_mapping: tool args = service args)
+        adapter = self._arg_adapter
+        method_args = arguments if adapter is None else adapter(arguments)
         
-        method = getattr(self.service, method_name)
-        
-        # Extract method arguments từ config
-        method_args = self._extract_method_args(arguments)
-        
-        # Call service method
-        if asyncio.iscoroutinefunction(method):
+        # Call service method - sync methods chạy trong default thread pool để không block event loop
+        if self._is_coro:
             return await method(**method_args)
-        else:
-            return method(**method_args)
-    
-    def _extract_method_args(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Extract và map arguments cho service method
-        Adapter pattern - adapts tool args to service args
-        """
-        arg_mapping = self.config.get("arg_mapping", {})
-        
-        if arg_mapping:
-            # Use custom mapping
-            return {
-                service_arg: arguments[input_arg] 
-                for service_arg, input_arg in arg_mapping.items()
-                if input_arg in arguments
-            }
-        else:
-            # Direct mapping - tool args = service args
-            return arguments
+        return await asyncio.to_thread(method, **method_args)
 
 
 # =================== SPECIAL TOOLS ===================
 
+# Natural language response cache (NaturalLanguageHandlerTool)
+_NL_CACHE_SIZE = 256
+_NL_CACHE_TTL_S = 300.0
+
+
 class NaturalLanguageHandlerTool(BaseMemoryTool):
     """
     Special tool cho NLP - uses different service
     Strategy pattern - different service strategy
     """
     
+    __slots__ = ("_nl_cache",)
+    
     def __init__(self, nlp_service: NLPService):
         """Initialize NLP tool với NLP service"""
         config = {
             "name": "natural_language_handler",
             "description": "Xử lý natural language messages từ user và provide intelligent responses",
             "operation_name": "xử lý natural language",
+            "concurrency_safe": True,
             "schema": {
                 "type": "object",
                 "properties": {
@@ -171,25 +196,45 @@ class NaturalLanguageHandlerTool(BaseMemoryTool):
                     }
                 },
                 "required": ["message"]
-            },
-            "required": ["message"]
+            }
         }
         super().__init__(nlp_service, config)
+        
+        # LRU + TTL: normalized message -> (expires_at monotonic, response)
+        self._nl_cache: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
     
     async def _execute_tool_logic(self, arguments: Dict[str, Any]) -> Any:
         """
         Delegate to NLP service
         Strategy pattern - NLP-specific processing
+        Câu hỏi lặp lại (khác whitespace/case) trong _NL_CACHE_TTL_S dùng lại response đã có
         """
         message = arguments["message"]
-        return await self.service.process_natural_language(message)
+        key = " ".join(message.split()).lower()
+        
+        cached = self._nl_cache.get(key)
+        if cached is not None:
+            if cached[0] > time.monotonic():
+                self._nl_cache.move_to_end(key)
+                return cached[1]
+            del self._nl_cache[key]
+        
+        response = await self.service.process_natural_language(message)
+        
+        # Error responses không cache - lần sau thử lại
+        if not response.startswith("❌"):
+            self._nl_cache[key] = (time.monotonic() + _NL_CACHE_TTL_S, response)
+            if len(self._nl_cache) > _NL_CACHE_SIZE:
+                self._nl_cache.popitem(last=False)
+        return response
     
     def _validate_tool_specific_inputs(self, arguments: Dict[str, Any]) -> None:
         """
         NLP-specific validation
         """
         message = arguments.get("message", "")
-        if not message.strip():
+        # isspace() scan không allocate như strip()
+        if not message or message.isspace():
             raise ValueError("Message cannot be empty")
         
         if len(message) > 5000:
@@ -220,50 +265,32 @@ class MemoryToolFactory:
         tools = []
         
         # Create basic memory tools
-        basic_tools = self._create_basic_memory_tools()
-        tools.extend(basic_tools)
+        tools.extend(self._create_from_config_dict(MEMORY_TOOL_CONFIGS, "basic"))
         
         # Create advanced tools
-        advanced_tools = self._create_advanced_memory_tools()
-        tools.extend(advanced_tools)
+        tools.extend(self._create_from_config_dict(ADVANCED_TOOL_CONFIGS, "advanced"))
         
         # Create special tools
         special_tools = self._create_special_tools()
         tools.extend(special_tools)
         
-        self.logger.info(f"Created {len(tools)} memory tools")
+        self.logger.info("Created %d memory tools", len(tools))
         return tools
     
-    def _create_basic_memory_tools(self) -> List[MCPToolBase]:
+    def _create_from_config_dict(self, configs: Dict[str, Dict[str, Any]], kind: str) -> List[MCPToolBase]:
         """
-        Create basic memory tools from MEMORY_TOOL_CONFIGS
+        Create ServiceMethodTools từ một config dict (MEMORY_TOOL_CONFIGS / ADVANCED_TOOL_CONFIGS)
+        Config lỗi chỉ skip tool đó; log một dòng tổng kết thay vì một dòng mỗi tool
         """
         tools = []
         
-        for tool_name, config in MEMORY_TOOL_CONFIGS.items():
+        for tool_name, config in configs.items():
             try:
-                tool = ServiceMethodTool(self.memory_service, config)
-                tools.append(tool)
-                self.logger.info(f"Created basic tool: {tool_name}")
+                tools.append(ServiceMethodTool(self.memory_service, config))
             except Exception as e:
-                self.logger.error(f"Failed to create basic tool {tool_name}: {e}")
-        
-        return tools
-    
-    def _create_advanced_memory_tools(self) -> List[MCPToolBase]:
-        """
-        Create advanced memory tools from ADVANCED_TOOL_CONFIGS
-        """
-        tools = []
-        
-        for tool_name, config in ADVANCED_TOOL_CONFIGS.items():
-            try:
-                tool = ServiceMethodTool(self.memory_service, config)
-                tools.append(tool)
-                self.logger.info(f"Created advanced tool: {tool_name}")
-            except Exception as e:
-                self.logger.error(f"Failed to create advanced tool {tool_name}: {e}")
+                self.logger.error("Failed to create %s tool %s: %s", kind, tool_name, e)
         
+        self.logger.info("Created %d %s tools", len(tools), kind)
         return tools
     
     def _create_special_tools(self) -> List[MCPToolBase]:
@@ -278,7 +305,7 @@ class MemoryToolFactory:
             tools.append(nlp_tool)
             self.logger.info("Created special tool: natural_language_handler")
         except Exception as e:
-            self.logger.error(f"Failed to create NLP tool: {e}")
+            self.logger.error("Failed to create NLP tool: %s", e)
         
         return tools
     
@@ -319,12 +346,9 @@ class MemoryToolFactory:
         Add new tool configuration dynamically
         Open/Closed Principle - extend without modification
         """
-        if is_advanced:
-            ADVANCED_TOOL_CONFIGS[tool_name] = config
-        else:
-            MEMORY_TOOL_CONFIGS[tool_name] = config
+        add_tool_config(tool_name, config, is_advanced)
         
-        self.logger.info(f"Added new tool configuration: {tool_name}")
+        self.logger.info("Added new tool configuration: %s", tool_name)
 
 
 # =================== USAGE EXAMPLE ===================
@@ -346,8 +370,7 @@ factory.add_tool_config("new_analysis_tool", {
             "input_data": {"type": "string", "description": "Input for analysis"}
         },
         "required": ["input_data"]
-    },
-    "required": ["input_data"]
+    }
 })
 
 # Option 2: Create tool directly
@@ -355,6 +378,3 @@ new_tool = factory.create_tool_by_name("new_analysis_tool")
 
 # Zero additional code required!
 """
-
-# Import asyncio for coroutine detection
-import asyncio
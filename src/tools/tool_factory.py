@@ -4,11 +4,20 @@ Mục đích: Create và manage all MCP tools với dependency injection
 """
 
 from typing import List, Dict, Any, Optional
+
+from fastjsonschema import JsonSchemaDefinitionException
+
 from .base_mcp_tool import MCPToolBase, MCPToolRegistry, MCPToolExecutor
 from .memory_tools import MemoryToolFactory
 from ..services.memory_service import MemoryService
 from ..services.nlp_service import NLPService
 from ..utils.logger import get_logger
+from ..utils.schema_cache import get_schema_validator
+
+
+# Substrings phân loại tool names (theo thứ tự check trong get_tool_statistics)
+_MEMORY_KEYWORDS = ("memory", "store", "get", "search", "analyze")
+_NLP_KEYWORDS = ("natural_language", "nlp")
 
 
 class MCPToolFactory:
@@ -30,6 +39,11 @@ class MCPToolFactory:
         # Create registry and executor
         self.registry = MCPToolRegistry()
         self.executor = MCPToolExecutor(self.registry)
+        
+        # Statistics/help là pure functions của registry - cache, invalidate khi registry đổi
+        self._stats_cache: Optional[Dict[str, Any]] = None
+        self._help_cache: Optional[str] = None
+        self.registry.add_change_listener(self._invalidate_tool_info)
     
     def create_and_register_all_tools(self) -> MCPToolRegistry:
         """
@@ -44,11 +58,11 @@ class MCPToolFactory:
             for tool in memory_tools:
                 self.registry.register_tool(tool)
             
-            self.logger.info(f"Successfully created and registered {len(memory_tools)} tools")
+            self.logger.info("Successfully created and registered %d tools", len(memory_tools))
             return self.registry
             
         except Exception as e:
-            self.logger.error(f"Failed to create and register tools: {e}", exc_info=True)
+            self.logger.error("Failed to create and register tools: %s", e, exc_info=True)
             raise
     
     def get_registry(self) -> MCPToolRegistry:
@@ -77,7 +91,7 @@ class MCPToolFactory:
         Open/Closed Principle - extend without modification
         """
         self.registry.register_tool(tool)
-        self.logger.info(f"Added custom tool: {tool.name}")
+        self.logger.info("Added custom tool: %s", tool.name)
     
     def get_tool_schemas(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -95,33 +109,35 @@ class MCPToolFactory:
         """
         Get statistics about registered tools
         """
-        all_tools = self.registry.get_all_tools()
-        
-        # Categorize tools
-        memory_tools = []
-        nlp_tools = []
-        other_tools = []
-        
-        for name, tool in all_tools.items():
-            if "memory" in name or any(keyword in name for keyword in 
-                                     ["store", "get", "search", "analyze"]):
-                memory_tools.append(name)
-            elif "natural_language" in name or "nlp" in name:
-                nlp_tools.append(name)
-            else:
-                other_tools.append(name)
-        
-        return {
-            "total_tools": len(all_tools),
-            "memory_tools": len(memory_tools),
-            "nlp_tools": len(nlp_tools),
-            "other_tools": len(other_tools),
-            "tool_categories": {
-                "memory": memory_tools,
-                "nlp": nlp_tools,
-                "other": other_tools
+        if self._stats_cache is None:
+            # Categorize tools
+            memory_tools = []
+            nlp_tools = []
+            other_tools = []
+            
+            for name in self.registry.list_tool_names():
+                if any(keyword in name for keyword in _MEMORY_KEYWORDS):
+                    memory_tools.append(name)
+                elif any(keyword in name for keyword in _NLP_KEYWORDS):
+                    nlp_tools.append(name)
+                else:
+                    other_tools.append(name)
+            
+            self._stats_cache = {
+                "total_tools": len(memory_tools) + len(nlp_tools) + len(other_tools),
+                "memory_tools": len(memory_tools),
+                "nlp_tools": len(nlp_tools),
+                "other_tools": len(other_tools),
+                "tool_categories": {
+                    "memory": tuple(memory_tools),
+                    "nlp": tuple(nlp_tools),
+                    "other": tuple(other_tools)
+                }
             }
-        }
+        
+        # Copy cả tool_categories (values là tuples) - caller sửa dict trả về không ảnh hưởng cache/help
+        cache = self._stats_cache
+        return {**cache, "tool_categories": dict(cache["tool_categories"])}
     
     async def execute_tool(self, tool_name: str, arguments: Dict[str, Any]) -> str:
         """
@@ -149,41 +165,42 @@ class MCPToolFactory:
         if "properties" not in schema:
             raise ValueError("Tool schema must have properties")
         
+        # Compile một lần lúc validate config: bắt schema malformed sớm và warm validator cache
+        # mà mcp_handler dùng cho per-call argument validation
+        try:
+            get_schema_validator(schema)
+        except JsonSchemaDefinitionException as e:
+            raise ValueError(f"Invalid tool schema: {e}") from e
+        
         return True
     
     def get_tool_usage_help(self) -> str:
         """
         Get comprehensive help for all tools
         """
+        if self._help_cache is not None:
+            return self._help_cache
+        
         all_tools = self.registry.get_all_tools()
         stats = self.get_tool_statistics()
         
-        help_text = f"🛠️ **MCP Tools Help ({stats['total_tools']} tools available)**\n\n"
-        
-        # Memory Tools
-        if stats['tool_categories']['memory']:
-            help_text += "🧠 **Memory Tools:**\n"
-            for tool_name in stats['tool_categories']['memory']:
-                tool = all_tools[tool_name]
-                help_text += f"- `{tool_name}`: {tool.description}\n"
-            help_text += "\n"
+        parts = [f"🛠️ **MCP Tools Help ({stats['total_tools']} tools available)**\n\n"]
         
-        # NLP Tools
-        if stats['tool_categories']['nlp']:
-            help_text += "💬 **NLP Tools:**\n"
-            for tool_name in stats['tool_categories']['nlp']:
-                tool = all_tools[tool_name]
-                help_text += f"- `{tool_name}`: {tool.description}\n"
-            help_text += "\n"
+        for category, heading in (("memory", "🧠 **Memory Tools:**\n"),
+                                  ("nlp", "💬 **NLP Tools:**\n"),
+                                  ("other", "🔧 **Other Tools:**\n")):
+            tool_names = stats['tool_categories'][category]
+            if tool_names:
+                parts.append(heading)
+                parts.extend(f"- `{tool_name}`: {all_tools[tool_name].description}\n" for tool_name in tool_names)
+                parts.append("\n")
         
-        # Other Tools
-        if stats['tool_categories']['other']:
-            help_text += "🔧 **Other Tools:**\n"
-            for tool_name in stats['tool_categories']['other']:
-                tool = all_tools[tool_name]
-                help_text += f"- `{tool_name}`: {tool.description}\n"
-            help_text += "\n"
+        parts.append("💡 **Usage:** Use any tool name with appropriate arguments via MCP protocol.")
         
-        help_text += "💡 **Usage:** Use any tool name with appropriate arguments via MCP protocol."
-        
-        return help_text
+        self._help_cache = "".join(parts)
+        return self._help_cache
+    
+    def _invalidate_tool_info(self) -> None:
+        """Drop cached statistics/help (gọi khi registry thay đổi)"""
+        self._stats_cache = None
+        self._help_cache = None
@@ -4,6 +4,7 @@ Mục đích: Centralized configuration với environment variables
 """
 
 import os
+import threading
 from typing import Optional
 from dataclasses import dataclass
 from dotenv import load_dotenv
@@ -61,6 +62,9 @@ def load_config() -> AppConfig:
     Load configuration from environment variables
     SRP: Chỉ lo việc load config
     """
+    # os.environ lookups trực tiếp (os.getenv chỉ là wrapper của environ.get)
+    env = os.environ
+    
     # Required environment variables
     required_vars = {
         "GEMINI_API_KEY": "Gemini API key is required",
@@ -68,56 +72,60 @@ def load_config() -> AppConfig:
         "REDIS_URL": "Redis URL is required"
     }
     
-    # Check required variables
-    missing_vars = []
-    for var, message in required_vars.items():
-        if not os.getenv(var):
-            missing_vars.append(f"{var}: {message}")
+    # Check required variables (empty value cũng tính là missing)
+    missing_vars = [f"{var}: {message}" for var, message in required_vars.items() if not env.get(var)]
     
     if missing_vars:
         raise ValueError(f"Missing required environment variables:\n" + "\n".join(missing_vars))
     
     # Create configuration
     return AppConfig(
-        project_name=os.getenv("PROJECT_NAME", "cursor_graphrag_memory"),
-        environment=os.getenv("ENVIRONMENT", "development"),
-        log_level=os.getenv("LOG_LEVEL", "INFO"),
+        project_name=env.get("PROJECT_NAME", "cursor_graphrag_memory"),
+        environment=env.get("ENVIRONMENT", "development"),
+        log_level=env.get("LOG_LEVEL", "INFO"),
         
         database=DatabaseConfig(
-            url=os.getenv("DATABASE_URL"),
-            pool_size=int(os.getenv("DB_POOL_SIZE", "10")),
-            max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "20")),
-            pool_timeout=int(os.getenv("DB_POOL_TIMEOUT", "30"))
+            url=env["DATABASE_URL"],
+            pool_size=int(env.get("DB_POOL_SIZE", "10")),
+            max_overflow=int(env.get("DB_MAX_OVERFLOW", "20")),
+            pool_timeout=int(env.get("DB_POOL_TIMEOUT", "30"))
         ),
         
         redis=RedisConfig(
-            url=os.getenv("REDIS_URL")
+            url=env["REDIS_URL"]
         ),
         
         gemini=GeminiConfig(
-            api_key=os.getenv("GEMINI_API_KEY"),
-            model=os.getenv("GEMINI_MODEL", "gemini-2.5-flash"),
-            temperature=float(os.getenv("GEMINI_TEMPERATURE", "0.1")),
-            max_tokens=int(os.getenv("GEMINI_MAX_TOKENS", "2048"))
+            api_key=env["GEMINI_API_KEY"],
+            model=env.get("GEMINI_MODEL", "gemini-2.5-flash"),
+            temperature=float(env.get("GEMINI_TEMPERATURE", "0.1")),
+            max_tokens=int(env.get("GEMINI_MAX_TOKENS", "2048"))
         ),
         
         mcp=MCPConfig(
-            server_name=os.getenv("MCP_SERVER_NAME", "cursor-graphiti-memory"),
-            server_version=os.getenv("MCP_SERVER_VERSION", "1.0.0"),
-            port=int(os.getenv("MCP_SERVER_PORT", "8000"))
+            server_name=env.get("MCP_SERVER_NAME", "cursor-graphiti-memory"),
+            server_version=env.get("MCP_SERVER_VERSION", "1.0.0"),
+            port=int(env.get("MCP_SERVER_PORT", "8000"))
         )
     )
 
 
 # Global config instance
 _config: Optional[AppConfig] = None
+_config_lock = threading.Lock()
 
 
 def get_config() -> AppConfig:
     """
     Get global configuration instance - Singleton pattern
+    Double-checked locking: concurrent first calls chỉ load một lần, sau đó không lock
     """
     global _config
-    if _config is None:
-        _config = load_config()
-    return _config
+    config = _config
+    if config is not None:
+        return config
+    
+    with _config_lock:
+        if _config is None:
+            _config = load_config()
+        return _config
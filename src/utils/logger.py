@@ -3,11 +3,44 @@ Centralized Logging Configuration
 Mục đích: Consistent logging across all modules
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
+import threading
 from typing import Optional
 
 
+# Một queue + listener thread dùng chung cho mọi logger setup qua setup_logger
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_listener: Optional[logging.handlers.QueueListener] = None
+_listener_lock = threading.Lock()
+
+
+def _ensure_listener() -> None:
+    """Start shared QueueListener lần đầu cần (một thread, một atexit hook cho cả process)"""
+    global _listener
+    with _listener_lock:
+        if _listener is not None:
+            return
+        
+        # Create console handler - level filter nằm ở QueueHandler của từng logger
+        handler = logging.StreamHandler(sys.stdout)
+        
+        # Create formatter
+        formatter = logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S'
+        )
+        handler.setFormatter(formatter)
+        
+        _listener = logging.handlers.QueueListener(_log_queue, handler)
+        _listener.start()
+        # Flush records còn trong queue khi process exit
+        atexit.register(_listener.stop)
+
+
 def setup_logger(name: str, level: str = "INFO") -> logging.Logger:
     """
     Setup logger với consistent formatting
@@ -23,19 +56,15 @@ def setup_logger(name: str, level: str = "INFO") -> logging.Logger:
     log_level = getattr(logging, level.upper(), logging.INFO)
     logger.setLevel(log_level)
     
-    # Create console handler
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setLevel(log_level)
+    _ensure_listener()
     
-    # Create formatter
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    handler.setFormatter(formatter)
+    # QueueHandler.prepare() vẫn merge msg % args (+ traceback) trên caller thread;
+    # listener thread lo phần format prefix (asctime/name/level) và write stream
+    queue_handler = logging.handlers.QueueHandler(_log_queue)
+    queue_handler.setLevel(log_level)
     
     # Add handler to logger
-    logger.addHandler(handler)
+    logger.addHandler(queue_handler)
     
     return logger
 
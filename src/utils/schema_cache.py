@@ -0,0 +1,60 @@
+"""
+Schema Validator Cache & Frozen Schemas
+Mục đích: Compile JSON-Schema validators một lần, share frozen schemas không cần copy
+"""
+
+import hashlib
+import json
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Callable, Mapping
+
+import fastjsonschema
+
+
+@lru_cache(maxsize=256)
+def _compile_schema(schema_json: str) -> Callable[[Dict[str, Any]], Any]:
+    """Compile validator từ canonical JSON string - cached"""
+    return fastjsonschema.compile(json.loads(schema_json), use_default=False)
+
+
+def _canonical_json(schema: Mapping[str, Any]) -> str:
+    """Canonical JSON của schema (frozen hoặc plain) - stable giữa các lần chạy"""
+    return json.dumps(schema, sort_keys=True, default=dict)
+
+
+def get_schema_validator(schema: Dict[str, Any]) -> Callable[[Dict[str, Any]], Any]:
+    """
+    Get compiled validator cho schema
+    Key theo canonical JSON nên các schemas tương đương dùng chung validator
+    """
+    return _compile_schema(_canonical_json(schema))
+
+
+def schema_hash(schema: Mapping[str, Any]) -> str:
+    """SHA-256 của canonical JSON - dùng để check generated validators còn khớp schema"""
+    return hashlib.sha256(_canonical_json(schema).encode("utf-8")).hexdigest()
+
+
+def freeze_schema(value: Any) -> Any:
+    """
+    Recursively freeze schema: dict -> MappingProxyType, list -> tuple
+    Frozen schemas có thể share reference an toàn, không cần defensive copy
+    """
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: freeze_schema(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze_schema(item) for item in value)
+    return value
+
+
+def thaw_schema(value: Any) -> Any:
+    """
+    Recursively copy frozen schema về plain dict/list
+    Dùng khi consumer cần mutable hoặc JSON-serializable schema (vd: MCP Tool)
+    """
+    if isinstance(value, Mapping):
+        return {key: thaw_schema(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [thaw_schema(item) for item in value]
+    return value
@@ -0,0 +1,76 @@
+"""
+Tests for memory tool configurations
+"""
+
+import pytest
+from fastjsonschema import JsonSchemaException
+
+from src.config.memory_tool_configs import get_all_tool_configs, get_tool_names, get_validator
+from src.generated import validators as generated_validators
+from src.utils.schema_cache import schema_hash
+
+
+class TestToolValidators:
+    """Test cases for pre-compiled tool validators"""
+
+    def test_every_static_tool_has_validator(self):
+        for tool_name in get_tool_names():
+            assert get_validator(tool_name) is not None
+
+    def test_unknown_tool_has_no_validator(self):
+        assert get_validator("natural_language_handler") is None
+
+    def test_validator_accepts_valid_arguments(self):
+        validate = get_validator("search_memory")
+        validate({"query": "login", "limit": 5})
+
+    def test_validator_rejects_missing_required_field(self):
+        validate = get_validator("search_memory")
+        with pytest.raises(JsonSchemaException):
+            validate({"limit": 5})
+
+    def test_validator_rejects_out_of_range_integer(self):
+        validate = get_validator("search_memory")
+        with pytest.raises(JsonSchemaException):
+            validate({"query": "login", "limit": 100})
+
+    def test_validator_rejects_bool_for_integer(self):
+        validate = get_validator("get_related_features")
+        with pytest.raises(JsonSchemaException):
+            validate({"feature": "auth", "max_depth": True})
+
+    def test_validator_does_not_inject_defaults(self):
+        arguments = {"query": "login"}
+        get_validator("search_memory")(arguments)
+        assert arguments == {"query": "login"}
+
+    def test_schema_level_keywords_bypass_fast_path(self):
+        from src.config.memory_tool_configs import _compile_validator
+
+        schema = {
+            "type": "object",
+            "properties": {"title": {"type": "string"}, "owner": {"type": "string"}},
+            "required": ["title"],
+            "additionalProperties": False,
+        }
+        validate = _compile_validator("strict_tool", schema)
+        validate({"title": "Crash"})
+        with pytest.raises(JsonSchemaException):
+            validate({"title": "Crash", "extra": 1})
+
+    def test_required_fields_outside_properties_bypass_fast_path(self):
+        from src.config.memory_tool_configs import _compile_validator
+
+        schema = {"type": "object", "properties": {"a": {"type": "string"}}, "required": ["a", "b"]}
+        validate = _compile_validator("loose_tool", schema)
+        with pytest.raises(JsonSchemaException):
+            validate({"a": "x"})
+
+
+class TestGeneratedValidators:
+    """Generated validators must match current schemas"""
+
+    def test_generated_validators_are_up_to_date(self):
+        # Fails when a schema changes without `python -m src.config.generate_validators`
+        for tool_name, config in get_all_tool_configs().items():
+            assert generated_validators.SCHEMA_HASHES.get(tool_name) == schema_hash(config["schema"])
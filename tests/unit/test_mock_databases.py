@@ -0,0 +1,158 @@
+"""
+Tests for mock database backends
+SQLiteMockDatabase phải trả cùng kết quả với MockDatabase
+"""
+
+import pytest
+
+
+def _seed(db):
+    """Insert cùng một dataset nhỏ vào backend"""
+    db.insert("features", {"id": "feat_auth", "name": "Auth", "status": "done"})
+    db.insert("features", {"id": "feat_export", "name": "Export", "status": "open"})
+    db.insert("bugs", {"id": "bug_1", "title": "Login CRASH on submit", "severity": "major", "owner": None})
+    db.insert("bugs", {"id": "bug_2", "title": "Export is slow", "severity": "minor", "tags": ["perf"]})
+    db.insert("bugs", {"id": "bug_3", "title": "Login button misaligned", "severity": "minor"})
+    db.insert("relationships", {"id": "rel_1", "source_entity_id": "bug_1", "source_entity_type": "BUGS",
+                                "target_entity_id": "feat_auth", "target_entity_type": "Features"})
+    db.insert("relationships", {"id": "rel_2", "source_entity_id": "bug_2", "source_entity_type": "bugs",
+                                "target_entity_id": "feat_export", "target_entity_type": "features"})
+    db.insert("relationships", {"id": "rel_3", "source_entity_id": "feat_auth", "source_entity_type": "features",
+                                "target_entity_id": "feat_auth", "target_entity_type": "features"})
+
+
+def _ids(records):
+    return [record["id"] for record in records]
+
+
+def _without_timestamps(tables):
+    """Tables snapshot bỏ created_at/updated_at (mỗi backend tự stamp lúc insert)"""
+    return {
+        table: {
+            record_id: {key: value for key, value in record.items() if key not in ("created_at", "updated_at")}
+            for record_id, record in records.items()
+        }
+        for table, records in tables.items()
+    }
+
+
+def _related(db, entity_id):
+    return [(item["relationship"]["id"], item["entity"]["id"]) for item in db.get_related_records(entity_id)]
+
+
+@pytest.fixture
+def databases():
+    """(MockDatabase, SQLiteMockDatabase) cùng được seed"""
+    from src.mocks.mock_database import MockDatabase
+    from src.mocks.sqlite_database import SQLiteMockDatabase
+    
+    mock_db, sqlite_db = MockDatabase(), SQLiteMockDatabase()
+    _seed(mock_db)
+    _seed(sqlite_db)
+    yield mock_db, sqlite_db
+    sqlite_db.close()
+
+
+class TestSQLiteParity:
+    """SQLiteMockDatabase vs MockDatabase trên cùng operations"""
+    
+    @pytest.mark.parametrize("where", [
+        None,
+        {"severity": "minor"},
+        {"severity": "minor", "title": "Export is slow"},
+        {"owner": None},
+        {"tags": ["perf"]},
+        {"severity": "critical"},
+    ])
+    def test_select(self, databases, where):
+        mock_db, sqlite_db = databases
+        assert _ids(sqlite_db.select("bugs", where=where)) == _ids(mock_db.select("bugs", where=where))
+        assert _ids(sqlite_db.select("bugs", id="bug_2")) == _ids(mock_db.select("bugs", id="bug_2"))
+    
+    @pytest.mark.parametrize("query, fields", [
+        ("login", ["title"]),
+        ("crash", ["title", "severity"]),
+        ("MINOR", ["severity"]),
+        ("100%", ["title"]),
+        ("login", ["missing_field"]),
+    ])
+    def test_search(self, databases, query, fields):
+        mock_db, sqlite_db = databases
+        assert _ids(sqlite_db.search("bugs", query, fields)) == _ids(mock_db.search("bugs", query, fields))
+    
+    @pytest.mark.parametrize("entity_id", ["feat_auth", "bug_1", "feat_export", "unknown"])
+    def test_get_related_records(self, databases, entity_id):
+        mock_db, sqlite_db = databases
+        assert _related(sqlite_db, entity_id) == _related(mock_db, entity_id)
+    
+    def test_export_import_round_trip(self, databases):
+        from src.mocks.mock_database import MockDatabase
+        from src.mocks.sqlite_database import SQLiteMockDatabase
+        
+        mock_db, sqlite_db = databases
+        assert _without_timestamps(sqlite_db.export_data()["tables"]) == \
+            _without_timestamps(mock_db.export_data()["tables"])
+        
+        # Export của backend này import được vào backend kia
+        restored_sqlite = SQLiteMockDatabase()
+        restored_sqlite.import_data(mock_db.export_data())
+        restored_mock = MockDatabase()
+        restored_mock.import_data(sqlite_db.export_data())
+        
+        assert _without_timestamps(restored_sqlite.export_data()["tables"]) == \
+            _without_timestamps(restored_mock.export_data()["tables"])
+        assert _related(restored_sqlite, "feat_auth") == _related(restored_mock, "feat_auth")
+        restored_sqlite.close()
+
+
+class TestSQLitePersistence:
+    """File-backed SQLiteMockDatabase"""
+    
+    def test_writes_are_committed(self, tmp_path):
+        from src.mocks.sqlite_database import SQLiteMockDatabase
+        
+        path = str(tmp_path / "mock.db")
+        db = SQLiteMockDatabase(path)
+        db.insert("bugs", {"id": "bug_1", "title": "Crash"})
+        
+        # Connection thứ hai ghi được ngay (không còn write lock bị giữ) và thấy data
+        other = SQLiteMockDatabase(path)
+        other.update("bugs", "bug_1", {"severity": "major"})
+        db.close()
+        other.close()
+        
+        reopened = SQLiteMockDatabase(path)
+        assert reopened.get_stats()["table_counts"]["bugs"] == 1
+        assert reopened.select("bugs", id="bug_1")[0]["severity"] == "major"
+        reopened.close()
+
+
+class TestMockDatabaseOverwrite:
+    """Insert đè id đã tồn tại thay thế record, kể cả trong indexes"""
+    
+    def test_overwrite_insert_updates_field_index(self):
+        from src.mocks.mock_database import MockDatabase
+        
+        db = MockDatabase()
+        db.insert("features", {"id": "f1", "status": "open"})
+        assert _ids(db.select("features", where={"status": "open"})) == ["f1"]
+        
+        db.insert("features", {"id": "f1", "status": "closed"})
+        assert db.select("features", where={"status": "open"}) == []
+        assert _ids(db.select("features", where={"status": "closed"})) == ["f1"]
+    
+    def test_overwrite_insert_replaces_relationship(self):
+        from src.mocks.mock_database import MockDatabase
+        
+        db = MockDatabase()
+        db.insert("features", {"id": "f1", "name": "Auth"})
+        db.insert("features", {"id": "f2", "name": "Export"})
+        relationship = {"id": "r1", "source_entity_id": "f1", "source_entity_type": "features",
+                        "target_entity_id": "f2", "target_entity_type": "features"}
+        db.insert("relationships", dict(relationship))
+        db.insert("relationships", dict(relationship))
+        assert _related(db, "f1") == [("r1", "f2")]
+        
+        db.delete("relationships", "r1")
+        assert db.get_related_records("f1") == []
+        assert db.get_related_records("f2") == []